@@ -168,6 +168,8 @@ async def ingest_markdown_files(directory: Path, category: str = "khan_academy")
         successful_files += 1
         print(f"  ✅ Added {len(chunks)} chunks")
 
+    # Refresh planner statistics for the new rows
+    await vector_store.analyze()
     await vector_store.close()
 
     print("\n" + "=" * 70)
@@ -355,6 +355,9 @@ async def main():
         # Show progress
         print(f"\n📊 Progress: {i}/{len(all_pdfs)} PDFs, {total_chunks} total chunks ingested")
 
+    # Refresh planner statistics for the new rows
+    await vector_store.analyze()
+
     # Summary
     print("\n" + "=" * 80)
     print("Ingestion Complete!")
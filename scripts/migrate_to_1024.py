@@ -52,8 +52,8 @@ async def main():
     await conn.execute("""
         CREATE INDEX IF NOT EXISTS calculus_knowledge_embedding_idx
         ON calculus_knowledge
-        USING ivfflat (embedding vector_cosine_ops)
-        WITH (lists = 100);
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64);
     """)
     print("   ✓ Vector index created")
 
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Precompile knowledge base frontmatter into a Python module.
+
+Parses the YAML frontmatter of every markdown file under knowledge_content/
+and writes the results to src/calculus_rag/knowledge_base/_metadata_cache.py,
+keyed by the exact frontmatter text. At runtime extract_metadata() looks the
+text up there before parsing, so the bundled corpus loads without YAML.
+Entries for edited files simply stop matching; rerun this script after
+changing frontmatter to restore the fast path.
+
+Usage:
+    python scripts/precompile_metadata.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from calculus_rag.knowledge_base._metadata_cache import PRECOMPILED_FRONTMATTER
+from calculus_rag.knowledge_base.metadata import extract_metadata, split_frontmatter
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONTENT_DIR = PROJECT_ROOT / "knowledge_content"
+OUTPUT_FILE = PROJECT_ROOT / "src" / "calculus_rag" / "knowledge_base" / "_metadata_cache.py"
+
+HEADER = '''"""
+Precompiled knowledge base frontmatter.
+
+Generated by scripts/precompile_metadata.py - do not edit by hand.
+"""
+
+from typing import Any
+
+'''
+
+LITERAL_TYPES = (str, int, float, bool, type(None))
+
+
+def is_literal(value: object) -> bool:
+    """Whether value round-trips through repr() without extra imports."""
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and is_literal(v) for k, v in value.items())
+    if isinstance(value, list):
+        return all(is_literal(item) for item in value)
+    return isinstance(value, LITERAL_TYPES)
+
+
+def main() -> None:
+    """Parse all frontmatter and write the cache module."""
+    # Parse from scratch rather than echoing the previously generated table
+    PRECOMPILED_FRONTMATTER.clear()
+
+    entries: dict[str, dict] = {}
+    skipped = 0
+    for md_file in sorted(CONTENT_DIR.rglob("*.md")):
+        content = md_file.read_text(encoding="utf-8")
+        frontmatter_str, _ = split_frontmatter(content)
+        if frontmatter_str is None:
+            continue
+        try:
+            metadata, _ = extract_metadata(content)
+        except ValueError as e:
+            print(f"⚠️  Skipping {md_file.relative_to(PROJECT_ROOT)}: {e}")
+            skipped += 1
+            continue
+        if not isinstance(metadata, dict) or not is_literal(metadata):
+            skipped += 1
+            continue
+        entries[frontmatter_str] = metadata
+
+    lines = [HEADER + "PRECOMPILED_FRONTMATTER: dict[str, dict[str, Any]] = {"]
+    lines += [f"    {text!r}: {metadata!r}," for text, metadata in entries.items()]
+    lines.append("}\n")
+    OUTPUT_FILE.write_text("\n".join(lines))
+    print(f"✅ Precompiled {len(entries)} frontmatter blocks ({skipped} skipped)")
+    print(f"   → {OUTPUT_FILE.relative_to(PROJECT_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
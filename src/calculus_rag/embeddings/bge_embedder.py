@@ -4,10 +4,61 @@ BGE (BAAI General Embedding) embedder implementation.
 Uses the sentence-transformers library to generate embeddings with BGE models.
 """
 
+from typing import Any
+
 from sentence_transformers import SentenceTransformer
 
 from calculus_rag.embeddings.base import BaseEmbedder
 
+_SUPPORTED_DTYPES = ("float32", "float16", "bfloat16")
+
+
+def _cpu_has_native_bf16() -> bool:
+    """Return True if the CPU has bfloat16 matmul instructions (AVX512-BF16 or AMX)."""
+    import torch
+
+    # CPU bfloat16 matmuls go through oneDNN; without it they are emulated
+    if not torch.backends.mkldnn.is_available():
+        return False
+
+    # torch has no public bfloat16 probe yet; use what its cpuinfo reports when present
+    has_avx512_bf16 = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+    has_amx = getattr(torch.cpu, "_is_amx_tile_supported", None)
+    if has_avx512_bf16 is not None and has_amx is not None:
+        return bool(has_avx512_bf16() or has_amx())
+
+    # Otherwise read the kernel's CPU flags (Linux); elsewhere assume no support
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("flags"):
+                    flags = line.partition(":")[2].split()
+                    return "avx512_bf16" in flags or "amx_bf16" in flags
+    except OSError:
+        pass
+    return False
+
+
+def _device_supports_dtype(device: str, dtype: str) -> bool:
+    """Return True if ``device`` runs ``dtype`` natively; False if unsure."""
+    try:
+        import torch
+
+        if device.startswith("cuda"):
+            return dtype == "float16" or torch.cuda.is_bf16_supported()
+        if device.startswith("mps"):
+            # bfloat16 needs macOS 14+; allocating a tensor is the only reliable probe
+            torch.zeros(1, dtype=getattr(torch, dtype), device=device)
+            return True
+        if device == "cpu":
+            # Half precision matmuls are emulated (and slow) on most CPUs, and
+            # bfloat16 only pays off with native AVX512-BF16/AMX support; plain
+            # AVX512 (e.g. Skylake-X, Cascade Lake) converts and runs slower.
+            return dtype == "bfloat16" and _cpu_has_native_bf16()
+    except Exception:
+        pass
+    return False
+
 
 class BGEEmbedder(BaseEmbedder):
     """
@@ -20,12 +71,18 @@ class BGEEmbedder(BaseEmbedder):
         - BAAI/bge-small-en-v1.5: 384 dimensions, fastest
         - BAAI/bge-base-en-v1.5: 768 dimensions, balanced
         - BAAI/bge-large-en-v1.5: 1024 dimensions, most accurate
+
+    Reduced precision ("float16"/"bfloat16") roughly halves inference cost
+    on hardware that supports it. When the device cannot run the requested
+    precision efficiently the embedder falls back to float32; the effective
+    precision is exposed as ``dtype``.
     """
 
     def __init__(
         self,
         model_name: str = "BAAI/bge-base-en-v1.5",
         device: str = "cpu",
+        dtype: str = "float32",
     ) -> None:
         """
         Initialize the BGE embedder.
@@ -33,16 +90,37 @@ class BGEEmbedder(BaseEmbedder):
         Args:
             model_name: HuggingFace model name (default: bge-base-en-v1.5).
             device: Device to run model on ("cpu", "cuda", or "mps").
+            dtype: Inference precision: "float32", "float16" or "bfloat16".
+
+        Raises:
+            ValueError: If dtype is not a supported precision.
         """
+        if dtype not in _SUPPORTED_DTYPES:
+            raise ValueError(
+                f"dtype must be one of {_SUPPORTED_DTYPES}, got {dtype!r}"
+            )
+
         self.model_name = model_name
         self.device = device
 
         # Load the model
         self._model = SentenceTransformer(model_name, device=device)
 
+        self.dtype = self._resolve_dtype(dtype)
+        if self.dtype != "float32":
+            import torch
+
+            self._model.to(getattr(torch, self.dtype))
+
         # Get dimension from model
         self._dimension = self._model.get_sentence_embedding_dimension()
 
+    def _resolve_dtype(self, dtype: str) -> str:
+        """Return the requested precision, or float32 if the device lacks it."""
+        if dtype == "float32" or _device_supports_dtype(self.device, dtype):
+            return dtype
+        return "float32"
+
     @property
     def dimension(self) -> int:
         """Return the embedding dimension."""
@@ -65,11 +143,7 @@ class BGEEmbedder(BaseEmbedder):
             raise ValueError("Cannot embed empty or whitespace-only text")
 
         # Encode returns numpy array, convert to list
-        embedding = self._model.encode(
-            text,
-            normalize_embeddings=True,  # Normalize to unit vectors
-            show_progress_bar=False,
-        )
+        embedding = self._encode(text)
 
         return embedding.tolist()
 
@@ -96,15 +170,30 @@ class BGEEmbedder(BaseEmbedder):
             raise ValueError("Cannot embed empty or whitespace-only text")
 
         # Batch encode
+        embeddings = self._encode(texts, batch_size=32)  # Reasonable batch size
+
+        # Convert from numpy array to list of lists
+        return [emb.tolist() for emb in embeddings]
+
+    def _encode(self, inputs: str | list[str], **kwargs: Any) -> Any:
+        """Encode to a float32 numpy array of unit-length embeddings."""
+        if self.dtype == "float32":
+            return self._model.encode(
+                inputs,
+                normalize_embeddings=True,  # Normalize to unit vectors
+                show_progress_bar=False,
+                **kwargs,
+            )
+
+        # numpy has no bfloat16, so upcast on the torch side before converting
         embeddings = self._model.encode(
-            texts,
+            inputs,
             normalize_embeddings=True,
             show_progress_bar=False,
-            batch_size=32,  # Reasonable batch size
+            convert_to_tensor=True,
+            **kwargs,
         )
-
-        # Convert from numpy array to list of lists
-        return [emb.tolist() for emb in embeddings]
+        return embeddings.float().cpu().numpy()
 
     def __repr__(self) -> str:
         return f"BGEEmbedder(model={self.model_name}, device={self.device}, dimension={self.dimension})"
@@ -0,0 +1,54 @@
+"""
+Precompiled knowledge base frontmatter.
+
+Generated by scripts/precompile_metadata.py - do not edit by hand.
+"""
+
+from typing import Any
+
+PRECOMPILED_FRONTMATTER: dict[str, dict[str, Any]] = {
+    'topic: precalculus.khan_academy\ntitle: "2003 AIME II problem 8 | AIME | Math for fun and glory | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=ZFN63oTeYzc\nvideo_id: ZFN63oTeYzc\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': '2003 AIME II problem 8 | AIME | Math for fun and glory | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=ZFN63oTeYzc', 'video_id': 'ZFN63oTeYzc', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Basic complex analysis | Imaginary and complex numbers | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=FwuPXchH2rA\nvideo_id: FwuPXchH2rA\ndifficulty: 1\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Basic complex analysis | Imaginary and complex numbers | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=FwuPXchH2rA', 'video_id': 'FwuPXchH2rA', 'difficulty': 1, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Benford\'s law explanation (sequel to mysteries of Benford\'s law) | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=SZUDoEdjTzg\nvideo_id: SZUDoEdjTzg\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': "Benford's law explanation (sequel to mysteries of Benford's law) | Algebra II | Khan Academy", 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=SZUDoEdjTzg', 'video_id': 'SZUDoEdjTzg', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Binomial Theorem (part 1)"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=Cv4YhIMfbeM\nvideo_id: Cv4YhIMfbeM\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Binomial Theorem (part 1)', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=Cv4YhIMfbeM', 'video_id': 'Cv4YhIMfbeM', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Binomial Theorem (part 2)"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=-fFWWt1m9k0\nvideo_id: -fFWWt1m9k0\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Binomial Theorem (part 2)', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=-fFWWt1m9k0', 'video_id': '-fFWWt1m9k0', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Binomial theorem combinatorics connection | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=xF_hJaXUNfE\nvideo_id: xF_hJaXUNfE\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Binomial theorem combinatorics connection | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=xF_hJaXUNfE', 'video_id': 'xF_hJaXUNfE', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Combinations"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=bCxMhncR7PU\nvideo_id: bCxMhncR7PU\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Combinations', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=bCxMhncR7PU', 'video_id': 'bCxMhncR7PU', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Complex conjugates | Imaginary and complex numbers | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=BZxZ_eEuJBM\nvideo_id: BZxZ_eEuJBM\ndifficulty: 4\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Complex conjugates | Imaginary and complex numbers | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=BZxZ_eEuJBM', 'video_id': 'BZxZ_eEuJBM', 'difficulty': 4, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Complex determinant example | Imaginary and complex numbers | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=E7OkUomRq1Q\nvideo_id: E7OkUomRq1Q\ndifficulty: 4\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Complex determinant example | Imaginary and complex numbers | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=E7OkUomRq1Q', 'video_id': 'E7OkUomRq1Q', 'difficulty': 4, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Compound interest and e (part 2) | Exponential and logarithmic functions | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=dzMvqJMLy9c\nvideo_id: dzMvqJMLy9c\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Compound interest and e (part 2) | Exponential and logarithmic functions | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=dzMvqJMLy9c', 'video_id': 'dzMvqJMLy9c', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Compound interest and e (part 3) | Exponential and logarithmic functions | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=sQYpUJV8foY\nvideo_id: sQYpUJV8foY\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Compound interest and e (part 3) | Exponential and logarithmic functions | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=sQYpUJV8foY', 'video_id': 'sQYpUJV8foY', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Compound interest and e (part 4) | Exponential and logarithmic functions | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=VAxHMTJRhmY\nvideo_id: VAxHMTJRhmY\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Compound interest and e (part 4) | Exponential and logarithmic functions | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=VAxHMTJRhmY', 'video_id': 'VAxHMTJRhmY', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Exponential Growth"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=JWfTckls59k\nvideo_id: JWfTckls59k\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Exponential Growth', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=JWfTckls59k', 'video_id': 'JWfTckls59k', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Exponential form to find complex roots | Imaginary and complex numbers | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=N0Y8ia57C24\nvideo_id: N0Y8ia57C24\ndifficulty: 4\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Exponential form to find complex roots | Imaginary and complex numbers | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=N0Y8ia57C24', 'video_id': 'N0Y8ia57C24', 'difficulty': 4, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Function inverse example 1 | Functions and their graphs | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=wSiamij_i_k\nvideo_id: wSiamij_i_k\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Function inverse example 1 | Functions and their graphs | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=wSiamij_i_k', 'video_id': 'wSiamij_i_k', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Function inverses example 2 | Functions and their graphs | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=aeyFb2eVH1c\nvideo_id: aeyFb2eVH1c\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Function inverses example 2 | Functions and their graphs | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=aeyFb2eVH1c', 'video_id': 'aeyFb2eVH1c', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Function inverses example 3 | Functions and their graphs | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=Bq9cq9FZuNM\nvideo_id: Bq9cq9FZuNM\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Function inverses example 3 | Functions and their graphs | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=Bq9cq9FZuNM', 'video_id': 'Bq9cq9FZuNM', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Interest (part 2) | Interest and debt | Finance & Capital Markets | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=t4zfiBw0hwM\nvideo_id: t4zfiBw0hwM\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Interest (part 2) | Interest and debt | Finance & Capital Markets | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=t4zfiBw0hwM', 'video_id': 't4zfiBw0hwM', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Introduction to compound interest and e | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=qEB6y4DklNY\nvideo_id: qEB6y4DklNY\ndifficulty: 1\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Introduction to compound interest and e | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=qEB6y4DklNY', 'video_id': 'qEB6y4DklNY', 'difficulty': 1, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Introduction to function inverses | Functions and their graphs | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=W84lObmOp8M\nvideo_id: W84lObmOp8M\ndifficulty: 1\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Introduction to function inverses | Functions and their graphs | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=W84lObmOp8M', 'video_id': 'W84lObmOp8M', 'difficulty': 1, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Introduction to interest | Interest and debt | Finance & Capital Markets | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=GtaoP0skPWc\nvideo_id: GtaoP0skPWc\ndifficulty: 1\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Introduction to interest | Interest and debt | Finance & Capital Markets | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=GtaoP0skPWc', 'video_id': 'GtaoP0skPWc', 'difficulty': 1, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Introduction to limits 2 | Limits | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=W0VWO4asgmk\nvideo_id: W0VWO4asgmk\ndifficulty: 1\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Introduction to limits 2 | Limits | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=W0VWO4asgmk', 'video_id': 'W0VWO4asgmk', 'difficulty': 1, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Introduction to limits | Limits | Differential Calculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=riXcZT2ICjA\nvideo_id: riXcZT2ICjA\ndifficulty: 1\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Introduction to limits | Limits | Differential Calculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=riXcZT2ICjA', 'video_id': 'riXcZT2ICjA', 'difficulty': 1, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Limit examples (part 1) | Limits | Differential Calculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=GGQngIp0YGI\nvideo_id: GGQngIp0YGI\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Limit examples (part 1) | Limits | Differential Calculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=GGQngIp0YGI', 'video_id': 'GGQngIp0YGI', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Limit examples (part 2) | Limits | Differential Calculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=YRw8udexH4o\nvideo_id: YRw8udexH4o\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Limit examples (part 2) | Limits | Differential Calculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=YRw8udexH4o', 'video_id': 'YRw8udexH4o', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Limit examples (part 3) | Limits | Differential Calculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=gWSDDopD9sk\nvideo_id: gWSDDopD9sk\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Limit examples (part 3) | Limits | Differential Calculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=gWSDDopD9sk', 'video_id': 'gWSDDopD9sk', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Limit examples w/ brain malfunction on first prob (part 4) | Differential Calculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=xjkSE9cPqzo\nvideo_id: xjkSE9cPqzo\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Limit examples w/ brain malfunction on first prob (part 4) | Differential Calculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=xjkSE9cPqzo', 'video_id': 'xjkSE9cPqzo', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Logarithmic scale | Logarithms | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=sBhEi4L91Sg\nvideo_id: sBhEi4L91Sg\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Logarithmic scale | Logarithms | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=sBhEi4L91Sg', 'video_id': 'sBhEi4L91Sg', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "More limits | Limits | Differential Calculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=rkeU8_4nzKo\nvideo_id: rkeU8_4nzKo\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'More limits | Limits | Differential Calculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=rkeU8_4nzKo', 'video_id': 'rkeU8_4nzKo', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Parametric equations 1 | Parametric equations and polar coordinates | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=m6c6dlmUT1c\nvideo_id: m6c6dlmUT1c\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Parametric equations 1 | Parametric equations and polar coordinates | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=m6c6dlmUT1c', 'video_id': 'm6c6dlmUT1c', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Parametric equations 2 | Parametric equations and polar coordinates | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=wToSIQJ2o_8\nvideo_id: wToSIQJ2o_8\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Parametric equations 2 | Parametric equations and polar coordinates | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=wToSIQJ2o_8', 'video_id': 'wToSIQJ2o_8', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Parametric equations 3 | Parametric equations and polar coordinates | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=57BiI_iD3-U\nvideo_id: 57BiI_iD3-U\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Parametric equations 3 | Parametric equations and polar coordinates | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=57BiI_iD3-U', 'video_id': '57BiI_iD3-U', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Parametric equations 4 | Parametric equations and polar coordinates | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=IReD6c_njOY\nvideo_id: IReD6c_njOY\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Parametric equations 4 | Parametric equations and polar coordinates | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=IReD6c_njOY', 'video_id': 'IReD6c_njOY', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Permutations"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=XqQTXW7XfYA\nvideo_id: XqQTXW7XfYA\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Permutations', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=XqQTXW7XfYA', 'video_id': 'XqQTXW7XfYA', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Polar coordinates 1 | Parametric equations and polar coordinates | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=jexMSlSDubM\nvideo_id: jexMSlSDubM\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Polar coordinates 1 | Parametric equations and polar coordinates | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=jexMSlSDubM', 'video_id': 'jexMSlSDubM', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Polar coordinates 2 | Parametric equations and polar coordinates | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=zGpbSGj_vfE\nvideo_id: zGpbSGj_vfE\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Polar coordinates 2 | Parametric equations and polar coordinates | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=zGpbSGj_vfE', 'video_id': 'zGpbSGj_vfE', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Polar coordinates 3 | Parametric equations and polar coordinates | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=9iqN12hCn10\nvideo_id: 9iqN12hCn10\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Polar coordinates 3 | Parametric equations and polar coordinates | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=9iqN12hCn10', 'video_id': '9iqN12hCn10', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Proof: lim (sin x)/x | Limits | Differential Calculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=Ve99biD1KtA\nvideo_id: Ve99biD1KtA\ndifficulty: 4\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Proof: lim (sin x)/x | Limits | Differential Calculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=Ve99biD1KtA', 'video_id': 'Ve99biD1KtA', 'difficulty': 4, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Sequences and Series (part 1)"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=VgVJrSJxkDk\nvideo_id: VgVJrSJxkDk\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Sequences and Series (part 1)', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=VgVJrSJxkDk', 'video_id': 'VgVJrSJxkDk', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Sequences and series (part 2)"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=U_8GRLJplZg\nvideo_id: U_8GRLJplZg\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Sequences and series (part 2)', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=U_8GRLJplZg', 'video_id': 'U_8GRLJplZg', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Series sum example | Sequences, series and induction | Precalculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=A6fbDssPeac\nvideo_id: A6fbDssPeac\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Series sum example | Sequences, series and induction | Precalculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=A6fbDssPeac', 'video_id': 'A6fbDssPeac', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Squeeze theorem (sandwich theorem) | Limits | Differential Calculus | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=igJdDN-DPgA\nvideo_id: igJdDN-DPgA\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Squeeze theorem (sandwich theorem) | Limits | Differential Calculus | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=igJdDN-DPgA', 'video_id': 'igJdDN-DPgA', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Vi and Sal explore how we think about scale | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=4xfOq00BzJA\nvideo_id: 4xfOq00BzJA\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': 'Vi and Sal explore how we think about scale | Algebra II | Khan Academy', 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=4xfOq00BzJA', 'video_id': '4xfOq00BzJA', 'difficulty': 2, 'content_type': 'video_summary'},
+    'topic: precalculus.khan_academy\ntitle: "Vi and Sal talk about the mysteries of Benford\'s law | Logarithms | Algebra II | Khan Academy"\nsource: Khan Academy\nsource_url: https://www.youtube.com/watch?v=6KmeGpjeLZ0\nvideo_id: 6KmeGpjeLZ0\ndifficulty: 2\ncontent_type: video_summary': {'topic': 'precalculus.khan_academy', 'title': "Vi and Sal talk about the mysteries of Benford's law | Logarithms | Algebra II | Khan Academy", 'source': 'Khan Academy', 'source_url': 'https://www.youtube.com/watch?v=6KmeGpjeLZ0', 'video_id': '6KmeGpjeLZ0', 'difficulty': 2, 'content_type': 'video_summary'},
+}
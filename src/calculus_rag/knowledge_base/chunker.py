@@ -10,6 +10,10 @@ from typing import Pattern
 
 from calculus_rag.knowledge_base.models import Chunk, Document
 
+# LaTeX delimiters, compiled once for every document chunked
+_DISPLAY_LATEX = re.compile(r"\$\$.*?\$\$", re.DOTALL)
+_INLINE_LATEX = re.compile(r"\$[^\$]+?\$")
+
 
 class DocumentChunker:
     """
@@ -147,7 +151,7 @@ class DocumentChunker:
             counter += 1
             return placeholder
 
-        text = re.sub(r"\$\$.*?\$\$", replace_display, text, flags=re.DOTALL)
+        text = _DISPLAY_LATEX.sub(replace_display, text)
 
         # Protect inline math ($...$)
         def replace_inline(match: re.Match[str]) -> str:
@@ -157,7 +161,7 @@ class DocumentChunker:
             counter += 1
             return placeholder
 
-        text = re.sub(r"\$[^\$]+?\$", replace_inline, text)
+        text = _INLINE_LATEX.sub(replace_inline, text)
 
         return text, latex_map
 
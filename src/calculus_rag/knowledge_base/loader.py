@@ -5,6 +5,7 @@ This module handles loading markdown files from the filesystem and
 converting them into Document objects.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from calculus_rag.knowledge_base.metadata import (
@@ -54,6 +55,21 @@ class DocumentLoader:
         # Read file content
         content = path.read_text(encoding="utf-8")
 
+        return self._document_from_content(file_path, content)
+
+    def _document_from_content(self, file_path: str, content: str) -> Document:
+        """
+        Build a Document from the already-read content of a markdown file.
+
+        Args:
+            file_path: Path the content was read from.
+            content: The full file content.
+
+        Returns:
+            Document: The loaded document.
+        """
+        path = Path(file_path)
+
         # Extract frontmatter and body
         frontmatter, body = extract_metadata(content)
 
@@ -105,15 +121,19 @@ class DocumentLoader:
         else:
             md_files = path.glob("*.md")
 
-        # Load each file
+        # Read files concurrently (file I/O releases the GIL), then parse them
+        # in order so results stay sorted and deterministic
+        md_files = sorted(md_files)
         documents = []
-        for md_file in sorted(md_files):
-            try:
-                doc = self.load_file(str(md_file))
-                documents.append(doc)
-            except Exception as e:
-                # Log error but continue loading other files
-                print(f"Warning: Failed to load {md_file}: {e}")
-                continue
+        with ThreadPoolExecutor() as pool:
+            reads = [pool.submit(md_file.read_text, encoding="utf-8") for md_file in md_files]
+            for md_file, read in zip(md_files, reads):
+                try:
+                    doc = self._document_from_content(str(md_file), read.result())
+                    documents.append(doc)
+                except Exception as e:
+                    # Log error but continue loading other files
+                    print(f"Warning: Failed to load {md_file}: {e}")
+                    continue
 
         return documents
@@ -4,15 +4,334 @@ Metadata extraction from markdown files with YAML frontmatter.
 This module handles parsing YAML frontmatter and inferring metadata from file paths.
 """
 
+import importlib
+import os
 import re
-from pathlib import Path
+from functools import lru_cache
 from typing import Any
 
-import yaml
-from pydantic import ValidationError
-
+from calculus_rag.knowledge_base._metadata_cache import PRECOMPILED_FRONTMATTER
 from calculus_rag.knowledge_base.models import DocumentMetadata
 
+# PyYAML is only needed for frontmatter that neither the precompiled table nor
+# the fast path handles, so it is imported on first use (see _import_yaml)
+_yaml: Any = None
+_SafeLoader: Any = None
+_resolver: Any = None
+
+# Optional RapidYAML backend, opted into with CALCULUS_RAG_YAML=ryml. It only
+# handles the frontmatter shapes it can map exactly onto PyYAML's results;
+# everything else still goes through PyYAML.
+_ryml: Any = None
+if os.environ.get("CALCULUS_RAG_YAML") == "ryml":
+    try:
+        _ryml = importlib.import_module("ryml")
+    except ImportError:  # rapidyaml not installed; keep using PyYAML
+        pass
+
+# Tags from PyYAML's implicit scalar resolution, used to type ryml plain scalars
+_STR_TAG = "tag:yaml.org,2002:str"
+_NULL_TAG = "tag:yaml.org,2002:null"
+_RESERVED_INDICATORS = frozenset("@`")
+
+# YAML frontmatter: --- at start, the YAML block, then a closing ---
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+# Path handling for infer_topic_from_path
+_SEP_TABLE = str.maketrans("\\", "/")
+_TOPIC_PREFIXES = frozenset({"knowledge_content", "calculus", "pre_calculus"})
+
+# Restricted grammar for the fast frontmatter path: word keys and values made of
+# words, dots, slashes, hyphens and single spaces that YAML reads as plain strings
+_FAST_KEY_RE = re.compile(r"([A-Za-z_]\w*):(?: (.*))?")
+_FAST_STR_RE = re.compile(r"[A-Za-z_][\w./-]*(?: [\w./-]+)*")
+_FAST_INT_RE = re.compile(r"0|[1-9][0-9]*")
+# Single-line quoted strings without escapes, and the http(s) URLs used as
+# source links, are read verbatim
+_FAST_QUOTED_RE = re.compile(r'"([^"\\]*)"' r"|'([^']*)'")
+_FAST_URL_RE = re.compile(r"https?://[\w.~%/?#&=+-]+")
+# ID-like tokens such as video IDs ("4xfOq00BzJA", "-fFWWt1m9k0"), which are
+# plain strings unless they match YAML 1.1's int or date forms
+_FAST_TOKEN_RE = re.compile(r"-?\w[\w-]*")
+_YAML_INT_OR_DATE_RE = re.compile(
+    r"[-+]?(?:0b[0-1_]+|0[0-7_]+|[0-9][0-9_]*|0x[0-9a-fA-F_]+)|[0-9]{4}-[0-9]{2}-[0-9]{2}"
+)
+# Anything but "\n" and printable characters: tabs, "\r", control characters
+# and the extra line breaks YAML recognizes (NEL, LS, PS) are left to YAML
+_FAST_UNSAFE_RE = re.compile(
+    r"[^\n\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+# Plain words PyYAML resolves to booleans or null rather than strings
+_YAML_SPECIAL_WORDS = frozenset({"null", "true", "false", "yes", "no", "on", "off"})
+
+# Sentinel distinguishing "not fast-path syntax" from a legitimate None value
+_NOT_FAST = object()
+
+
+def _import_yaml() -> Any:
+    """Import PyYAML on first use and return the module."""
+    global _yaml, _SafeLoader, _resolver
+    if _yaml is None:
+        import yaml
+
+        # libyaml's C loader is ~20x faster than the pure-Python one on small
+        # documents; PyYAML may be built without it
+        _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _resolver = yaml.resolver.Resolver()
+        _yaml = yaml
+    return _yaml
+
+
+def _fast_scalar(value: str) -> Any:
+    """Convert a plain scalar the way YAML would, or return _NOT_FAST."""
+    if _FAST_INT_RE.fullmatch(value):
+        return int(value)
+    if value.lower() in _YAML_SPECIAL_WORDS:
+        return _NOT_FAST
+    if _FAST_STR_RE.fullmatch(value):
+        return value
+    if _FAST_TOKEN_RE.fullmatch(value) and not _YAML_INT_OR_DATE_RE.fullmatch(value):
+        return value
+    return _NOT_FAST
+
+
+def _fast_value(value: str) -> Any:
+    """Convert a fast-path frontmatter value (quoted, URL or plain scalar)."""
+    match = _FAST_QUOTED_RE.fullmatch(value)
+    if match is not None:
+        double, single = match.groups()
+        return single if double is None else double
+    if _FAST_URL_RE.fullmatch(value):
+        return value
+    return _fast_scalar(value)
+
+
+def _fast_frontmatter(frontmatter_str: str) -> dict[str, Any] | None:
+    """
+    Parse the common frontmatter shape without going through YAML.
+
+    Handles ``key: scalar``, ``key: []`` and ``key:`` followed by ``- item``
+    lines, where scalars are non-negative integers, plain strings, http(s)
+    URLs or quoted strings without escapes (the shapes the bundled corpus
+    uses). Anything else (escapes, flow collections, block scalars, anchors,
+    comments, nested mappings, YAML booleans/null...) returns None so the
+    caller can fall back to the full YAML parser.
+    """
+    result: dict[str, Any] = {}
+    list_key: str | None = None  # key whose value may continue as "- item" lines
+    list_indent: str | None = None
+
+    if _FAST_UNSAFE_RE.search(frontmatter_str):
+        return None
+
+    for raw_line in frontmatter_str.split("\n"):
+        # Only spaces: YAML keeps other trailing whitespace (e.g. NBSP) in the value
+        line = raw_line.rstrip(" ")
+        if not line:
+            continue
+
+        if line[0] == " " or line[0] == "-":
+            # Block sequence item, only valid directly under an empty key
+            indent, dash, item = line.partition("- ")
+            if list_key is None or not dash or indent.strip(" "):
+                return None
+            if list_indent is None:
+                list_indent = indent
+            elif indent != list_indent:
+                return None
+            value = _fast_value(item)
+            if value is _NOT_FAST:
+                return None
+            if result[list_key] is None:
+                result[list_key] = []
+            result[list_key].append(value)
+            continue
+
+        match = _FAST_KEY_RE.fullmatch(line)
+        if match is None:
+            return None
+        key, value_str = match.groups()
+        if key.lower() in _YAML_SPECIAL_WORDS:
+            return None
+
+        list_indent = None
+        if not value_str:
+            result[key] = None
+            list_key = key
+            continue
+        list_key = None
+
+        if value_str == "[]":
+            result[key] = []
+            continue
+        value = _fast_value(value_str)
+        if value is _NOT_FAST:
+            return None
+        result[key] = value
+
+    return result
+
+
+def _resolve_plain(text: str | None) -> Any:
+    """Type a plain scalar as PyYAML would, or return _NOT_FAST if unsure."""
+    if not text:
+        return None
+    if text[0] in _RESERVED_INDICATORS:
+        # ryml accepts these as plain scalars; PyYAML rejects them
+        return _NOT_FAST
+    value = _fast_scalar(text)
+    if value is not _NOT_FAST:
+        return value
+    yaml = _import_yaml()
+    tag = _resolver.resolve(yaml.ScalarNode, text, (True, False))
+    if tag == _STR_TAG:
+        return text
+    if tag == _NULL_TAG:
+        return None
+    # Booleans, floats, timestamps and non-decimal ints are left to PyYAML
+    return _NOT_FAST
+
+
+def _ryml_text(view: Any) -> str | None:
+    """Decode a ryml scalar view (None for an empty scalar)."""
+    return None if view is None else bytes(view).decode("utf-8")
+
+
+def _ryml_scalar(text: str | None, node_type: int, quoted: int, plain: int) -> Any:
+    """Convert a ryml key or value given its style bits, or return _NOT_FAST."""
+    if node_type & quoted:
+        return text or ""
+    if node_type & plain:
+        return _resolve_plain(text)
+    # Literal and folded block scalars
+    return _NOT_FAST
+
+
+def _ryml_frontmatter(frontmatter_str: str) -> dict[str, Any] | None:
+    """
+    Parse frontmatter with RapidYAML, restricted to what maps exactly onto PyYAML.
+
+    Supports a top-level mapping of scalar keys to plain or quoted scalars
+    and to block or flow sequences of such scalars. Returns None for anything
+    else, including parse errors, so PyYAML parses (or reports) it instead.
+    Each call into ryml crosses the SWIG boundary, so nodes are classified
+    from a single ``Tree.type()`` bitmask rather than the ``is_*`` helpers.
+    """
+    if "\t" in frontmatter_str:
+        # PyYAML rejects tabs in places ryml tolerates
+        return None
+    try:
+        tree = _ryml.parse_in_arena(frontmatter_str.encode("utf-8"))
+    except Exception:  # ryml raises SWIG-wrapped C++ exceptions
+        return None
+
+    ryml = _ryml
+    key_odd = ryml.KEYANCH | ryml.KEYTAG | ryml.KEYREF
+    val_odd = ryml.VALANCH | ryml.VALTAG | ryml.VALREF
+    key_quoted, key_plain = ryml.KEY_SQUO | ryml.KEY_DQUO, ryml.KEY_PLAIN
+    val_quoted, val_plain = ryml.VAL_SQUO | ryml.VAL_DQUO, ryml.VAL_PLAIN
+    none = ryml.NONE
+
+    root = tree.root_id()
+    root_type = tree.type(root)
+    if not root_type & ryml.MAP or root_type & val_odd:
+        return None
+
+    result: dict[str, Any] = {}
+    node = tree.first_child(root)
+    while node != none:
+        node_type = tree.type(node)
+        if node_type & (key_odd | val_odd | ryml.MAP):
+            return None
+        key = _ryml_scalar(_ryml_text(tree.key(node)), node_type, key_quoted, key_plain)
+        if not isinstance(key, str):
+            return None
+
+        if node_type & ryml.SEQ:
+            items = []
+            item = tree.first_child(node)
+            while item != none:
+                item_type = tree.type(item)
+                if item_type & (val_odd | ryml.SEQ | ryml.MAP):
+                    return None
+                value = _ryml_scalar(_ryml_text(tree.val(item)), item_type, val_quoted, val_plain)
+                if value is _NOT_FAST:
+                    return None
+                items.append(value)
+                item = tree.next_sibling(item)
+            result[key] = items
+        else:
+            value = _ryml_scalar(_ryml_text(tree.val(node)), node_type, val_quoted, val_plain)
+            if value is _NOT_FAST:
+                return None
+            result[key] = value
+        node = tree.next_sibling(node)
+
+    return result
+
+
+@lru_cache(maxsize=2048)
+def _load_frontmatter(frontmatter_str: str) -> Any:
+    """
+    Parse a frontmatter block, memoized on its exact text.
+
+    Reloading a knowledge base re-parses identical frontmatter; the cache
+    turns those repeats into a dict lookup. Hit/miss counts are available
+    via ``_load_frontmatter.cache_info()``. The returned object is shared
+    between callers, so it must be copied before being handed out.
+
+    Raises:
+        ValueError: If the YAML is malformed (errors are not cached).
+    """
+    # Frontmatter of the bundled corpus, parsed ahead of time by
+    # scripts/precompile_metadata.py; keyed by exact text so it cannot go stale
+    metadata = PRECOMPILED_FRONTMATTER.get(frontmatter_str)
+    if metadata is not None:
+        return metadata
+
+    metadata = _fast_frontmatter(frontmatter_str)
+    if metadata is not None:
+        return metadata
+
+    if _ryml is not None:
+        metadata = _ryml_frontmatter(frontmatter_str)
+        if metadata is not None:
+            return metadata
+
+    yaml = _import_yaml()
+    try:
+        metadata = yaml.load(frontmatter_str, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML frontmatter: {e}") from e
+    return {} if metadata is None else metadata
+
+
+def _copy_frontmatter(value: Any) -> Any:
+    """Copy the containers of a parsed frontmatter value; scalars are immutable."""
+    if isinstance(value, dict):
+        return {key: _copy_frontmatter(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_frontmatter(item) for item in value]
+    return value
+
+
+def split_frontmatter(content: str) -> tuple[str | None, str]:
+    """
+    Split markdown content into its raw frontmatter block and body.
+
+    Args:
+        content: The full markdown content.
+
+    Returns:
+        tuple: (frontmatter_str, body_content); frontmatter_str is None when
+            the content has no frontmatter, in which case the body is the
+            whole content.
+    """
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
+        return None, content
+    return match.group(1), content[match.end() :]
+
 
 def extract_metadata(content: str) -> tuple[dict[str, Any], str]:
     """
@@ -29,24 +348,15 @@ def extract_metadata(content: str) -> tuple[dict[str, Any], str]:
     Raises:
         ValueError: If YAML frontmatter is malformed.
     """
-    # Pattern to match YAML frontmatter: --- at start, then ---, then content
-    pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-    match = re.match(pattern, content, re.DOTALL)
+    frontmatter_str, body = split_frontmatter(content)
 
-    if not match:
+    if frontmatter_str is None:
         # No frontmatter found
         return {}, content
 
-    frontmatter_str = match.group(1)
-    body = match.group(2)
-
-    try:
-        metadata = yaml.safe_load(frontmatter_str)
-        if metadata is None:
-            metadata = {}
-        return metadata, body
-    except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML frontmatter: {e}") from e
+    # Callers (e.g. DocumentLoader) add keys to the dict, so never expose the
+    # cached instance itself
+    return _copy_frontmatter(_load_frontmatter(frontmatter_str)), body
 
 
 def infer_topic_from_path(file_path: str) -> str:
@@ -69,22 +379,27 @@ def infer_topic_from_path(file_path: str) -> str:
         'algebra.factoring'
     """
     # Normalize path separators (handle Windows paths)
-    normalized = file_path.replace("\\", "/")
-    path = Path(normalized)
+    normalized = file_path.translate(_SEP_TABLE)
+
+    # Remove the extension (like Path.with_suffix(""), dotfiles keep their name)
+    head, _, name = normalized.rpartition("/")
+    stem, _, suffix = name.rpartition(".")
+    if stem and suffix:
+        normalized = f"{head}/{stem}" if head else stem
 
-    # Get parts, removing extension
-    parts = list(path.with_suffix("").parts)
+    # Split into parts, dropping empty and "." segments
+    parts = [part for part in normalized.split("/") if part and part != "."]
 
     # Remove common prefixes
-    prefixes_to_remove = ["knowledge_content", "calculus", "pre_calculus"]
-    while parts and parts[0] in prefixes_to_remove:
-        parts.pop(0)
+    start = 0
+    while start < len(parts) and parts[start] in _TOPIC_PREFIXES:
+        start += 1
 
     # Join with dots
-    if not parts:
+    if start == len(parts):
         return "unknown"
 
-    return ".".join(parts)
+    return ".".join(parts[start:])
 
 
 def create_document_metadata(
@@ -137,5 +452,5 @@ def create_document_metadata(
             source_file=source_file,
             tags=tags,
         )
-    except ValidationError as e:
+    except ValueError as e:
         raise ValueError(f"Invalid metadata: {e}") from e
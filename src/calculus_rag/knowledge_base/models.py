@@ -1,38 +1,94 @@
 """
 Data models for knowledge base documents and chunks.
 
-These models use Pydantic for validation and serialization.
+These models are slotted, frozen dataclasses: they are created for every
+document and chunk during ingestion, so validation is limited to the few
+invariants that matter and is done by hand in ``__post_init__``. Invalid
+values raise ``ValueError``.
 """
 
-import uuid
-from datetime import datetime, timezone
+import secrets
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-class DocumentMetadata(BaseModel):
+
+def _new_id() -> str:
+    """Return a random 128-bit identifier as 32 hex characters."""
+    # At least the entropy of a UUID4, at a quarter of the cost of str(uuid.uuid4())
+    return secrets.token_hex(16)
+
+
+def _validate_str_tuple(name: str, values: Any) -> tuple[str, ...]:
+    """Return values as a tuple of interned strings, ensuring every entry is a string."""
+    if isinstance(values, str):
+        raise ValueError(f"{name} must be a sequence of strings, not a string")
+    values = tuple(values)
+    if not all(isinstance(value, str) for value in values):
+        raise ValueError(f"{name} must contain only strings")
+    return tuple(sys.intern(str(value)) for value in values)
+
+
+def _validate_content(content: Any) -> None:
+    """Ensure content is a non-empty, non-whitespace string."""
+    if not isinstance(content, str) or not content.strip():
+        raise ValueError("Content cannot be empty")
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class DocumentMetadata:
     """
     Metadata for a knowledge base document.
 
     Attributes:
         topic: Dot-separated topic identifier (e.g., "limits.introduction").
         difficulty: Difficulty level from 1 (easiest) to 5 (hardest).
-        prerequisites: List of prerequisite topics.
+        prerequisites: Prerequisite topics (any sequence is stored as a tuple).
         source_file: Optional path to source file.
-        tags: Optional list of tags for categorization.
+        tags: Optional tags for categorization (stored as a tuple).
     """
 
-    topic: str = Field(..., description="Topic identifier in dot notation")
-    difficulty: int = Field(..., ge=1, le=5, description="Difficulty level (1-5)")
-    prerequisites: list[str] = Field(
-        default_factory=list,
-        description="List of prerequisite topic identifiers",
-    )
-    source_file: str | None = Field(default=None, description="Path to source file")
-    tags: list[str] = Field(default_factory=list, description="Optional tags")
-
-
-class Document(BaseModel):
+    topic: str
+    difficulty: int
+    prerequisites: tuple[str, ...] = ()
+    source_file: str | None = None
+    tags: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Validate field types and the difficulty range."""
+        if not isinstance(self.topic, str):
+            raise ValueError(f"Topic must be a string, got {type(self.topic).__name__}")
+        if (
+            isinstance(self.difficulty, bool)
+            or not isinstance(self.difficulty, int)
+            or not 1 <= self.difficulty <= 5
+        ):
+            raise ValueError(f"Difficulty must be an integer from 1 to 5, got {self.difficulty!r}")
+        if self.source_file is not None and not isinstance(self.source_file, str):
+            raise ValueError("source_file must be a string")
+
+        # Frozen dataclass: assign normalized values through object.__setattr__.
+        # Topics, prerequisites and tags repeat across thousands of documents
+        # and chunks, so they are interned to share a single string object.
+        object.__setattr__(self, "topic", sys.intern(str(self.topic)))
+        object.__setattr__(
+            self, "prerequisites", _validate_str_tuple("prerequisites", self.prerequisites)
+        )
+        object.__setattr__(self, "tags", _validate_str_tuple("tags", self.tags))
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the metadata as a plain dict."""
+        return asdict(self)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Document:
     """
     Represents a knowledge base document.
 
@@ -40,27 +96,35 @@ class Document(BaseModel):
         id: Unique identifier for the document.
         content: The full text content of the document.
         metadata: Associated metadata.
-        created_at: Timestamp when the document was created.
+        created_at_ns: Creation time in nanoseconds since the epoch; exposed
+            as a UTC datetime through ``created_at``.
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique ID")
-    content: str = Field(..., min_length=1, description="Document content")
-    metadata: DocumentMetadata = Field(..., description="Document metadata")
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="Creation timestamp",
-    )
-
-    @field_validator("content")
-    @classmethod
-    def validate_content_not_empty(cls, v: str) -> str:
+    id: str = field(default_factory=_new_id)
+    content: str
+    metadata: DocumentMetadata
+    # Stored as integer nanoseconds; the datetime is only built when accessed
+    created_at_ns: int = field(default_factory=time.time_ns)
+
+    def __post_init__(self) -> None:
         """Ensure content is not empty or whitespace-only."""
-        if not v or not v.strip():
-            raise ValueError("Content cannot be empty")
-        return v
+        _validate_content(self.content)
 
+    @property
+    def created_at(self) -> datetime:
+        """Timestamp (UTC) when the document was created."""
+        return _EPOCH + timedelta(microseconds=self.created_at_ns // 1000)
 
-class Chunk(BaseModel):
+    def model_dump(self) -> dict[str, Any]:
+        """Return the document as a plain dict (metadata included)."""
+        data = asdict(self)
+        del data["created_at_ns"]
+        data["created_at"] = self.created_at
+        return data
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Chunk:
     """
     Represents a chunk of a document for embedding and retrieval.
 
@@ -70,23 +134,63 @@ class Chunk(BaseModel):
         document_id: ID of the parent document.
         chunk_index: Position of this chunk in the document (0-indexed).
         metadata: Associated metadata (inherited from document).
-        embedding: Optional embedding vector for this chunk.
+        embedding: Optional embedding vector for this chunk, stored as a
+            contiguous float32 array (lists are converted on creation).
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique ID")
-    content: str = Field(..., min_length=1, description="Chunk content")
-    document_id: str = Field(..., description="Parent document ID")
-    chunk_index: int = Field(..., ge=0, description="Index of chunk in document")
-    metadata: DocumentMetadata = Field(..., description="Chunk metadata")
-    embedding: list[float] | None = Field(
-        default=None,
-        description="Optional embedding vector",
-    )
-
-    @field_validator("content")
-    @classmethod
-    def validate_content_not_empty(cls, v: str) -> str:
-        """Ensure content is not empty or whitespace-only."""
-        if not v or not v.strip():
-            raise ValueError("Content cannot be empty")
-        return v
+    id: str = field(default_factory=_new_id)
+    content: str
+    document_id: str
+    chunk_index: int
+    metadata: DocumentMetadata
+    # Arrays don't support == as a bool, so __eq__ below compares embeddings itself;
+    # they are also left out of the hash, which only needs to agree with __eq__
+    embedding: np.ndarray | None = field(default=None, compare=False)
+
+    def __post_init__(self) -> None:
+        """Validate content and chunk index, and store the embedding as float32."""
+        _validate_content(self.content)
+        if self.embedding is not None:
+            # No copy when already a float32 array
+            object.__setattr__(self, "embedding", np.asarray(self.embedding, dtype=np.float32))
+        if (
+            isinstance(self.chunk_index, bool)
+            or not isinstance(self.chunk_index, int)
+            or self.chunk_index < 0
+        ):
+            raise ValueError(
+                f"chunk_index must be a non-negative integer, got {self.chunk_index!r}"
+            )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare every field, embeddings by value (the generated __eq__ cannot)."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if (self.id, self.content, self.document_id, self.chunk_index, self.metadata) != (
+            other.id,
+            other.content,
+            other.document_id,
+            other.chunk_index,
+            other.metadata,
+        ):
+            return False
+        if self.embedding is None or other.embedding is None:
+            return self.embedding is other.embedding
+        return bool(np.array_equal(self.embedding, other.embedding))
+
+    def model_dump(self) -> dict[str, Any]:
+        """
+        Return the chunk as a plain dict (metadata included).
+
+        Unlike ``asdict``, this does not deep-copy the embedding: the dict holds
+        the chunk's own (read-only by convention) array. Use ``.tolist()`` or
+        orjson's ``OPT_SERIALIZE_NUMPY`` when JSON is needed.
+        """
+        return {
+            "id": self.id,
+            "content": self.content,
+            "document_id": self.document_id,
+            "chunk_index": self.chunk_index,
+            "metadata": self.metadata.model_dump(),
+            "embedding": self.embedding,
+        }
@@ -4,17 +4,22 @@ Base abstract class for LLM integrations.
 All LLM implementations should inherit from BaseLLM.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Iterator, Literal
 
-from pydantic import BaseModel, field_validator
+_ROLES = frozenset({"system", "user", "assistant"})
 
 
-class LLMMessage(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class LLMMessage:
     """
     Represents a message in the LLM conversation.
 
+    Several messages are built for every prompt, so this is a slotted
+    dataclass with a single membership check rather than a pydantic model.
+
     Attributes:
         role: The role of the message sender (system, user, or assistant).
         content: The text content of the message.
@@ -23,14 +28,12 @@ class LLMMessage(BaseModel):
     role: Literal["system", "user", "assistant"]
     content: str
 
-    @field_validator("role")
-    @classmethod
-    def validate_role(cls, v: str) -> str:
+    def __post_init__(self) -> None:
         """Validate that role is one of the allowed values."""
-        allowed = {"system", "user", "assistant"}
-        if v not in allowed:
-            raise ValueError(f"role must be one of {allowed}, got '{v}'")
-        return v
+        if self.role not in _ROLES:
+            raise ValueError(f"role must be one of {sorted(_ROLES)}, got {self.role!r}")
+        # Roles often come from decoded JSON; interning shares one object per role
+        object.__setattr__(self, "role", sys.intern(self.role))
 
 
 @dataclass
@@ -106,5 +109,29 @@ class BaseLLM(ABC):
         """
         ...
 
+    def generate_stream_bytes(
+        self,
+        messages: list[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Generate a streaming response as UTF-8 encoded chunks.
+
+        Meant for callers that forward the stream to a socket or file, which
+        would otherwise encode every chunk themselves. The default encodes the
+        output of generate_stream(); backends that receive raw bytes can
+        override it to skip the decode/encode round trip.
+
+        Args:
+            messages: List of conversation messages.
+            temperature: Sampling temperature (0-1).
+            max_tokens: Maximum tokens to generate.
+
+        Yields:
+            bytes: UTF-8 encoded chunks of the generated response.
+        """
+        yield from map(str.encode, self.generate_stream(messages, temperature, max_tokens))
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.model_name})"
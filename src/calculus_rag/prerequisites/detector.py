@@ -5,6 +5,7 @@ Analyzes student queries and completed topics to identify knowledge gaps
 and suggest learning paths.
 """
 
+from collections.abc import Set
 from dataclasses import dataclass
 
 from calculus_rag.prerequisites.graph import PrerequisiteGraph
@@ -53,6 +54,9 @@ class GapDetector:
         "algebra.factoring": ["factor", "factoring", "factorize"],
     }
 
+    # Patterns that point at the chain rule ahead of any other keyword
+    CHAIN_RULE_PATTERNS = ("sin(x^2)", "cos(x^2)", "chain", "composite", "nested")
+
     # Confusion signal phrases
     CONFUSION_SIGNALS = [
         "don't understand",
@@ -74,8 +78,14 @@ class GapDetector:
             prerequisite_graph: The prerequisite graph to use.
         """
         self.graph = prerequisite_graph
+        # Keywords flattened and lowercased once, in the order analyze_query checks them
+        self._keyword_topics = tuple(
+            (keyword.lower(), topic)
+            for topic, keywords in self.TOPIC_KEYWORDS.items()
+            for keyword in keywords
+        )
 
-    def detect_gaps(self, topic: str, completed_topics: set[str]) -> list[str]:
+    def detect_gaps(self, topic: str, completed_topics: Set[str]) -> list[str]:
         """
         Detect prerequisite gaps for a topic.
 
@@ -88,7 +98,7 @@ class GapDetector:
         """
         return self.graph.get_missing_prerequisites(topic, completed_topics)
 
-    def detect_critical_gaps(self, topic: str, completed_topics: set[str]) -> list[str]:
+    def detect_critical_gaps(self, topic: str, completed_topics: Set[str]) -> list[str]:
         """
         Detect critical gaps (foundational prerequisites).
 
@@ -126,14 +136,14 @@ class GapDetector:
         query_lower = query.lower()
 
         # Check for chain rule patterns first (more specific)
-        if any(pattern in query_lower for pattern in ["sin(x^2)", "cos(x^2)", "chain", "composite", "nested"]):
-            return "derivatives.chain_rule"
+        for pattern in self.CHAIN_RULE_PATTERNS:
+            if pattern in query_lower:
+                return "derivatives.chain_rule"
 
         # Then check for topic keywords
-        for topic, keywords in self.TOPIC_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in query_lower:
-                    return topic
+        for keyword, topic in self._keyword_topics:
+            if keyword in query_lower:
+                return topic
 
         # Fallback to general patterns
         if "limit" in query_lower:
@@ -163,7 +173,7 @@ class GapDetector:
 
         return False
 
-    def suggest_review(self, target_topic: str, completed_topics: set[str]) -> list[str]:
+    def suggest_review(self, target_topic: str, completed_topics: Set[str]) -> list[str]:
         """
         Suggest which topics to review before learning the target topic.
 
@@ -199,7 +209,7 @@ class GapDetector:
 
         return suggestions
 
-    def get_next_topic(self, target_topic: str, completed_topics: set[str]) -> str | None:
+    def get_next_topic(self, target_topic: str, completed_topics: Set[str]) -> str | None:
         """
         Get the next topic the student should learn to progress toward target.
 
@@ -221,7 +231,7 @@ class GapDetector:
         # Return first item in path (the next thing to learn)
         return path[0] if path else None
 
-    def analyze(self, query: str, completed_topics: set[str]) -> GapAnalysis:
+    def analyze(self, query: str, completed_topics: Set[str]) -> GapAnalysis:
         """
         Perform complete gap analysis for a student query.
 
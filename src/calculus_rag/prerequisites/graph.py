@@ -6,6 +6,8 @@ enabling prerequisite checking and learning path generation.
 """
 
 import json
+from collections import deque
+from collections.abc import Mapping, Set
 from typing import Any
 
 
@@ -30,6 +32,8 @@ class PrerequisiteGraph:
         """Initialize an empty prerequisite graph."""
         # topic -> list of prerequisite topics
         self._graph: dict[str, list[str]] = {}
+        # topic -> transitive prerequisites; cleared whenever a topic is added
+        self._closure_cache: dict[str, frozenset[str]] = {}
 
     def add_topic(self, topic: str, prerequisites: list[str]) -> None:
         """
@@ -48,7 +52,30 @@ class PrerequisiteGraph:
                 f"Adding {topic} with prerequisites {prerequisites} would create a cycle"
             )
 
-        self._graph[topic] = prerequisites
+        # Copied so later changes to the caller's list can't bypass the caches
+        self._graph[topic] = list(prerequisites)
+        self._closure_cache.clear()
+
+    def add_topics(self, topics: Mapping[str, list[str]]) -> None:
+        """
+        Add several topics with their prerequisites at once.
+
+        The merged graph is checked for cycles in a single pass, instead of
+        once per topic as with repeated add_topic calls. Nothing is added if
+        the check fails.
+
+        Args:
+            topics: Mapping of topic identifier -> prerequisite identifiers.
+
+        Raises:
+            CircularDependencyError: If adding these topics creates a cycle.
+        """
+        merged = {**self._graph, **{topic: list(prereqs) for topic, prereqs in topics.items()}}
+        if self._has_cycle(merged):
+            raise CircularDependencyError(f"Adding {len(topics)} topics would create a cycle")
+
+        self._graph = merged
+        self._closure_cache.clear()
 
     def get_all_topics(self) -> list[str]:
         """
@@ -69,7 +96,7 @@ class PrerequisiteGraph:
         Returns:
             list[str]: List of prerequisite topic identifiers.
         """
-        return self._graph.get(topic, [])
+        return list(self._graph.get(topic, []))
 
     def get_all_prerequisites(self, topic: str) -> list[str]:
         """
@@ -81,20 +108,43 @@ class PrerequisiteGraph:
         Returns:
             list[str]: List of all prerequisite topics (direct and indirect).
         """
-        visited = set()
-        self._collect_prerequisites(topic, visited)
-        visited.discard(topic)  # Don't include the topic itself
-        return list(visited)
-
-    def _collect_prerequisites(self, topic: str, visited: set[str]) -> None:
-        """Recursively collect all prerequisites."""
-        if topic in visited or topic not in self._graph:
-            return
-
-        visited.add(topic)
-
-        for prereq in self._graph[topic]:
-            self._collect_prerequisites(prereq, visited)
+        return list(self._prerequisite_closure(topic))
+
+    def _prerequisite_closure(self, topic: str) -> frozenset[str]:
+        """Return the transitive prerequisites of a topic, memoising every topic on the way."""
+        cache = self._closure_cache
+        # Iterative post-order walk: a topic's closure is merged from its prerequisites'
+        # cached closures, so shared (diamond) prerequisites are only resolved once
+        stack = [topic]
+        while stack:
+            current = stack[-1]
+            if current in cache:
+                stack.pop()
+                continue
+
+            pending = [
+                prereq
+                for prereq in self._graph.get(current, [])
+                if prereq in self._graph and prereq not in cache
+            ]
+            if pending:
+                stack.extend(pending)
+                continue
+
+            stack.pop()
+            cache[current] = self._merge_closure(current)
+
+        return cache[topic]
+
+    def _merge_closure(self, topic: str) -> frozenset[str]:
+        """Combine the cached closures of a topic's direct prerequisites."""
+        closure: set[str] = set()
+        for prereq in self._graph.get(topic, []):
+            # Prerequisites that are not topics in the graph are not reported
+            if prereq in self._graph:
+                closure.add(prereq)
+                closure.update(self._closure_cache[prereq])
+        return frozenset(closure)
 
     def get_dependents(self, topic: str) -> list[str]:
         """
@@ -112,7 +162,7 @@ class PrerequisiteGraph:
                 dependents.append(t)
         return dependents
 
-    def are_prerequisites_met(self, topic: str, completed: set[str]) -> bool:
+    def are_prerequisites_met(self, topic: str, completed: Set[str]) -> bool:
         """
         Check if all prerequisites for a topic are met.
 
@@ -126,7 +176,7 @@ class PrerequisiteGraph:
         all_prereqs = set(self.get_all_prerequisites(topic))
         return all_prereqs.issubset(completed)
 
-    def get_missing_prerequisites(self, topic: str, completed: set[str]) -> list[str]:
+    def get_missing_prerequisites(self, topic: str, completed: Set[str]) -> list[str]:
         """
         Get prerequisites that are not yet completed.
 
@@ -138,7 +188,7 @@ class PrerequisiteGraph:
             list[str]: List of missing prerequisite topics.
         """
         all_prereqs = set(self.get_all_prerequisites(topic))
-        missing = all_prereqs - completed
+        missing = all_prereqs.difference(completed)
         return list(missing)
 
     def topological_sort(self) -> list[str]:
@@ -150,41 +200,47 @@ class PrerequisiteGraph:
         Returns:
             list[str]: Topics sorted such that prerequisites come before dependents.
         """
-        # Calculate in-degrees
-        in_degree = {topic: 0 for topic in self._graph}
-
-        for prereqs in self._graph.values():
-            for prereq in prereqs:
-                if prereq in in_degree:
-                    in_degree[prereq] += 0  # Just ensure it exists
-                # Count how many topics depend on this prereq
-                for topic in self._graph:
-                    if prereq in self._graph[topic]:
-                        in_degree[prereq] = in_degree.get(prereq, 0) + 1
-
-        # Recalculate properly
-        in_degree = {topic: 0 for topic in self._graph}
-        for topic, prereqs in self._graph.items():
-            for prereq in prereqs:
-                in_degree[topic] = in_degree.get(topic, 0) + 1
+        # A topic becomes ready once every listed prerequisite has been emitted;
+        # prerequisites that are not topics in the graph never are
+        in_degree = {topic: len(prereqs) for topic, prereqs in self._graph.items()}
+        dependents = self._dependents_by_topic(self._graph)
 
         # Start with topics that have no prerequisites
-        queue = [topic for topic, degree in in_degree.items() if degree == 0]
+        queue = deque(topic for topic, degree in in_degree.items() if degree == 0)
         result = []
 
         while queue:
-            topic = queue.pop(0)
+            topic = queue.popleft()
             result.append(topic)
 
             # Reduce in-degree for dependents
-            for dependent in self.get_dependents(topic):
+            for dependent in dependents[topic]:
                 in_degree[dependent] -= 1
                 if in_degree[dependent] == 0:
                     queue.append(dependent)
 
         return result
 
-    def get_learning_path(self, target_topic: str, completed: set[str]) -> list[str]:
+    @staticmethod
+    def _dependents_by_topic(graph: dict[str, list[str]]) -> dict[str, list[str]]:
+        """
+        Invert a topic -> prerequisites mapping in one pass.
+
+        Args:
+            graph: Mapping of topic -> prerequisites.
+
+        Returns:
+            dict: Each topic mapped to the topics listing it as a prerequisite,
+            in graph order and without repeats.
+        """
+        dependents: dict[str, list[str]] = {topic: [] for topic in graph}
+        for topic, prereqs in graph.items():
+            for prereq in dict.fromkeys(prereqs):
+                if prereq in dependents:
+                    dependents[prereq].append(topic)
+        return dependents
+
+    def get_learning_path(self, target_topic: str, completed: Set[str]) -> list[str]:
         """
         Generate a learning path to reach the target topic.
 
@@ -195,14 +251,14 @@ class PrerequisiteGraph:
         Returns:
             list[str]: Ordered list of topics to learn (prerequisites first).
         """
-        # Get all prerequisites needed
-        all_prereqs = self.get_all_prerequisites(target_topic)
+        # Get all prerequisites needed (a set, so the filter below is linear)
+        all_prereqs = self._prerequisite_closure(target_topic)
 
         # Filter out already completed
-        needed = [p for p in all_prereqs if p not in completed]
+        needed = {p for p in all_prereqs if p not in completed}
 
         # Add target topic
-        needed.append(target_topic)
+        needed.add(target_topic)
 
         # Sort by dependencies
         sorted_all = self.topological_sort()
@@ -227,30 +283,39 @@ class PrerequisiteGraph:
         temp_graph = self._graph.copy()
         temp_graph[new_topic] = new_prerequisites
 
-        # Try to do topological sort with DFS cycle detection
-        visited = set()
-        rec_stack = set()
-
-        def has_cycle(topic: str) -> bool:
-            visited.add(topic)
-            rec_stack.add(topic)
+        return self._has_cycle(temp_graph)
 
-            for prereq in temp_graph.get(topic, []):
-                if prereq not in visited:
-                    if has_cycle(prereq):
-                        return True
-                elif prereq in rec_stack:
-                    return True
+    @staticmethod
+    def _has_cycle(graph: dict[str, list[str]]) -> bool:
+        """
+        Check whether a topic -> prerequisites mapping contains a cycle.
 
-            rec_stack.remove(topic)
-            return False
+        Args:
+            graph: Mapping to check.
 
-        for topic in temp_graph:
-            if topic not in visited:
-                if has_cycle(topic):
-                    return True
+        Returns:
+            bool: True if any topic transitively requires itself.
+        """
+        # Kahn's algorithm over the topics in the mapping: every topic on a cycle
+        # keeps a prerequisite that is never emitted. Prerequisites that are not
+        # topics themselves cannot be part of a cycle, so they are not counted.
+        dependents = PrerequisiteGraph._dependents_by_topic(graph)
+        in_degree = dict.fromkeys(graph, 0)
+        for followers in dependents.values():
+            for dependent in followers:
+                in_degree[dependent] += 1
+
+        ready = [topic for topic, degree in in_degree.items() if degree == 0]
+        emitted = 0
+        while ready:
+            topic = ready.pop()
+            emitted += 1
+            for dependent in dependents[topic]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
 
-        return False
+        return emitted < len(graph)
 
     def to_dict(self) -> dict[str, list[str]]:
         """
@@ -259,21 +324,31 @@ class PrerequisiteGraph:
         Returns:
             dict: Graph as a dictionary.
         """
-        return self._graph.copy()
+        return {topic: list(prereqs) for topic, prereqs in self._graph.items()}
 
     @classmethod
     def from_dict(cls, data: dict[str, list[str]]) -> "PrerequisiteGraph":
         """
         Load graph from dictionary.
 
+        The whole mapping is checked for cycles in a single pass, so this is
+        the cheaper way to build a graph from many topics at once; add_topic
+        re-checks the full graph on every call.
+
         Args:
             data: Dictionary of topic -> prerequisites.
 
         Returns:
             PrerequisiteGraph: New graph instance.
+
+        Raises:
+            CircularDependencyError: If the prerequisites contain a cycle.
         """
+        if cls._has_cycle(data):
+            raise CircularDependencyError("Prerequisite data contains a cycle")
+
         graph = cls()
-        graph._graph = data.copy()
+        graph._graph = {topic: list(prereqs) for topic, prereqs in data.items()}
         return graph
 
     def to_json(self) -> str:
@@ -332,9 +332,6 @@ def build_prerequisite_graph() -> PrerequisiteGraph:
     Returns:
         PrerequisiteGraph: Graph with all topics and their prerequisites.
     """
-    graph = PrerequisiteGraph()
-
-    for topic_id, topic_data in CALCULUS_TOPICS.items():
-        graph.add_topic(topic_id, topic_data["prerequisites"])
-
-    return graph
+    return PrerequisiteGraph.from_dict(
+        {topic_id: topic_data["prerequisites"] for topic_id, topic_data in CALCULUS_TOPICS.items()}
+    )
@@ -1,5 +1,6 @@
 """Retrieval functionality for semantic search."""
 
 from calculus_rag.retrieval.retriever import Retriever, RetrievalResult
+from calculus_rag.retrieval.semantic_cache import SemanticCache
 
-__all__ = ["Retriever", "RetrievalResult"]
+__all__ = ["Retriever", "RetrievalResult", "SemanticCache"]
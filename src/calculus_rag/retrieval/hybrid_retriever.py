@@ -5,6 +5,7 @@ Uses Reciprocal Rank Fusion (RRF) to combine results from both methods,
 providing better retrieval for both conceptual queries and exact term matching.
 """
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
@@ -95,17 +96,26 @@ class HybridRetriever:
         # Get query embedding for semantic search
         query_embedding = self.embedder.embed(query)
 
-        # Get results from both methods for statistics
-        # First, get separate results to count overlap
-        semantic_results = await self.vector_store.query(
-            query_embedding=query_embedding,
-            n_results=n_results * 2,
-            where=filters,
-        )
-        keyword_results = await self.vector_store.fulltext_search(
-            query_text=query,
-            n_results=n_results * 2,
-            where=filters,
+        # Get separate results (for overlap statistics) and the hybrid results
+        # concurrently; each search uses its own pooled connection
+        semantic_results, keyword_results, hybrid_results = await asyncio.gather(
+            self.vector_store.query(
+                query_embedding=query_embedding,
+                n_results=n_results * 2,
+                where=filters,
+            ),
+            self.vector_store.fulltext_search(
+                query_text=query,
+                n_results=n_results * 2,
+                where=filters,
+            ),
+            self.vector_store.hybrid_search(
+                query_text=query,
+                query_embedding=query_embedding,
+                n_results=n_results,
+                semantic_weight=weight,
+                where=filters,
+            ),
         )
 
         # Count overlap
@@ -113,15 +123,6 @@ class HybridRetriever:
         keyword_ids = {r.id for r in keyword_results}
         overlap_count = len(semantic_ids & keyword_ids)
 
-        # Now get hybrid results
-        hybrid_results = await self.vector_store.hybrid_search(
-            query_text=query,
-            query_embedding=query_embedding,
-            n_results=n_results,
-            semantic_weight=weight,
-            where=filters,
-        )
-
         # Convert to RetrievalResult
         retrieval_results = [
             RetrievalResult(
@@ -161,25 +162,25 @@ class HybridRetriever:
         """
         query_embedding = self.embedder.embed(query)
 
-        # Get results from each method
-        semantic_results = await self.vector_store.query(
-            query_embedding=query_embedding,
-            n_results=n_results,
-            where=filters,
-        )
-
-        keyword_results = await self.vector_store.fulltext_search(
-            query_text=query,
-            n_results=n_results,
-            where=filters,
-        )
-
-        hybrid_results = await self.vector_store.hybrid_search(
-            query_text=query,
-            query_embedding=query_embedding,
-            n_results=n_results,
-            semantic_weight=self.semantic_weight,
-            where=filters,
+        # Get results from each method concurrently
+        semantic_results, keyword_results, hybrid_results = await asyncio.gather(
+            self.vector_store.query(
+                query_embedding=query_embedding,
+                n_results=n_results,
+                where=filters,
+            ),
+            self.vector_store.fulltext_search(
+                query_text=query,
+                n_results=n_results,
+                where=filters,
+            ),
+            self.vector_store.hybrid_search(
+                query_text=query,
+                query_embedding=query_embedding,
+                n_results=n_results,
+                semantic_weight=self.semantic_weight,
+                where=filters,
+            ),
         )
 
         def to_retrieval_results(results):
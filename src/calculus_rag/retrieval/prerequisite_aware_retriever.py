@@ -146,7 +146,7 @@ class PrerequisiteAwareRetriever:
         # Step 2: Get main results (hybrid or semantic search)
         if self.use_hybrid_search and isinstance(self.vector_store, PgVectorStore):
             # Use hybrid search for better keyword + semantic matching
-            query_embedding = self.embedder.embed(query)
+            query_embedding = self.base_retriever.embed_query(query)
             hybrid_results = await self.vector_store.hybrid_search(
                 query_text=query,
                 query_embedding=query_embedding,
@@ -4,14 +4,38 @@ Retrieval functionality for semantic search.
 Combines embeddings and vector storage for efficient document retrieval.
 """
 
+import asyncio
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from calculus_rag.embeddings.base import BaseEmbedder
+from calculus_rag.retrieval.semantic_cache import SemanticCache
 from calculus_rag.utils.text_cleanup import cleanup_math_text
 from calculus_rag.vectorstore.base import BaseVectorStore, QueryResult
 
 
+# Difficulty assumed for chunks whose metadata has no whole-number difficulty
+_DEFAULT_DIFFICULTY = 5
+
+
+def _difficulty(metadata: dict[str, Any]) -> int:
+    """Return a chunk's difficulty level, or the default if it has none."""
+    difficulty = metadata.get("difficulty")
+    return difficulty if type(difficulty) is int else _DEFAULT_DIFFICULTY
+
+
+def _clean_query(query: str) -> str:
+    """Strip a query, rejecting it if nothing is left."""
+    # Surrounding whitespace doesn't change the question; stripping it first
+    # rejects blank queries before any embedding work and shares cache entries
+    query = query.strip() if query else ""
+    if not query:
+        raise ValueError("Query cannot be empty")
+    return query
+
+
 @dataclass
 class RetrievalResult:
     """
@@ -51,6 +75,8 @@ class Retriever:
         self,
         embedder: BaseEmbedder,
         vector_store: BaseVectorStore,
+        embed_cache_size: int = 1024,
+        semantic_cache: SemanticCache | None = None,
     ) -> None:
         """
         Initialize the retriever.
@@ -58,9 +84,95 @@ class Retriever:
         Args:
             embedder: The embedding model to use for encoding queries.
             vector_store: The vector store containing document chunks.
+            embed_cache_size: Maximum number of query embeddings kept in an
+                in-process LRU cache, keyed on the exact query text. Set to 0
+                to disable.
+            semantic_cache: Optional cache that answers a query with the store
+                results of an earlier, near-identical query (by embedding
+                similarity) instead of querying the vector store. It is not
+                invalidated by writes to the store, so it is off by default.
         """
         self.embedder = embedder
         self.vector_store = vector_store
+        self.embed_cache_size = embed_cache_size
+        self.semantic_cache = semantic_cache
+        # Stored as tuples and handed out as new lists, so callers can't alter entries
+        self._embed_cache: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+
+    def embed_query(self, query: str) -> list[float]:
+        """
+        Embed a query for searching the vector store.
+
+        The query is stripped first, and the embeddings of recent queries are
+        reused (see ``embed_cache_size``).
+
+        Args:
+            query: The user's question or search query.
+
+        Returns:
+            list[float]: The query embedding.
+
+        Raises:
+            ValueError: If query is empty.
+        """
+        return self._embed_query(_clean_query(query))
+
+    def _embed_query(self, query: str) -> list[float]:
+        """
+        Embed a query, reusing the embedding of a previously seen identical query.
+
+        Args:
+            query: The query text.
+
+        Returns:
+            list[float]: The query embedding.
+        """
+        if self.embed_cache_size <= 0:
+            return self.embedder.embed(query)
+
+        cached = self._embed_cache.get(query)
+        if cached is not None:
+            self._embed_cache.move_to_end(query)
+            return list(cached)
+
+        embedding = self.embedder.embed(query)
+        self._cache_embedding(query, embedding)
+        return embedding
+
+    def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """
+        Embed several queries with a single embed_batch call.
+
+        Cached and repeated queries are only embedded once.
+
+        Args:
+            queries: The query texts.
+
+        Returns:
+            list[list[float]]: One embedding per query, in the same order.
+        """
+        embeddings: dict[str, Sequence[float]] = {}
+        for query in queries:
+            cached = self._embed_cache.get(query)
+            if cached is not None:
+                self._embed_cache.move_to_end(query)
+                embeddings[query] = cached
+
+        missing = [query for query in dict.fromkeys(queries) if query not in embeddings]
+        if missing:
+            for query, embedding in zip(missing, self.embedder.embed_batch(missing)):
+                embeddings[query] = embedding
+                self._cache_embedding(query, embedding)
+
+        return [list(embeddings[query]) for query in queries]
+
+    def _cache_embedding(self, query: str, embedding: list[float]) -> None:
+        """Add a query embedding to the LRU cache, evicting the oldest if it is full."""
+        if self.embed_cache_size <= 0:
+            return
+        self._embed_cache[query] = tuple(embedding)
+        if len(self._embed_cache) > self.embed_cache_size:
+            self._embed_cache.popitem(last=False)  # Remove oldest
 
     async def retrieve(
         self,
@@ -86,19 +198,81 @@ class Retriever:
         Raises:
             ValueError: If query is empty.
         """
-        if not query or not query.strip():
-            raise ValueError("Query cannot be empty")
+        query = _clean_query(query)
+
+        if n_results <= 0:
+            return []
 
         # Embed the query
-        query_embedding = self.embedder.embed(query)
+        query_embedding = self._embed_query(query)
+
+        return await self._search(query_embedding, n_results, filters, min_score)
+
+    async def retrieve_batch(
+        self,
+        queries: list[str],
+        n_results: int = 5,
+        filters: dict[str, Any] | None = None,
+        min_score: float = 0.45,
+    ) -> list[list[RetrievalResult]]:
+        """
+        Retrieve relevant document chunks for several queries at once.
+
+        The queries are embedded with one embed_batch call, and the vector
+        store searches run concurrently rather than one after another.
+
+        Args:
+            queries: The questions or search queries.
+            n_results: Maximum number of results to return per query.
+            filters: Optional metadata filters applied to every query.
+            min_score: Minimum similarity score threshold (0-1), as for retrieve().
+
+        Returns:
+            list[list[RetrievalResult]]: Retrieved chunks for each query, in
+            the order of ``queries``.
 
-        # Search the vector store (get extra results to account for filtering)
-        results = await self.vector_store.query(
-            query_embedding=query_embedding,
-            n_results=n_results * 2,
-            where=filters,
+        Raises:
+            ValueError: If any query is empty.
+        """
+        queries = [_clean_query(query) for query in queries]
+
+        if n_results <= 0:
+            return [[] for _ in queries]
+
+        embeddings = self._embed_queries(queries)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self._search(embedding, n_results, filters, min_score)
+                    for embedding in embeddings
+                )
+            )
         )
 
+    async def _search(
+        self,
+        query_embedding: list[float],
+        n_results: int,
+        filters: dict[str, Any] | None,
+        min_score: float,
+    ) -> list[RetrievalResult]:
+        """Search the vector store (or the semantic cache) with an embedded query."""
+        results = None
+        if self.semantic_cache is not None:
+            cache_key = SemanticCache.make_key(n_results, filters)
+            results = self.semantic_cache.get(query_embedding, cache_key)
+
+        if results is None:
+            # Search the vector store (get extra results to account for filtering)
+            results = await self.vector_store.query(
+                query_embedding=query_embedding,
+                n_results=n_results * 2,
+                where=filters,
+            )
+            if self.semantic_cache is not None:
+                self.semantic_cache.put(query_embedding, cache_key, results)
+
         # Convert to RetrievalResult objects, clean content, and filter by minimum score
         retrieval_results = [
             RetrievalResult(
@@ -146,6 +320,9 @@ class Retriever:
         """
         Retrieve chunks at or below a difficulty level.
 
+        Chunks without a whole-number difficulty count as the hardest level
+        (5), so they are only returned when max_difficulty is 5 or more.
+
         Args:
             query: The user's question.
             max_difficulty: Maximum difficulty level (1-5).
@@ -153,24 +330,24 @@ class Retriever:
 
         Returns:
             list[RetrievalResult]: Retrieved chunks filtered by difficulty.
-
-        Note:
-            This currently retrieves all results and filters client-side.
-            For better performance, implement server-side filtering in the
-            vector store.
         """
-        # Get more results to account for filtering
-        all_results = await self.retrieve(query=query, n_results=n_results * 2)
-
-        # Filter by difficulty
-        filtered = [
-            r
-            for r in all_results
-            if r.metadata.get("difficulty", 5) <= max_difficulty
-        ]
+        if max_difficulty < _DEFAULT_DIFFICULTY:
+            # Filtered in the vector store, so every fetched result is usable.
+            # Chunks without a difficulty fail the comparison, as they should here.
+            return await self.retrieve(
+                query=query,
+                n_results=n_results,
+                filters={"difficulty": {"$lte": max_difficulty}},
+            )
 
-        # Return top n_results
-        return filtered[:n_results]
+        # Chunks without a difficulty qualify, which a SQL comparison would drop.
+        # Almost nothing is above the top level, so filter the results here instead.
+        results = await self.retrieve(query=query, n_results=n_results * 2)
+        return [
+            result
+            for result in results
+            if _difficulty(result.metadata) <= max_difficulty
+        ][:n_results]
 
     def __repr__(self) -> str:
         return f"Retriever(embedder={self.embedder}, vector_store={self.vector_store})"
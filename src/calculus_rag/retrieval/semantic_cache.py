@@ -0,0 +1,161 @@
+"""
+Embedding-similarity cache for retrieval results.
+
+Lets a retriever answer a query from the results of an earlier query whose
+embedding is nearly identical, without going back to the vector store.
+"""
+
+import time
+from typing import Any
+
+import numpy as np
+
+from calculus_rag.vectorstore.base import QueryResult, copy_results, filter_cache_key
+
+
+class SemanticCache:
+    """
+    Fixed-size cache of vector store results, looked up by embedding similarity.
+
+    Embeddings are stored L2-normalised in one float32 matrix, so a lookup is a
+    single matrix-vector product over every cached entry. Results are only
+    reused for a lookup with the same key (e.g. the same n_results and
+    filters). Results are copied in and out, so callers may mutate what they
+    get back. When full, the oldest entry is overwritten.
+
+    The cache does not see writes to the vector store; entries expire after
+    ``ttl`` seconds, and ``clear()`` drops them all.
+
+    Example:
+        >>> cache = SemanticCache(max_size=1024, threshold=0.95)
+        >>> cache.put(embedding, key, results)
+        >>> cache.get(similar_embedding, key)  # results, if similarity >= 0.95
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        threshold: float = 0.95,
+        ttl: float = 7 * 24 * 3600.0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached queries.
+            threshold: Minimum cosine similarity for a cached entry to be reused.
+            ttl: Seconds after which a cached entry is no longer reused.
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self.threshold = threshold
+        self.ttl = ttl
+        # Allocated on the first put(), once the embedding dimension is known
+        self._embeddings: np.ndarray | None = None
+        # Insertion times (time.monotonic); -inf marks an empty slot
+        self._timestamps = np.full(max_size, -np.inf)
+        # hash(key) per slot so the key check is vectorised with the rest
+        self._key_hashes = np.zeros(max_size, dtype=np.int64)
+        self._keys: list[Any] = [None] * max_size
+        self._results: list[list[QueryResult] | None] = [None] * max_size
+        self._next_slot = 0
+
+    @staticmethod
+    def make_key(n_results: int, where: dict[str, Any] | None) -> tuple[int, bytes]:
+        """
+        Build a cache key from the parameters of a vector store query.
+
+        Args:
+            n_results: Number of results requested.
+            where: Optional metadata filter.
+
+        Returns:
+            tuple: Hashable key that is equal for equal parameters.
+        """
+        return n_results, filter_cache_key(where)
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray | None:
+        """Return the embedding as a unit float32 vector, or None if it is all zeros."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+    def get(self, embedding: list[float], key: Any) -> list[QueryResult] | None:
+        """
+        Look up results cached for a similar query.
+
+        Args:
+            embedding: Embedding of the new query.
+            key: Key the results must have been stored under.
+
+        Returns:
+            list[QueryResult] | None: Results of the most similar live entry
+            with the same key, or None if none reaches the threshold.
+        """
+        if self._embeddings is None:
+            return None
+
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+
+        live = (time.monotonic() - self._timestamps < self.ttl) & (
+            self._key_hashes == hash(key)
+        )
+        if not live.any():
+            return None
+
+        similarities = np.where(live, self._embeddings @ vector, -np.inf)
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold or self._keys[best] != key:
+            return None
+
+        return copy_results(self._results[best])
+
+    def put(self, embedding: list[float], key: Any, results: list[QueryResult]) -> None:
+        """
+        Cache the results of a query.
+
+        Args:
+            embedding: Embedding of the query.
+            key: Key to store the results under.
+            results: Vector store results for the query.
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        if self._embeddings is None:
+            self._embeddings = np.zeros((self.max_size, vector.shape[0]), dtype=np.float32)
+
+        slot = self._next_slot
+        self._embeddings[slot] = vector
+        self._timestamps[slot] = time.monotonic()
+        self._key_hashes[slot] = hash(key)
+        self._keys[slot] = key
+        self._results[slot] = copy_results(results)
+        self._next_slot = (slot + 1) % self.max_size
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._timestamps.fill(-np.inf)
+        self._keys = [None] * self.max_size
+        self._results = [None] * self.max_size
+        self._next_slot = 0
+
+    def __len__(self) -> int:
+        return int(np.isfinite(self._timestamps).sum())
+
+    def __repr__(self) -> str:
+        return (
+            f"SemanticCache(size={len(self)}, max_size={self.max_size}, "
+            f"threshold={self.threshold})"
+        )
@@ -4,15 +4,22 @@ Base abstract class for vector stores.
 All vector store implementations should inherit from BaseVectorStore.
 """
 
+import copy
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from typing import Any
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class QueryResult:
     """
     Represents a single result from a vector store query.
 
+    Instances are immutable; use ``dataclasses.replace`` to derive a result
+    with a different score.
+
     Attributes:
         id: Unique identifier of the document.
         content: The text content of the document.
@@ -26,6 +33,37 @@ class QueryResult:
     score: float = 0.0
 
 
+def copy_results(results: list[QueryResult]) -> list[QueryResult]:
+    """
+    Copy query results together with their metadata.
+
+    Caches hand out and keep copies, so a caller mutating a result's metadata
+    cannot change what later lookups return.
+    """
+    return [replace(result, metadata=copy.deepcopy(result.metadata)) for result in results]
+
+
+def _filter_key_default(value: Any) -> list:
+    """orjson fallback for filter values: sets (e.g. for $in) become sorted lists."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=lambda item: (type(item).__name__, repr(item)))
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def filter_cache_key(where: dict | None) -> bytes:
+    """
+    Serialize a metadata filter for use in a cache key.
+
+    Equal filters give equal bytes regardless of key order, and set operands
+    (e.g. for ``$in``) are accepted like lists.
+    """
+    return orjson.dumps(
+        where,
+        default=_filter_key_default,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+
+
 class BaseVectorStore(ABC):
     """
     Abstract base class for vector storage backends.
@@ -80,7 +118,9 @@ class BaseVectorStore(ABC):
         Args:
             query_embedding: The query vector to search with.
             n_results: Maximum number of results to return.
-            where: Optional filter conditions.
+            where: Optional filter conditions. Plain values match by equality;
+                a dict of operators compares instead, e.g.
+                ``{"difficulty": {"$lte": 3}}``.
 
         Returns:
             list[QueryResult]: List of matching documents with scores.
@@ -4,17 +4,247 @@ PostgreSQL + pgvector vector store implementation.
 This module provides async vector storage using PostgreSQL with the pgvector extension.
 """
 
-import json
-from typing import Any
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Literal
 
 import asyncpg
+import numpy as np
+import orjson
+
+from calculus_rag.vectorstore.base import (
+    BaseVectorStore,
+    QueryResult,
+    copy_results,
+    filter_cache_key,
+)
+
+
+# Max ids bound into a single DELETE statement
+_DELETE_BATCH_SIZE = 5000
+
+# add() loads batches larger than this with COPY instead of executemany
+_COPY_MIN_ROWS = 50
+
+# Conflict clause shared by add()'s INSERT and COPY paths
+_UPSERT_SQL = """
+    ON CONFLICT (id) DO UPDATE SET
+        content = EXCLUDED.content,
+        document_id = EXCLUDED.document_id,
+        chunk_index = EXCLUDED.chunk_index,
+        metadata = EXCLUDED.metadata,
+        embedding = EXCLUDED.embedding
+"""
+
+# Reciprocal Rank Fusion constant; keeps top ranks from dominating the fused score
+_RRF_K = 60
+
+# Characters that break tsquery (keep alphanumeric, spaces, hyphens, apostrophes)
+_TSQUERY_SANITIZE = re.compile(r"[^\w\s'-]")
+
+_STOPWORDS = frozenset(
+    {"the", "and", "for", "are", "but", "not", "you", "all", "can", "was", "her", "have"}
+)
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to JSON text for the asyncpg jsonb codec."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Register codecs on each new pool connection."""
+    # JSONB values come back as Python objects, decoded by orjson in the driver
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_json_dumps,
+        decoder=orjson.loads,
+        schema="pg_catalog",
+        format="text",
+    )
+
+
+# Generated column expressions for the metadata keys promoted to typed columns.
+# difficulty is only set for small whole numbers, so other values cannot fail inserts.
+_TOPIC_SQL = "metadata->>'topic'"
+_DIFFICULTY_SQL = (
+    "CASE WHEN metadata->>'difficulty' ~ '^[0-9]{1,4}$' "
+    "THEN (metadata->>'difficulty')::smallint END"
+)
+
+# Comparison operators accepted in ``where`` filters, with their SQL spelling
+_WHERE_OPERATORS = {"$eq": "=", "$ne": "<>", "$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+# Metadata keys are inlined into operator filters (so expression indexes match)
+_METADATA_KEY = re.compile(r"^\w+$")
+
+# Metadata keys copied into typed, indexed columns, with the Python type they hold
+_METADATA_COLUMNS = {"topic": str, "difficulty": int}
+
+# Values the SMALLINT difficulty column (and the int4 cast) can hold
+_SMALLINT_RANGE = range(-(2**15), 2**15)
+_INT_RANGE = range(-(2**31), 2**31)
+
+
+def _metadata_cast(value: Any) -> str:
+    """Return the SQL cast that compares a metadata field like the given Python value."""
+    if isinstance(value, bool):
+        return "::boolean"
+    if isinstance(value, int):
+        return "::int" if value in _INT_RANGE else "::bigint"
+    if isinstance(value, float):
+        return "::float8"
+    return ""
+
+
+def _fits_column(key: str, value: Any) -> bool:
+    """Return True if the key has a typed column that can hold the value."""
+    column_type = _METADATA_COLUMNS.get(key)
+    if column_type is None or type(value) is not column_type:
+        return False
+    return column_type is not int or value in _SMALLINT_RANGE
+
+
+def _json_text(value: Any) -> str:
+    """Return a value as ``metadata->>key`` renders it: strings raw, others as JSON."""
+    return value if isinstance(value, str) else orjson.dumps(value).decode()
+
+
+def _filter_field(key: str, value: Any) -> tuple[str, str | None]:
+    """
+    Choose what a filter on a metadata key compares against.
+
+    Args:
+        key: Metadata key.
+        value: Python value it is compared with.
+
+    Returns:
+        tuple: The SQL expression, and the cast for the parameter. The cast is
+        None for a typed column, whose type asyncpg infers for the parameter.
+    """
+    if _fits_column(key, value):
+        return key, None
+    cast = _metadata_cast(value)
+    return f"(metadata->>'{key}'){cast}", cast
+
+
+def _where_to_sql(where: dict, params: list[Any]) -> str:
+    """
+    Translate a metadata filter into a SQL condition, appending its values to params.
+
+    Keys with a typed column (``topic``, ``difficulty``) are compared on that
+    column when the value has the column's type and fits it (every value, for
+    ``$in``). Other plain values are
+    matched together with JSONB containment, so the GIN index on metadata
+    applies. Other operator values such as ``{"page": {"$lte": 3}}`` become
+    comparisons on the extracted field, cast to the operand's type
+    (``(metadata->>'page')::int <= $n``). Either way the database filters rows
+    instead of the caller. Supported operators are $eq, $ne, $gt, $gte, $lt,
+    $lte and $in.
+
+    Args:
+        where: Non-empty metadata filter.
+        params: Query parameters so far; filter values are appended.
+
+    Returns:
+        str: Condition for a WHERE clause, without the WHERE keyword.
+
+    Raises:
+        ValueError: If an operator is unsupported or a key is not a plain name.
+    """
+    contained: dict[str, Any] = {}
+    conditions: list[str] = []
+
+    for key, value in where.items():
+        if not (isinstance(value, dict) and value and all(op.startswith("$") for op in value)):
+            if _fits_column(key, value):
+                params.append(value)
+                conditions.append(f"{key} = ${len(params)}")
+            else:
+                contained[key] = value
+            continue
+
+        if not _METADATA_KEY.match(key):
+            raise ValueError(f"Invalid metadata key in filter: {key!r}")
+
+        for op, operand in value.items():
+            if op == "$in":
+                operands = list(operand)
+                casts = {_metadata_cast(item) for item in operands}
+                if operands and all(_fits_column(key, item) for item in operands):
+                    params.append(operands)
+                    conditions.append(f"{key} = ANY(${len(params)})")
+                elif len(casts) == 1:
+                    cast = casts.pop()
+                    params.append(operands)
+                    conditions.append(
+                        f"(metadata->>'{key}'){cast} = ANY(${len(params)}{cast or '::text'}[])"
+                    )
+                else:
+                    # Mixed (or no) operand types: compare the text form of each
+                    params.append([_json_text(item) for item in operands])
+                    conditions.append(f"(metadata->>'{key}') = ANY(${len(params)}::text[])")
+            elif op in _WHERE_OPERATORS:
+                field, cast = _filter_field(key, operand)
+                params.append(operand)
+                conditions.append(f"{field} {_WHERE_OPERATORS[op]} ${len(params)}{cast or ''}")
+            else:
+                raise ValueError(f"Unsupported filter operator: {op}")
+
+    if contained:
+        params.append(contained)
+        conditions.insert(0, f"metadata @> ${len(params)}::jsonb")
+
+    return " AND ".join(conditions)
+
+
+@lru_cache(maxsize=8)
+def _vector_format(dimension: int) -> str:
+    """Return a %-format string that renders a vector of the given dimension."""
+    # pgvector stores float4, and 9 significant digits round-trip any float4 exactly
+    return "[" + ",".join(["%.9g"] * dimension) + "]"
+
+
+def _list_to_vector(embedding: list[float] | np.ndarray) -> str:
+    """
+    Convert an embedding to pgvector's text format.
+
+    Accepts a list of floats or a 1-D numpy array. All values are formatted in
+    a single %-format call rather than one str() call per element.
+    """
+    if isinstance(embedding, np.ndarray):
+        embedding = embedding.tolist()
+    return _vector_format(len(embedding)) % tuple(embedding)
+
+
+def _normalize_rows(embeddings: list[float] | list[list[float]] | np.ndarray) -> np.ndarray:
+    """Scale one embedding, or each row of a batch, to unit length as float32."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    # All-zero vectors have no direction; leave them as they are
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+@lru_cache(maxsize=1024)
+def _to_ts_query(query_text: str) -> str | None:
+    """
+    Convert free text into an OR-joined tsquery string.
+
+    Returns None if no searchable words remain after sanitizing.
+    """
+    sanitized = _TSQUERY_SANITIZE.sub(" ", query_text)
 
-from calculus_rag.vectorstore.base import BaseVectorStore, QueryResult
+    # Split into words
+    words = sanitized.lower().split()
+    # Filter out very short words and common stop words
+    words = [w for w in words if len(w) > 2 and w not in _STOPWORDS]
 
+    if not words:
+        return None
 
-def _list_to_vector(embedding: list[float]) -> str:
-    """Convert a Python list to pgvector format string."""
-    return "[" + ",".join(str(x) for x in embedding) + "]"
+    return " | ".join(words)  # OR for broader matching
 
 
 class PgVectorStore(BaseVectorStore):
@@ -34,6 +264,19 @@ class PgVectorStore(BaseVectorStore):
         connection_string: str,
         dimension: int = 768,
         table_name: str = "chunks",
+        hnsw_m: int = 16,
+        hnsw_ef_construction: int = 64,
+        hnsw_ef_search: int | None = 80,
+        ivfflat_probes: int | None = None,
+        query_cache_size: int = 0,
+        precision: Literal["float32", "float16"] = "float32",
+        distance: Literal["cosine", "inner_product"] = "cosine",
+        min_pool_size: int = 4,
+        max_pool_size: int = 32,
+        command_timeout: float | None = 30.0,
+        max_inactive_connection_lifetime: float = 300.0,
+        statement_cache_size: int = 2048,
+        count_cache_ttl: float = 5.0,
     ) -> None:
         """
         Initialize the PgVector store.
@@ -42,66 +285,272 @@ class PgVectorStore(BaseVectorStore):
             connection_string: PostgreSQL connection string.
             dimension: Vector embedding dimension.
             table_name: Name of the table to store chunks.
+            hnsw_m: Max connections per node in the HNSW index graph.
+            hnsw_ef_construction: Candidate list size used while building the HNSW index.
+            hnsw_ef_search: Candidate list size used at query time; higher gives
+                better recall at some latency cost. Can be overridden per call.
+                If None, the server default (40) is used.
+            ivfflat_probes: Lists probed per query, for tables that still carry
+                an IVFFlat embedding index from before the switch to HNSW. If
+                None, the server default (1) is used.
+            query_cache_size: Maximum number of query() results kept in an
+                in-process LRU cache. The cache is cleared on every write made
+                through this store, but not on writes from other processes
+                (such as the ingest scripts), so it is off (0) by default.
+            precision: Storage precision for embeddings. "float16" stores them as
+                pgvector ``halfvec`` (requires pgvector 0.7+), halving vector size
+                on disk and in the index. Callers still pass float lists.
+            distance: Distance used for search and the HNSW index. "inner_product"
+                (``<#>``) skips the norm division of cosine and ranks identically
+                for unit-length embeddings. With it, add(), query() and
+                hybrid_search() scale embeddings to unit length before sending
+                them, so any embedder can be used.
+            min_pool_size: Connections the pool opens up front and keeps open.
+            max_pool_size: Upper bound on concurrent connections.
+            command_timeout: Default per-statement timeout in seconds, so a hung
+                scan cannot hold a pooled connection forever. None disables it.
+            max_inactive_connection_lifetime: Seconds after which idle
+                connections are closed.
+            statement_cache_size: Prepared statements cached per connection.
+            count_cache_ttl: Seconds the exact ``count`` is reused before it is
+                queried again. Writes through this store reset it immediately.
+
+        Raises:
+            ValueError: If precision or distance is not a supported value.
         """
+        if precision not in ("float32", "float16"):
+            raise ValueError(f"precision must be 'float32' or 'float16', got {precision!r}")
+        if distance not in ("cosine", "inner_product"):
+            raise ValueError(f"distance must be 'cosine' or 'inner_product', got {distance!r}")
+
         self.connection_string = connection_string
         self.dimension = dimension
         self.table_name = table_name
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_ef_search = hnsw_ef_search
+        self.ivfflat_probes = ivfflat_probes
+        self.query_cache_size = query_cache_size
+        self.precision = precision
+        self.distance = distance
+        self.min_pool_size = min_pool_size
+        self.max_pool_size = max_pool_size
+        self.command_timeout = command_timeout
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self.statement_cache_size = statement_cache_size
+        self.count_cache_ttl = count_cache_ttl
+        # pgvector column type; also used to cast query parameters
+        self._vector_type = "halfvec" if precision == "float16" else "vector"
+        # <#> returns the negative inner product, so smaller is more similar for both
+        self._distance_op = "<#>" if distance == "inner_product" else "<=>"
+        self._index_ops = f"{self._vector_type}_{'ip' if distance == 'inner_product' else 'cosine'}_ops"
         self._pool: asyncpg.Pool | None = None
+        self._query_cache: OrderedDict[tuple, list[QueryResult]] = OrderedDict()
+        # Bumped on every write so in-flight queries don't cache stale results
+        self._cache_generation = 0
+        # (monotonic timestamp, count) of the last exact count
+        self._count_cache: tuple[float, int] | None = None
 
     async def initialize(self) -> None:
         """
         Initialize the database connection and schema.
 
         Creates the pgvector extension and chunks table if they don't exist.
+
+        The embedding index is HNSW, which needs no training step, so it can be
+        created on an empty table. Building it is faster on a populated table,
+        though, so for large bulk loads call this after the data is in place.
+
+        Safe to call from many workers at once. When the table and all of its
+        indexes already exist this is a single lock-free check; otherwise
+        schema setup runs in one transaction, serialized with a PostgreSQL
+        advisory lock.
         """
         # Create connection pool
         self._pool = await asyncpg.create_pool(
             self.connection_string,
-            min_size=2,
-            max_size=10,
+            min_size=self.min_pool_size,
+            max_size=self.max_pool_size,
+            command_timeout=self.command_timeout,
+            max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+            statement_cache_size=self.statement_cache_size,
+            init=_init_connection,
         )
 
-        # Create extension and table
+        lock_key = f"pgvector_store:{self.table_name}"
         async with self._pool.acquire() as conn:
-            # Enable pgvector extension
-            await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
-
-            # Create chunks table
-            await conn.execute(f"""
-                CREATE TABLE IF NOT EXISTS {self.table_name} (
-                    id TEXT PRIMARY KEY,
-                    content TEXT NOT NULL,
-                    document_id TEXT,
-                    chunk_index INTEGER,
-                    metadata JSONB NOT NULL DEFAULT '{{}}'::jsonb,
-                    embedding vector({self.dimension}),
-                    created_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-
-            # Create indexes
-            await conn.execute(f"""
-                CREATE INDEX IF NOT EXISTS {self.table_name}_embedding_idx
-                ON {self.table_name}
-                USING ivfflat (embedding vector_cosine_ops)
-                WITH (lists = 100)
-            """)
+            # Usual case: the schema is already in place, so no lock is needed
+            if await self._schema_is_current(conn):
+                return
+
+            # The transaction-scoped lock is released on commit, rollback or a
+            # dropped connection, so a failed setup cannot leave it held
+            async with conn.transaction():
+                await conn.execute("SELECT pg_advisory_xact_lock(hashtext($1))", lock_key)
+                # Another worker may have finished the setup while we waited
+                if not await self._schema_is_current(conn):
+                    await self._create_schema(conn)
+
+    def _index_names(self) -> list[str]:
+        """Names of the indexes _create_schema() builds."""
+        return [
+            f"{self.table_name}_embedding_idx",
+            f"{self.table_name}_metadata_idx",
+            f"{self.table_name}_difficulty_idx",
+            f"{self.table_name}_topic_idx",
+            f"{self.table_name}_document_id_idx",
+            f"{self.table_name}_content_tsv_idx",
+        ]
+
+    async def _schema_is_current(self, conn: asyncpg.Connection) -> bool:
+        """Check in one round trip whether the table and all its indexes exist."""
+        return bool(
+            await conn.fetchval(
+                "SELECT bool_and(to_regclass(name) IS NOT NULL) FROM unnest($1::text[]) AS name",
+                [self.table_name, *self._index_names()],
+            )
+        )
 
-            await conn.execute(f"""
-                CREATE INDEX IF NOT EXISTS {self.table_name}_metadata_idx
-                ON {self.table_name}
-                USING gin (metadata)
-            """)
+    async def _create_schema(self, conn: asyncpg.Connection) -> None:
+        """Create the extension, chunks table, and indexes if they don't exist."""
+        # Enable pgvector extension
+        await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+        # Create chunks table
+        await conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.table_name} (
+                id TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                document_id TEXT,
+                chunk_index INTEGER,
+                metadata JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+                embedding {self._vector_type}({self.dimension}),
+                content_tsv tsvector
+                    GENERATED ALWAYS AS (to_tsvector('english', content)) STORED,
+                topic TEXT GENERATED ALWAYS AS ({_TOPIC_SQL}) STORED,
+                difficulty SMALLINT GENERATED ALWAYS AS ({_DIFFICULTY_SQL}) STORED,
+                created_at TIMESTAMP DEFAULT NOW()
+            )
+        """)
+
+        # Tables created before content_tsv, topic or difficulty existed need them
+        # added; generated columns are filled in for existing rows as well
+        await conn.execute(f"""
+            ALTER TABLE {self.table_name}
+            ADD COLUMN IF NOT EXISTS content_tsv tsvector
+                GENERATED ALWAYS AS (to_tsvector('english', content)) STORED,
+            ADD COLUMN IF NOT EXISTS topic TEXT
+                GENERATED ALWAYS AS ({_TOPIC_SQL}) STORED,
+            ADD COLUMN IF NOT EXISTS difficulty SMALLINT
+                GENERATED ALWAYS AS ({_DIFFICULTY_SQL}) STORED
+        """)
+
+        # Create indexes
+        await conn.execute(f"""
+            CREATE INDEX IF NOT EXISTS {self.table_name}_embedding_idx
+            ON {self.table_name}
+            USING hnsw (embedding {self._index_ops})
+            WITH (m = {int(self.hnsw_m)}, ef_construction = {int(self.hnsw_ef_construction)})
+        """)
+
+        await conn.execute(f"""
+            CREATE INDEX IF NOT EXISTS {self.table_name}_metadata_idx
+            ON {self.table_name}
+            USING gin (metadata jsonb_path_ops)
+        """)
+
+        # B-tree indexes for the typed filter columns, which serve the range and
+        # IN filters that the containment-only GIN index above cannot
+        await conn.execute(f"""
+            CREATE INDEX IF NOT EXISTS {self.table_name}_difficulty_idx
+            ON {self.table_name} (difficulty)
+        """)
+
+        await conn.execute(f"""
+            CREATE INDEX IF NOT EXISTS {self.table_name}_topic_idx
+            ON {self.table_name} (topic)
+        """)
+
+        await conn.execute(f"""
+            CREATE INDEX IF NOT EXISTS {self.table_name}_document_id_idx
+            ON {self.table_name} (document_id)
+        """)
+
+        await conn.execute(f"""
+            CREATE INDEX IF NOT EXISTS {self.table_name}_content_tsv_idx
+            ON {self.table_name}
+            USING gin (content_tsv)
+        """)
+
+    async def _apply_search_settings(
+        self,
+        conn: asyncpg.Connection,
+        ef_search: int | None = None,
+    ) -> None:
+        """Apply per-query index settings. Must be called inside a transaction."""
+        ef_search = ef_search if ef_search is not None else self.hnsw_ef_search
+
+        # SET LOCAL only lasts for the enclosing transaction
+        settings = []
+        if ef_search is not None:
+            settings.append(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+        if self.ivfflat_probes is not None:
+            settings.append(f"SET LOCAL ivfflat.probes = {int(self.ivfflat_probes)}")
+
+        if settings:
+            # Sent as one simple-protocol message: a single round trip
+            await conn.execute("; ".join(settings))
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached query results and counts after the table contents change."""
+        self._query_cache.clear()
+        self._count_cache = None
+        self._cache_generation += 1
 
     @property
     async def count(self) -> int:
-        """Return the number of chunks in the store."""
+        """
+        Return the number of chunks in the store.
+
+        The exact count is reused for ``count_cache_ttl`` seconds, so frequent
+        polling does not run COUNT(*) on every access.
+        """
         if not self._pool:
             return 0
 
+        now = time.monotonic()
+        if self._count_cache is not None and now - self._count_cache[0] < self.count_cache_ttl:
+            return self._count_cache[1]
+
+        generation = self._cache_generation
         async with self._pool.acquire() as conn:
             result = await conn.fetchval(f"SELECT COUNT(*) FROM {self.table_name}")
-            return result or 0
+
+        count = result or 0
+        if generation == self._cache_generation:
+            self._count_cache = (now, count)
+        return count
+
+    async def approximate_count(self) -> int:
+        """
+        Return the planner's row estimate for the chunks table.
+
+        Reads ``pg_class.reltuples`` instead of scanning the table, so it is
+        O(1) but only as fresh as the last VACUUM/ANALYZE. Falls back to the
+        exact ``count`` if the table has never been analyzed.
+        """
+        if not self._pool:
+            return 0
+
+        async with self._pool.acquire() as conn:
+            estimate = await conn.fetchval(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass($1)",
+                self.table_name,
+            )
+
+        if estimate is None or estimate < 0:
+            return await self.count
+        return estimate
 
     async def add(
         self,
@@ -128,46 +577,120 @@ class PgVectorStore(BaseVectorStore):
         if metadatas is None:
             metadatas = [{} for _ in ids]
 
-        async with self._pool.acquire() as conn:
-            # Use COPY or INSERT for batch insert
-            for id_, embedding, document, metadata in zip(ids, embeddings, documents, metadatas):
-                # Extract additional fields from metadata if present
-                document_id = metadata.get("document_id", "")
-                chunk_index = metadata.get("chunk_index", 0)
-
-                await conn.execute(
-                    f"""
-                    INSERT INTO {self.table_name}
-                        (id, content, document_id, chunk_index, metadata, embedding)
-                    VALUES ($1, $2, $3, $4, $5, $6::vector)
-                    ON CONFLICT (id) DO UPDATE SET
-                        content = EXCLUDED.content,
-                        metadata = EXCLUDED.metadata,
-                        embedding = EXCLUDED.embedding
-                    """,
-                    id_,
-                    document,
-                    document_id,
-                    chunk_index,
-                    json.dumps(metadata),
-                    _list_to_vector(embedding),
-                )
+        if self.distance == "inner_product" and embeddings:
+            # Normalized once here so the index and search can skip cosine's norms
+            embeddings = _normalize_rows(embeddings)
+
+        # Pull document_id / chunk_index out of metadata into their own columns
+        rows = [
+            (
+                id_,
+                document,
+                metadata.get("document_id", ""),
+                metadata.get("chunk_index", 0),
+                metadata,
+                _list_to_vector(embedding),
+            )
+            for id_, embedding, document, metadata in zip(ids, embeddings, documents, metadatas)
+        ]
+
+        try:
+            async with self._pool.acquire() as conn:
+                if len(rows) > _COPY_MIN_ROWS:
+                    await self._copy_rows(conn, rows)
+                else:
+                    await conn.executemany(
+                        f"""
+                        INSERT INTO {self.table_name}
+                            (id, content, document_id, chunk_index, metadata, embedding)
+                        VALUES ($1, $2, $3, $4, $5, $6::{self._vector_type})
+                        {_UPSERT_SQL}
+                        """,
+                        rows,
+                    )
+        finally:
+            self._invalidate_caches()
 
         return ids
 
+    async def _copy_rows(self, conn: asyncpg.Connection, rows: list[tuple]) -> None:
+        """
+        Upsert rows through COPY into a temporary staging table.
+
+        COPY streams every row in one operation instead of executing the INSERT
+        per row. COPY cannot resolve conflicts itself, so the staged rows are
+        merged into the table with a single INSERT ... SELECT.
+
+        Args:
+            conn: Connection to load through.
+            rows: Rows shaped as add() builds them.
+        """
+        # Later duplicates win, as they would with one INSERT per row; a single
+        # INSERT ... ON CONFLICT cannot update the same row twice
+        staged = {
+            id_: (id_, content, document_id, chunk_index, _json_dumps(metadata), embedding)
+            for id_, content, document_id, chunk_index, metadata, embedding in rows
+        }
+
+        async with conn.transaction():
+            # Staged as text: the server parses vector and jsonb when merging
+            await conn.execute("""
+                CREATE TEMP TABLE chunk_staging (
+                    id TEXT,
+                    content TEXT,
+                    document_id TEXT,
+                    chunk_index INTEGER,
+                    metadata TEXT,
+                    embedding TEXT
+                ) ON COMMIT DROP
+            """)
+            await conn.copy_records_to_table("chunk_staging", records=staged.values())
+            await conn.execute(f"""
+                INSERT INTO {self.table_name}
+                    (id, content, document_id, chunk_index, metadata, embedding)
+                SELECT
+                    id, content, document_id, chunk_index,
+                    metadata::jsonb, embedding::{self._vector_type}
+                FROM chunk_staging
+                {_UPSERT_SQL}
+            """)
+
+    async def analyze(self) -> None:
+        """
+        Refresh the planner statistics for the chunks table.
+
+        Call after a bulk load so filtered queries are planned with current
+        row counts and metadata distributions instead of waiting for
+        autovacuum. Not run by add() itself, since ingestion calls it in many
+        small batches.
+        """
+        if not self._pool:
+            raise RuntimeError("Store not initialized. Call initialize() first.")
+
+        async with self._pool.acquire() as conn:
+            await conn.execute(f"ANALYZE {self.table_name}")
+
     async def query(
         self,
         query_embedding: list[float],
         n_results: int = 10,
         where: dict | None = None,
+        ef_search: int | None = None,
     ) -> list[QueryResult]:
         """
         Query for similar chunks.
 
         Args:
-            query_embedding: The query vector to search with.
+            query_embedding: The query vector to search with, as a list of
+                floats or a numpy array.
             n_results: Maximum number of results to return.
-            where: Optional metadata filter conditions.
+            where: Optional metadata filter conditions. Plain values are matched
+                with JSONB containment, so they must have the stored JSON type
+                (e.g. ``{"difficulty": 2}``, not ``{"difficulty": "2"}``).
+                Operator values such as ``{"difficulty": {"$lte": 3}}`` are
+                compared in SQL ($eq, $ne, $gt, $gte, $lt, $lte and $in).
+            ef_search: Override hnsw_ef_search for this call, e.g. higher for
+                recall-sensitive paths or lower for latency-sensitive ones.
 
         Returns:
             list[QueryResult]: List of matching chunks with similarity scores.
@@ -175,54 +698,72 @@ class PgVectorStore(BaseVectorStore):
         if not self._pool:
             raise RuntimeError("Store not initialized. Call initialize() first.")
 
+        if self.distance == "inner_product":
+            query_embedding = _normalize_rows(query_embedding)
+
+        # Convert query_embedding to vector format; also the cache key's vector part
+        query_vec = _list_to_vector(query_embedding)
+
+        cache_key = None
+        if self.query_cache_size > 0:
+            cache_key = (
+                query_vec,
+                n_results,
+                ef_search,
+                filter_cache_key(where),
+            )
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                self._query_cache.move_to_end(cache_key)
+                return copy_results(cached)
+
+        generation = self._cache_generation
+
         async with self._pool.acquire() as conn:
             # Build WHERE clause for metadata filtering
             where_clause = ""
-            params: list[Any] = [query_embedding, n_results]
+            params: list[Any] = [query_vec, n_results]
 
             if where:
-                # Simple equality filter on metadata JSONB
-                conditions = []
-                for key, value in where.items():
-                    param_index = len(params) + 1
-                    # Use ->> to extract as text and compare
-                    conditions.append(f"metadata->>'{key}' = ${param_index}")
-                    params.append(value)
+                where_clause = f"WHERE {_where_to_sql(where, params)}"
 
-                where_clause = "WHERE " + " AND ".join(conditions)
-
-            # Use cosine distance (1 - cosine similarity)
-            # Lower distance = more similar
-            # Convert query_embedding to vector format
-            query_vec = _list_to_vector(query_embedding)
+            # Lower distance = more similar; the distance is computed once and
+            # converted to a similarity score below
 
             query = f"""
                 SELECT
                     id,
                     content,
                     metadata,
-                    1 - (embedding <=> $1::vector) as similarity
+                    embedding {self._distance_op} $1::{self._vector_type} AS distance
                 FROM {self.table_name}
                 {where_clause}
-                ORDER BY embedding <=> $1::vector
+                ORDER BY distance
                 LIMIT $2
             """
 
-            # Update params to use converted vector string
-            params[0] = query_vec
-            rows = await conn.fetch(query, *params)
+            async with conn.transaction():
+                await self._apply_search_settings(conn, ef_search)
+                rows = await conn.fetch(query, *params)
+
+        # Cosine similarity is 1 - distance; <#> is the negated inner product
+        offset = 0.0 if self.distance == "inner_product" else 1.0
+        results = [
+            QueryResult(
+                id=row["id"],
+                content=row["content"],
+                metadata=row["metadata"],
+                score=offset - row["distance"],
+            )
+            for row in rows
+        ]
 
-            results = []
-            for row in rows:
-                result = QueryResult(
-                    id=row["id"],
-                    content=row["content"],
-                    metadata=json.loads(row["metadata"]) if isinstance(row["metadata"], str) else row["metadata"],
-                    score=float(row["similarity"]),
-                )
-                results.append(result)
+        if cache_key is not None and generation == self._cache_generation:
+            self._query_cache[cache_key] = copy_results(results)
+            if len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)  # Remove oldest
 
-            return results
+        return results
 
     async def fulltext_search(
         self,
@@ -236,7 +777,7 @@ class PgVectorStore(BaseVectorStore):
         Args:
             query_text: The text query to search for.
             n_results: Maximum number of results to return.
-            where: Optional metadata filter conditions.
+            where: Optional metadata filter conditions, as for query().
 
         Returns:
             list[QueryResult]: List of matching chunks with BM25-like scores.
@@ -244,33 +785,17 @@ class PgVectorStore(BaseVectorStore):
         if not self._pool:
             raise RuntimeError("Store not initialized. Call initialize() first.")
 
-        async with self._pool.acquire() as conn:
-            # Convert query to tsquery format
-            # First, sanitize: remove special characters that break tsquery
-            import re
-            sanitized = re.sub(r'[^\w\s\'-]', ' ', query_text)  # Keep alphanumeric, spaces, hyphens, apostrophes
-
-            # Split into words
-            words = sanitized.lower().split()
-            # Filter out very short words and common stop words
-            words = [w for w in words if len(w) > 2 and w not in {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'was', 'her', 'have'}]
-
-            if not words:
-                return []
-
-            ts_query = ' | '.join(words)  # OR for broader matching
+        ts_query = _to_ts_query(query_text)
+        if ts_query is None:
+            return []
 
+        async with self._pool.acquire() as conn:
             # Build WHERE clause
             where_clause = "WHERE content_tsv @@ to_tsquery('english', $1)"
             params: list[Any] = [ts_query, n_results]
 
             if where:
-                conditions = []
-                for key, value in where.items():
-                    param_index = len(params) + 1
-                    conditions.append(f"metadata->>'{key}' = ${param_index}")
-                    params.append(value)
-                where_clause += " AND " + " AND ".join(conditions)
+                where_clause += f" AND {_where_to_sql(where, params)}"
 
             query = f"""
                 SELECT
@@ -286,17 +811,15 @@ class PgVectorStore(BaseVectorStore):
 
             rows = await conn.fetch(query, *params)
 
-            results = []
-            for row in rows:
-                result = QueryResult(
+            return [
+                QueryResult(
                     id=row["id"],
                     content=row["content"],
-                    metadata=json.loads(row["metadata"]) if isinstance(row["metadata"], str) else row["metadata"],
+                    metadata=row["metadata"],
                     score=float(row["rank"]),
                 )
-                results.append(result)
-
-            return results
+                for row in rows
+            ]
 
     async def hybrid_search(
         self,
@@ -305,6 +828,7 @@ class PgVectorStore(BaseVectorStore):
         n_results: int = 10,
         semantic_weight: float = 0.7,
         where: dict | None = None,
+        ef_search: int | None = None,
     ) -> list[QueryResult]:
         """
         Perform hybrid search combining semantic and full-text search.
@@ -316,7 +840,8 @@ class PgVectorStore(BaseVectorStore):
             query_embedding: The embedding vector for semantic search.
             n_results: Maximum number of results to return.
             semantic_weight: Weight for semantic search (0-1). Full-text gets 1-weight.
-            where: Optional metadata filter conditions.
+            where: Optional metadata filter conditions, as for query().
+            ef_search: Override hnsw_ef_search for the semantic leg of this call.
 
         Returns:
             list[QueryResult]: Combined results with fused scores.
@@ -324,51 +849,76 @@ class PgVectorStore(BaseVectorStore):
         if not self._pool:
             raise RuntimeError("Store not initialized. Call initialize() first.")
 
+        if self.distance == "inner_product":
+            query_embedding = _normalize_rows(query_embedding)
+
         # Get more results from each method for better fusion
         k = n_results * 3
-
-        # Run both searches
-        semantic_results = await self.query(query_embedding, n_results=k, where=where)
-        fulltext_results = await self.fulltext_search(query_text, n_results=k, where=where)
-
-        # Reciprocal Rank Fusion (RRF)
-        # Score = sum of 1/(k + rank) for each result across methods
-        rrf_k = 60  # Constant to prevent high ranks from dominating
-
-        scores: dict[str, float] = {}
-        contents: dict[str, str] = {}
-        metadatas: dict[str, dict] = {}
-
-        # Add semantic results with weight
-        for rank, result in enumerate(semantic_results):
-            rrf_score = semantic_weight * (1.0 / (rrf_k + rank + 1))
-            scores[result.id] = scores.get(result.id, 0) + rrf_score
-            contents[result.id] = result.content
-            metadatas[result.id] = result.metadata
-
-        # Add full-text results with weight
-        fulltext_weight = 1.0 - semantic_weight
-        for rank, result in enumerate(fulltext_results):
-            rrf_score = fulltext_weight * (1.0 / (rrf_k + rank + 1))
-            scores[result.id] = scores.get(result.id, 0) + rrf_score
-            contents[result.id] = result.content
-            metadatas[result.id] = result.metadata
-
-        # Sort by combined score
-        sorted_ids = sorted(scores.keys(), key=lambda x: scores[x], reverse=True)
-
-        # Build results
-        results = []
-        for id_ in sorted_ids[:n_results]:
-            result = QueryResult(
-                id=id_,
-                content=contents[id_],
-                metadata=metadatas[id_],
-                score=scores[id_],
+        ts_query = _to_ts_query(query_text)
+
+        params: list[Any] = [_list_to_vector(query_embedding), k, n_results, semantic_weight]
+        filter_sql = ""
+        if where:
+            filter_sql = _where_to_sql(where, params)
+
+        if ts_query is not None:
+            params.append(ts_query)
+            fulltext_cte = f"""
+                SELECT id, row_number() OVER (ORDER BY rank DESC) AS rank
+                FROM (
+                    SELECT id, ts_rank(content_tsv, q) AS rank
+                    FROM {self.table_name}, to_tsquery('english', ${len(params)}) AS q
+                    WHERE content_tsv @@ q {"AND " + filter_sql if filter_sql else ""}
+                    ORDER BY rank DESC
+                    LIMIT $2
+                ) matched
+            """
+        else:
+            # Nothing searchable in the text; the full-text leg contributes nothing
+            fulltext_cte = "SELECT NULL::text AS id, NULL::bigint AS rank WHERE false"
+
+        # Reciprocal Rank Fusion (RRF), computed in a single round trip:
+        # score = sum over methods of weight / (RRF_K + rank)
+        query = f"""
+            WITH semantic AS (
+                SELECT id, row_number() OVER (ORDER BY distance) AS rank
+                FROM (
+                    SELECT id, embedding {self._distance_op} $1::{self._vector_type} AS distance
+                    FROM {self.table_name}
+                    {"WHERE " + filter_sql if filter_sql else ""}
+                    ORDER BY distance
+                    LIMIT $2
+                ) nearest
+            ),
+            fulltext AS ({fulltext_cte}),
+            fused AS (
+                SELECT
+                    COALESCE(s.id, f.id) AS id,
+                    COALESCE($4::float8 / ({_RRF_K} + s.rank), 0)
+                        + COALESCE((1 - $4::float8) / ({_RRF_K} + f.rank), 0) AS score
+                FROM semantic s
+                FULL OUTER JOIN fulltext f ON s.id = f.id
             )
-            results.append(result)
+            SELECT c.id, c.content, c.metadata, fused.score
+            FROM fused
+            JOIN {self.table_name} c ON c.id = fused.id
+            ORDER BY fused.score DESC
+            LIMIT $3
+        """
 
-        return results
+        async with self._pool.acquire() as conn, conn.transaction():
+            await self._apply_search_settings(conn, ef_search)
+            rows = await conn.fetch(query, *params)
+
+        return [
+            QueryResult(
+                id=row["id"],
+                content=row["content"],
+                metadata=row["metadata"],
+                score=float(row["score"]),
+            )
+            for row in rows
+        ]
 
     async def delete(self, ids: list[str]) -> None:
         """
@@ -380,19 +930,31 @@ class PgVectorStore(BaseVectorStore):
         if not self._pool:
             raise RuntimeError("Store not initialized. Call initialize() first.")
 
-        async with self._pool.acquire() as conn:
-            await conn.execute(
-                f"DELETE FROM {self.table_name} WHERE id = ANY($1)",
-                ids,
-            )
+        try:
+            async with self._pool.acquire() as conn, conn.transaction():
+                # UNNEST lets the planner hash-join against the id list; large
+                # lists are sent in batches to keep each array payload small
+                for start in range(0, len(ids), _DELETE_BATCH_SIZE):
+                    await conn.execute(
+                        f"""
+                        DELETE FROM {self.table_name}
+                        WHERE id IN (SELECT UNNEST($1::text[]))
+                        """,
+                        ids[start : start + _DELETE_BATCH_SIZE],
+                    )
+        finally:
+            self._invalidate_caches()
 
     async def delete_all(self) -> None:
         """Delete all chunks from the store."""
         if not self._pool:
             return
 
-        async with self._pool.acquire() as conn:
-            await conn.execute(f"TRUNCATE TABLE {self.table_name}")
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(f"TRUNCATE TABLE {self.table_name}")
+        finally:
+            self._invalidate_caches()
 
     async def close(self) -> None:
         """Close the database connection pool."""
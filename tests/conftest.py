@@ -3,6 +3,7 @@ Pytest configuration and shared fixtures for Calculus RAG tests.
 """
 
 import os
+import socket
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -10,6 +11,12 @@ from unittest.mock import MagicMock
 
 import pytest
 
+# Share one HuggingFace model cache across pytest-xdist workers so slow
+# embedding tests download each model at most once, and keep tokenizer
+# thread pools from oversubscribing cores when several workers run at once.
+os.environ.setdefault("HF_HOME", str(Path.home() / ".cache" / "huggingface"))
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
 
 # =============================================================================
 # Path Fixtures
@@ -29,10 +36,14 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def sample_docs_dir(temp_dir: Path) -> Path:
-    """Create a sample documents directory with test content."""
-    docs_dir = temp_dir / "knowledge_content"
+@pytest.fixture(scope="session")
+def sample_docs_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Create a sample documents directory with test content.
+
+    Built once per session; tests must treat it as read-only.
+    """
+    docs_dir = tmp_path_factory.mktemp("sample_docs") / "knowledge_content"
 
     # Create pre-calculus content
     precalc_dir = docs_dir / "pre_calculus" / "algebra"
@@ -214,6 +225,38 @@ def sample_student() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def calc_topics() -> dict[str, dict]:
+    """
+    Return the calculus topic catalog, fetched once per session.
+
+    The dict is shared between tests; treat it as read-only.
+    """
+    from calculus_rag.prerequisites.topics import get_calculus_topics
+
+    return get_calculus_topics()
+
+
+# =============================================================================
+# Service Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def ollama_available() -> bool:
+    """
+    Return whether an Ollama server is listening on the default local port.
+
+    Probes with a short TCP connect so integration tests can skip immediately
+    instead of waiting on the client's request timeout.
+    """
+    try:
+        with socket.create_connection(("localhost", 11434), timeout=0.1):
+            return True
+    except OSError:
+        return False
+
+
 # =============================================================================
 # Markers
 # =============================================================================
@@ -224,3 +267,5 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "unit: Unit tests")
     config.addinivalue_line("markers", "integration: Integration tests")
     config.addinivalue_line("markers", "slow: Slow running tests")
+    # Registered here too so the marker is known when pytest-xdist is absent
+    config.addinivalue_line("markers", "xdist_group(name): Run on a single xdist worker")
@@ -0,0 +1,22 @@
+"""
+Shared fixtures for embedding tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def bge_embedder():
+    """
+    Load the BGE model once per test session.
+
+    Model loading dominates the cost of the slow embedding tests, so every
+    test that only queries the model reuses this instance. bfloat16 is
+    requested for speed; the embedder falls back to float32 on CPUs without
+    native support, and the tests' tolerances cover either precision.
+    """
+    from calculus_rag.embeddings.bge_embedder import BGEEmbedder
+
+    return BGEEmbedder(
+        model_name="BAAI/bge-base-en-v1.5", device="cpu", dtype="bfloat16"
+    )
@@ -4,17 +4,29 @@ Tests for BGE embedder implementation.
 TDD: These tests define the expected behavior before implementation.
 """
 
+import numpy as np
 import pytest
 
+# Importing the embedder pulls in torch; skip cleanly where it is not installed.
+pytest.importorskip("sentence_transformers")
 
+from calculus_rag.embeddings.bge_embedder import BGEEmbedder  # noqa: E402
+
+
+def _embedder_on(device: str) -> BGEEmbedder:
+    """Build an embedder for ``device`` without loading a model."""
+    embedder = BGEEmbedder.__new__(BGEEmbedder)
+    embedder.device = device
+    return embedder
+
+
+@pytest.mark.xdist_group("bge_embedder")
 class TestBGEEmbedder:
     """Test the BGE embedder implementation."""
 
     @pytest.mark.slow
     def test_bge_embedder_initialization(self) -> None:
         """Should initialize with model name and device."""
-        from calculus_rag.embeddings.bge_embedder import BGEEmbedder
-
         embedder = BGEEmbedder(
             model_name="BAAI/bge-base-en-v1.5",
             device="cpu",
@@ -23,154 +35,253 @@ class TestBGEEmbedder:
         assert embedder.model_name == "BAAI/bge-base-en-v1.5"
         assert embedder.device == "cpu"
 
+    def test_rejects_unknown_dtype(self) -> None:
+        """Should reject an unsupported precision before loading the model."""
+        with pytest.raises(ValueError, match="dtype"):
+            BGEEmbedder(dtype="int8")
+
+    @pytest.mark.parametrize(
+        ("avx512_bf16", "amx", "expected"),
+        [
+            (False, False, "float32"),  # e.g. Skylake-X: AVX512 but no BF16 instructions
+            (True, False, "bfloat16"),
+            (False, True, "bfloat16"),
+        ],
+    )
+    def test_bfloat16_requires_native_cpu_support(
+        self, avx512_bf16: bool, amx: bool, expected: str
+    ) -> None:
+        """Should only keep bfloat16 on CPUs with AVX512-BF16 or AMX instructions."""
+        from unittest.mock import patch
+
+        import torch
+
+        embedder = _embedder_on("cpu")
+
+        with (
+            patch.object(torch.backends.mkldnn, "is_available", return_value=True),
+            patch.object(
+                torch.cpu, "_is_avx512_bf16_supported", create=True, return_value=avx512_bf16
+            ),
+            patch.object(torch.cpu, "_is_amx_tile_supported", create=True, return_value=amx),
+        ):
+            assert embedder._resolve_dtype("bfloat16") == expected
+            assert embedder._resolve_dtype("float16") == "float32"
+
+    @pytest.mark.parametrize(
+        ("flags", "expected"),
+        [
+            ("fpu sse avx2 avx512f", "float32"),
+            ("fpu sse avx2 avx512f avx512_bf16", "bfloat16"),
+            ("fpu sse avx2 amx_tile amx_bf16", "bfloat16"),
+        ],
+    )
+    def test_bfloat16_falls_back_to_cpuinfo_flags(
+        self, flags: str, expected: str, monkeypatch
+    ) -> None:
+        """Should read /proc/cpuinfo when torch does not report bfloat16 support."""
+        import io
+
+        import torch
+
+        monkeypatch.setattr(torch.backends.mkldnn, "is_available", lambda: True)
+        monkeypatch.delattr(torch.cpu, "_is_avx512_bf16_supported", raising=False)
+        monkeypatch.delattr(torch.cpu, "_is_amx_tile_supported", raising=False)
+        monkeypatch.setattr(
+            "builtins.open", lambda *args, **kwargs: io.StringIO(f"flags\t\t: {flags}\n")
+        )
+
+        assert _embedder_on("cpu")._resolve_dtype("bfloat16") == expected
+
+    def test_bfloat16_requires_mkldnn(self, monkeypatch) -> None:
+        """Should keep float32 on CPU when torch is built without oneDNN."""
+        import torch
+
+        monkeypatch.setattr(torch.backends.mkldnn, "is_available", lambda: False)
+        monkeypatch.setattr(torch.cpu, "_is_amx_tile_supported", lambda: True, raising=False)
+        monkeypatch.setattr(torch.cpu, "_is_avx512_bf16_supported", lambda: True, raising=False)
+
+        assert _embedder_on("cpu")._resolve_dtype("bfloat16") == "float32"
+
+    @pytest.mark.parametrize(("native", "expected"), [(True, "bfloat16"), (False, "float32")])
+    def test_cpu_dtype_follows_detector(self, native: bool, expected: str, monkeypatch) -> None:
+        """Should keep bfloat16 on CPU only when the detector reports native support."""
+        monkeypatch.setattr(
+            "calculus_rag.embeddings.bge_embedder._cpu_has_native_bf16", lambda: native
+        )
+
+        assert _embedder_on("cpu")._resolve_dtype("bfloat16") == expected
+
+    def test_detector_errors_fall_back_to_float32(self, monkeypatch) -> None:
+        """Should fall back to float32 instead of failing when detection raises."""
+
+        def broken() -> bool:
+            raise RuntimeError("cpuinfo unavailable")
+
+        monkeypatch.setattr("calculus_rag.embeddings.bge_embedder._cpu_has_native_bf16", broken)
+
+        assert _embedder_on("cpu")._resolve_dtype("bfloat16") == "float32"
+
+    @pytest.mark.parametrize(
+        ("bf16_supported", "dtype", "expected"),
+        [
+            (True, "bfloat16", "bfloat16"),
+            (False, "bfloat16", "float32"),  # e.g. pre-Ampere GPUs
+            (False, "float16", "float16"),
+        ],
+    )
+    def test_cuda_dtype_is_validated(
+        self, bf16_supported: bool, dtype: str, expected: str, monkeypatch
+    ) -> None:
+        """Should only keep bfloat16 on GPUs that support it."""
+        import torch
+
+        monkeypatch.setattr(torch.cuda, "is_bf16_supported", lambda *args: bf16_supported)
+
+        assert _embedder_on("cuda")._resolve_dtype(dtype) == expected
+        assert _embedder_on("cuda:1")._resolve_dtype(dtype) == expected
+
+    @pytest.mark.parametrize(("allocates", "expected"), [(True, "bfloat16"), (False, "float32")])
+    def test_mps_dtype_is_validated(self, allocates: bool, expected: str, monkeypatch) -> None:
+        """Should fall back to float32 when MPS cannot allocate the requested dtype."""
+        import torch
+
+        def zeros(*args, **kwargs):
+            if not allocates:
+                raise TypeError("BFloat16 is not supported on MPS")
+
+        monkeypatch.setattr(torch, "zeros", zeros)
+
+        assert _embedder_on("mps")._resolve_dtype("bfloat16") == expected
+
+    def test_unknown_device_keeps_float32(self) -> None:
+        """Should not guess reduced-precision support on devices it cannot check."""
+        embedder = _embedder_on("xpu")
+
+        assert embedder._resolve_dtype("float16") == "float32"
+        assert embedder._resolve_dtype("float32") == "float32"
+
     @pytest.mark.slow
-    def test_bge_embedder_has_correct_dimension(self) -> None:
+    def test_bge_embedder_has_correct_dimension(self, bge_embedder) -> None:
         """Should report correct embedding dimension."""
-        from calculus_rag.embeddings.bge_embedder import BGEEmbedder
-
         # bge-base has 768 dimensions
-        embedder = BGEEmbedder(model_name="BAAI/bge-base-en-v1.5", device="cpu")
-
-        assert embedder.dimension == 768
+        assert bge_embedder.dimension == 768
 
     @pytest.mark.slow
-    def test_embed_single_text(self) -> None:
+    def test_embed_single_text(self, bge_embedder) -> None:
         """Should embed a single text string."""
-        from calculus_rag.embeddings.bge_embedder import BGEEmbedder
-
-        embedder = BGEEmbedder(model_name="BAAI/bge-base-en-v1.5", device="cpu")
         text = "The derivative of x^2 is 2x."
 
-        embedding = embedder.embed(text)
+        embedding = bge_embedder.embed(text)
 
         assert isinstance(embedding, list)
-        assert len(embedding) == 768
-        assert all(isinstance(x, float) for x in embedding)
+        arr = np.asarray(embedding)
+        assert arr.shape == (768,)
+        assert arr.dtype.kind == "f"
 
     @pytest.mark.slow
-    def test_embed_batch_multiple_texts(self) -> None:
+    def test_embed_batch_multiple_texts(self, bge_embedder) -> None:
         """Should embed multiple texts in a batch."""
-        from calculus_rag.embeddings.bge_embedder import BGEEmbedder
-
-        embedder = BGEEmbedder(model_name="BAAI/bge-base-en-v1.5", device="cpu")
         texts = [
             "The derivative of x^2 is 2x.",
             "Integration is the reverse of differentiation.",
             "A limit describes the value a function approaches.",
         ]
 
-        embeddings = embedder.embed_batch(texts)
+        embeddings = bge_embedder.embed_batch(texts)
 
-        assert len(embeddings) == 3
-        assert all(len(emb) == 768 for emb in embeddings)
-        assert all(isinstance(x, float) for emb in embeddings for x in emb)
+        arr = np.asarray(embeddings)
+        assert arr.shape == (len(texts), 768)
+        assert arr.dtype.kind == "f"
 
     @pytest.mark.slow
-    def test_embed_returns_normalized_vectors(self) -> None:
+    def test_embed_returns_normalized_vectors(self, bge_embedder) -> None:
         """Embeddings should be normalized (unit vectors)."""
-        import math
-
-        from calculus_rag.embeddings.bge_embedder import BGEEmbedder
-
-        embedder = BGEEmbedder(model_name="BAAI/bge-base-en-v1.5", device="cpu")
-        embedding = embedder.embed("Test text")
+        embedding = np.asarray(bge_embedder.embed("Test text"), dtype=np.float32)
 
         # Calculate magnitude
-        magnitude = math.sqrt(sum(x * x for x in embedding))
+        magnitude = np.linalg.norm(embedding)
 
         # Should be approximately 1.0 (unit vector)
         assert abs(magnitude - 1.0) < 0.01
 
     @pytest.mark.slow
-    def test_similar_texts_have_similar_embeddings(self) -> None:
+    def test_similar_texts_have_similar_embeddings(self, bge_embedder) -> None:
         """Similar texts should have high cosine similarity."""
-        from calculus_rag.embeddings.bge_embedder import BGEEmbedder
-
-        embedder = BGEEmbedder(model_name="BAAI/bge-base-en-v1.5", device="cpu")
-
         text1 = "The derivative measures the rate of change."
         text2 = "Derivatives measure how functions change."
         text_different = "The color of the sky is blue."
 
-        emb1 = embedder.embed(text1)
-        emb2 = embedder.embed(text2)
-        emb_diff = embedder.embed(text_different)
+        emb1, emb2, emb_diff = np.asarray(
+            bge_embedder.embed_batch([text1, text2, text_different]),
+            dtype=np.float32,
+        )
 
         # Cosine similarity (dot product since vectors are normalized)
-        sim_similar = sum(a * b for a, b in zip(emb1, emb2))
-        sim_different = sum(a * b for a, b in zip(emb1, emb_diff))
+        sim_similar = float(emb1 @ emb2)
+        sim_different = float(emb1 @ emb_diff)
 
         # Similar texts should have higher similarity
         assert sim_similar > sim_different
         assert sim_similar > 0.5  # Should be reasonably similar
 
     @pytest.mark.slow
-    def test_embed_handles_empty_string(self) -> None:
+    def test_embed_handles_empty_string(self, bge_embedder) -> None:
         """Should handle empty string gracefully."""
-        from calculus_rag.embeddings.bge_embedder import BGEEmbedder
-
-        embedder = BGEEmbedder(model_name="BAAI/bge-base-en-v1.5", device="cpu")
-
         # Should either return a valid embedding or raise a clear error
         try:
-            embedding = embedder.embed("")
+            embedding = bge_embedder.embed("")
             assert len(embedding) == 768
         except ValueError as e:
             assert "empty" in str(e).lower() or "blank" in str(e).lower()
 
     @pytest.mark.slow
-    def test_embed_batch_preserves_order(self) -> None:
+    def test_embed_batch_preserves_order(self, bge_embedder) -> None:
         """Batch embeddings should maintain input order."""
-        from calculus_rag.embeddings.bge_embedder import BGEEmbedder
-
-        embedder = BGEEmbedder(model_name="BAAI/bge-base-en-v1.5", device="cpu")
-
         texts = ["First text", "Second text", "Third text"]
 
-        batch_embeddings = embedder.embed_batch(texts)
-        individual_embeddings = [embedder.embed(text) for text in texts]
+        # One forward pass over the texts followed by the same texts reversed:
+        # if order is preserved, each half is the mirror image of the other.
+        embeddings = np.asarray(
+            bge_embedder.embed_batch(texts + texts[::-1]), dtype=np.float32
+        )
+        forward, backward = embeddings[: len(texts)], embeddings[len(texts) :]
 
-        # Batch should match individual (order preserved)
-        for batch_emb, ind_emb in zip(batch_embeddings, individual_embeddings):
-            # Check they're very similar (allowing for minor floating point differences)
-            diff = sum(abs(a - b) for a, b in zip(batch_emb, ind_emb))
-            assert diff < 0.01
+        # Allow for minor floating point differences
+        assert np.abs(forward - backward[::-1]).sum(axis=1).max() < 0.01
+        # And the texts themselves must not collapse to the same vector
+        assert np.abs(forward[0] - forward[1]).sum() > 0.01
 
 
+@pytest.mark.xdist_group("bge_embedder")
 class TestBGEEmbedderWithMath:
     """Test BGE embedder with mathematical content."""
 
     @pytest.mark.slow
-    def test_embed_latex_content(self) -> None:
+    def test_embed_latex_content(self, bge_embedder) -> None:
         """Should embed text containing LaTeX."""
-        from calculus_rag.embeddings.bge_embedder import BGEEmbedder
-
-        embedder = BGEEmbedder(model_name="BAAI/bge-base-en-v1.5", device="cpu")
-
         text = "The formula $\\frac{d}{dx}(x^n) = nx^{n-1}$ is the power rule."
-        embedding = embedder.embed(text)
+        embedding = bge_embedder.embed(text)
 
-        assert len(embedding) == 768
         # Should produce valid embedding despite LaTeX
-        assert all(isinstance(x, float) for x in embedding)
+        arr = np.asarray(embedding)
+        assert arr.shape == (768,)
+        assert arr.dtype.kind == "f"
 
     @pytest.mark.slow
-    def test_math_similarity(self) -> None:
+    def test_math_similarity(self, bge_embedder) -> None:
         """Math-related texts should cluster together."""
-        from calculus_rag.embeddings.bge_embedder import BGEEmbedder
-
-        embedder = BGEEmbedder(model_name="BAAI/bge-base-en-v1.5", device="cpu")
-
         calc_text1 = "Differentiation is the process of finding derivatives."
         calc_text2 = "Integration is the process of finding integrals."
         unrelated = "The weather is sunny today."
 
-        emb1 = embedder.embed(calc_text1)
-        emb2 = embedder.embed(calc_text2)
-        emb_unrelated = embedder.embed(unrelated)
+        emb1, emb2, emb_unrelated = np.asarray(
+            bge_embedder.embed_batch([calc_text1, calc_text2, unrelated]),
+            dtype=np.float32,
+        )
 
-        sim_calc = sum(a * b for a, b in zip(emb1, emb2))
-        sim_unrelated = sum(a * b for a, b in zip(emb1, emb_unrelated))
+        sim_calc = float(emb1 @ emb2)
+        sim_unrelated = float(emb1 @ emb_unrelated)
 
         # Calculus topics should be more similar to each other
         assert sim_calc > sim_unrelated
@@ -0,0 +1,63 @@
+"""
+Shared fixtures for knowledge base tests.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from calculus_rag.knowledge_base.loader import DocumentLoader
+from calculus_rag.knowledge_base.models import Document
+
+
+@pytest.fixture(scope="session")
+def loader_corpus(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Build a read-only markdown corpus once per test session.
+
+    Layout:
+        recursive/calculus/limits/intro.md
+        recursive/calculus/derivatives/power_rule.md
+        mixed/test.md, mixed/readme.txt, mixed/image.png
+
+    Tests that write files should use ``tmp_path`` instead.
+    """
+    root = tmp_path_factory.mktemp("corpus")
+
+    calculus = root / "recursive" / "calculus"
+    (calculus / "limits").mkdir(parents=True)
+    (calculus / "derivatives").mkdir(parents=True)
+    (calculus / "limits" / "intro.md").write_text("""---
+topic: limits.intro
+difficulty: 1
+prerequisites: []
+---
+# Limits Intro
+""")
+    (calculus / "derivatives" / "power_rule.md").write_text("""---
+topic: derivatives.power_rule
+difficulty: 2
+prerequisites: [limits.intro]
+---
+# Power Rule
+""")
+
+    mixed = root / "mixed"
+    mixed.mkdir()
+    (mixed / "test.md").write_text("""---
+topic: test
+difficulty: 1
+prerequisites: []
+---
+# Test
+""")
+    (mixed / "readme.txt").write_text("Not markdown")
+    (mixed / "image.png").write_text("Binary data")
+
+    return root
+
+
+@pytest.fixture(scope="session")
+def loaded_sample_docs(sample_docs_dir: Path) -> list[Document]:
+    """Load the shared sample documents once; tests must not mutate them."""
+    return DocumentLoader().load_directory(str(sample_docs_dir))
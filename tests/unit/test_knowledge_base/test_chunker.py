@@ -4,50 +4,62 @@ Tests for smart document chunker.
 TDD: These tests define the expected chunking behavior before implementation.
 """
 
+from dataclasses import replace
+
 import pytest
 
+from calculus_rag.knowledge_base.chunker import DocumentChunker
+from calculus_rag.knowledge_base.models import Document, DocumentMetadata
 
-class TestDocumentChunker:
-    """Test the DocumentChunker class."""
+# Shared by every document that doesn't override metadata; chunks only read it.
+_DEFAULT_METADATA = DocumentMetadata(topic="test", difficulty=1, prerequisites=[])
 
-    def test_chunk_simple_document(self) -> None:
-        """Should split a simple document into chunks."""
-        from calculus_rag.knowledge_base.chunker import DocumentChunker
-        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
+_SENTENCES = "# Title\n\n" + "This is a sentence. " * 100
 
-        doc = Document(
-            content="# Title\n\n" + "This is a sentence. " * 100,
-            metadata=DocumentMetadata(topic="test", difficulty=1, prerequisites=[]),
-        )
+_INLINE_FORMULA = "$\\frac{d}{dx}(x^n) = nx^{n-1}$"
+_DISPLAY_FORMULA = "$$\\int_0^\\infty e^{-x^2} dx = \\frac{\\sqrt{\\pi}}{2}$$"
 
-        chunker = DocumentChunker(chunk_size=200, chunk_overlap=20)
-        chunks = chunker.chunk_document(doc)
 
-        assert len(chunks) > 1
-        assert all(chunk.document_id == doc.id for chunk in chunks)
-        assert all(chunk.metadata.topic == "test" for chunk in chunks)
+def _make_doc(content: str, **md_overrides) -> Document:
+    """Build a Document, validating metadata only when it differs from the default."""
+    if md_overrides:
+        metadata = replace(_DEFAULT_METADATA, **md_overrides)
+    else:
+        metadata = _DEFAULT_METADATA
+    return Document(content=content, metadata=metadata)
 
-    def test_chunks_have_sequential_indices(self) -> None:
-        """Chunks should have sequential indices starting from 0."""
-        from calculus_rag.knowledge_base.chunker import DocumentChunker
-        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
 
-        doc = Document(
-            content="# Title\n\n" + "This is a sentence. " * 100,
-            metadata=DocumentMetadata(topic="test", difficulty=1, prerequisites=[]),
-        )
+class TestDocumentChunker:
+    """Test the DocumentChunker class."""
 
-        chunker = DocumentChunker(chunk_size=200, chunk_overlap=20)
+    @pytest.mark.parametrize(
+        "chunk_size,chunk_overlap,content,single_chunk",
+        [
+            pytest.param(200, 20, _SENTENCES, False, id="simple"),
+            pytest.param(100, 20, "word " * 200, False, id="overlap"),
+            pytest.param(1000, 0, "This is a small document.", True, id="small"),
+        ],
+    )
+    def test_chunk_document(
+        self, chunk_size: int, chunk_overlap: int, content: str, single_chunk: bool
+    ) -> None:
+        """Should split by chunk_size, keeping sequential indices and document metadata."""
+        doc = _make_doc(content)
+
+        chunker = DocumentChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
         chunks = chunker.chunk_document(doc)
 
-        indices = [chunk.chunk_index for chunk in chunks]
-        assert indices == list(range(len(chunks)))
+        if single_chunk:
+            assert len(chunks) == 1
+            assert chunks[0].content == content
+        else:
+            assert len(chunks) > 1
+        assert [chunk.chunk_index for chunk in chunks] == list(range(len(chunks)))
+        assert all(chunk.document_id == doc.id for chunk in chunks)
+        assert all(chunk.metadata.topic == "test" for chunk in chunks)
 
     def test_chunk_respects_latex_boundaries(self) -> None:
         """Should not split LaTeX formulas."""
-        from calculus_rag.knowledge_base.chunker import DocumentChunker
-        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
-
         content = """# Derivatives
 
 The derivative of $f(x) = x^2$ is $f'(x) = 2x$.
@@ -56,10 +68,7 @@ $$\\int_a^b f(x) dx = F(b) - F(a)$$
 
 More text here.
 """
-        doc = Document(
-            content=content,
-            metadata=DocumentMetadata(topic="test", difficulty=1, prerequisites=[]),
-        )
+        doc = _make_doc(content)
 
         chunker = DocumentChunker(chunk_size=100, chunk_overlap=10)
         chunks = chunker.chunk_document(doc)
@@ -71,9 +80,6 @@ More text here.
 
     def test_chunk_respects_section_boundaries(self) -> None:
         """Should prefer splitting at section boundaries."""
-        from calculus_rag.knowledge_base.chunker import DocumentChunker
-        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
-
         content = """# Title
 
 ## Section 1
@@ -88,10 +94,7 @@ Content for section 2.
 
 Content for section 3.
 """
-        doc = Document(
-            content=content,
-            metadata=DocumentMetadata(topic="test", difficulty=1, prerequisites=[]),
-        )
+        doc = _make_doc(content)
 
         chunker = DocumentChunker(chunk_size=100, chunk_overlap=0)
         chunks = chunker.chunk_document(doc)
@@ -105,15 +108,9 @@ Content for section 3.
 
     def test_chunk_with_overlap(self) -> None:
         """Chunks should have specified overlap."""
-        from calculus_rag.knowledge_base.chunker import DocumentChunker
-        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
-
         content = "word " * 200  # 200 words
 
-        doc = Document(
-            content=content,
-            metadata=DocumentMetadata(topic="test", difficulty=1, prerequisites=[]),
-        )
+        doc = _make_doc(content)
 
         chunker = DocumentChunker(chunk_size=100, chunk_overlap=20)
         chunks = chunker.chunk_document(doc)
@@ -124,67 +121,34 @@ Content for section 3.
             first_end = chunks[0].content[-50:]
             second_start = chunks[1].content[:50]
             # Should have at least some common words
-            assert any(word in second_start for word in first_end.split() if len(word) > 3)
-
-    def test_chunk_small_document_returns_single_chunk(self) -> None:
-        """Should return single chunk for documents smaller than chunk_size."""
-        from calculus_rag.knowledge_base.chunker import DocumentChunker
-        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
-
-        content = "This is a small document."
-
-        doc = Document(
-            content=content,
-            metadata=DocumentMetadata(topic="test", difficulty=1, prerequisites=[]),
-        )
-
-        chunker = DocumentChunker(chunk_size=1000, chunk_overlap=0)
-        chunks = chunker.chunk_document(doc)
-
-        assert len(chunks) == 1
-        assert chunks[0].content == content
-        assert chunks[0].chunk_index == 0
+            end_words = {word for word in first_end.split() if len(word) > 3}
+            start_words = set(second_start.split())
+            assert end_words & start_words
 
     def test_chunk_preserves_metadata(self) -> None:
         """Chunks should inherit document metadata."""
-        from calculus_rag.knowledge_base.chunker import DocumentChunker
-        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
-
-        metadata = DocumentMetadata(
+        doc = _make_doc(
+            "# Title\n\n" + "Content. " * 100,
             topic="limits.introduction",
             difficulty=3,
             prerequisites=["algebra.factoring"],
             tags=["foundational"],
         )
 
-        doc = Document(
-            content="# Title\n\n" + "Content. " * 100,
-            metadata=metadata,
-        )
-
         chunker = DocumentChunker(chunk_size=200, chunk_overlap=0)
         chunks = chunker.chunk_document(doc)
 
         for chunk in chunks:
             assert chunk.metadata.topic == "limits.introduction"
             assert chunk.metadata.difficulty == 3
-            assert chunk.metadata.prerequisites == ["algebra.factoring"]
-            assert chunk.metadata.tags == ["foundational"]
+            assert chunk.metadata.prerequisites == ("algebra.factoring",)
+            assert chunk.metadata.tags == ("foundational",)
 
     def test_chunk_batch_documents(self) -> None:
         """Should chunk multiple documents at once."""
-        from calculus_rag.knowledge_base.chunker import DocumentChunker
-        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
-
         docs = [
-            Document(
-                content="# Doc 1\n\n" + "Text. " * 50,
-                metadata=DocumentMetadata(topic="topic1", difficulty=1, prerequisites=[]),
-            ),
-            Document(
-                content="# Doc 2\n\n" + "Text. " * 50,
-                metadata=DocumentMetadata(topic="topic2", difficulty=2, prerequisites=[]),
-            ),
+            _make_doc("# Doc 1\n\n" + "Text. " * 50, topic="topic1"),
+            _make_doc("# Doc 2\n\n" + "Text. " * 50, topic="topic2", difficulty=2),
         ]
 
         chunker = DocumentChunker(chunk_size=100, chunk_overlap=0)
@@ -197,48 +161,31 @@ Content for section 3.
         assert "topic2" in topics
 
 
+@pytest.fixture
+def latex_chunker() -> DocumentChunker:
+    """Chunker small enough to force splits around short formulas."""
+    return DocumentChunker(chunk_size=50, chunk_overlap=0)
+
+
 class TestLatexPreservation:
     """Test that LaTeX formulas are preserved intact."""
 
-    def test_preserves_inline_latex(self) -> None:
+    def test_preserves_inline_latex(self, latex_chunker: DocumentChunker) -> None:
         """Should keep inline LaTeX together."""
-        from calculus_rag.knowledge_base.chunker import DocumentChunker
-        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
+        content = f"The formula {_INLINE_FORMULA} is the power rule."
 
-        content = "The formula $\\frac{d}{dx}(x^n) = nx^{n-1}$ is the power rule."
-
-        doc = Document(
-            content=content,
-            metadata=DocumentMetadata(topic="test", difficulty=1, prerequisites=[]),
-        )
-
-        chunker = DocumentChunker(chunk_size=50, chunk_overlap=0)
-        chunks = chunker.chunk_document(doc)
+        chunks = latex_chunker.chunk_document(_make_doc(content))
 
         # Formula should be in exactly one chunk, not split
-        formula = "$\\frac{d}{dx}(x^n) = nx^{n-1}$"
-        chunks_with_formula = [c for c in chunks if formula in c.content]
+        chunks_with_formula = [c for c in chunks if _INLINE_FORMULA in c.content]
         assert len(chunks_with_formula) >= 1
 
-    def test_preserves_display_latex(self) -> None:
+    def test_preserves_display_latex(self, latex_chunker: DocumentChunker) -> None:
         """Should keep display LaTeX together."""
-        from calculus_rag.knowledge_base.chunker import DocumentChunker
-        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
-
-        content = """Introduction.
+        content = f"Introduction.\n\n{_DISPLAY_FORMULA}\n\nConclusion.\n"
 
-$$\\int_0^\\infty e^{-x^2} dx = \\frac{\\sqrt{\\pi}}{2}$$
-
-Conclusion.
-"""
-        doc = Document(
-            content=content,
-            metadata=DocumentMetadata(topic="test", difficulty=1, prerequisites=[]),
-        )
-
-        chunker = DocumentChunker(chunk_size=50, chunk_overlap=0)
-        chunks = chunker.chunk_document(doc)
+        chunks = latex_chunker.chunk_document(_make_doc(content))
 
         # Display formula should be intact
         all_content = "\n".join(chunk.content for chunk in chunks)
-        assert "$$\\int_0^\\infty e^{-x^2} dx = \\frac{\\sqrt{\\pi}}{2}$$" in all_content
+        assert _DISPLAY_FORMULA in all_content
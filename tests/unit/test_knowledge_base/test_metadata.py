@@ -127,6 +127,43 @@ Paragraph 2
         assert "## Section" in body
         assert "Paragraph 2" in body
 
+    def test_extract_metadata_returns_independent_copies(self) -> None:
+        """Repeated extraction of cached frontmatter should not share mutable state."""
+        from calculus_rag.knowledge_base.metadata import extract_metadata
+
+        content = """---
+topic: test
+difficulty: 1
+prerequisites:
+  - algebra.factoring
+---
+
+# Test
+"""
+        first, _ = extract_metadata(content)
+        first["source_file"] = "added.md"
+        first["prerequisites"].append("mutated")
+
+        second, _ = extract_metadata(content)
+
+        assert "source_file" not in second
+        assert second["prerequisites"] == ["algebra.factoring"]
+
+    def test_extract_metadata_uses_precompiled_frontmatter(self, monkeypatch) -> None:
+        """Should return precompiled metadata for frontmatter text it has seen at build time."""
+        from calculus_rag.knowledge_base import metadata as metadata_module
+
+        frontmatter = 'topic: precompiled.topic\ntitle: "Needs YAML"'
+        monkeypatch.setitem(
+            metadata_module.PRECOMPILED_FRONTMATTER, frontmatter, {"topic": "from.cache"}
+        )
+        metadata_module._load_frontmatter.cache_clear()
+
+        metadata, body = metadata_module.extract_metadata(f"---\n{frontmatter}\n---\n# Body\n")
+
+        assert metadata == {"topic": "from.cache"}
+        assert body == "# Body\n"
+
     def test_extract_metadata_handles_empty_prerequisites(self) -> None:
         """Should handle empty prerequisites list."""
         from calculus_rag.knowledge_base.metadata import extract_metadata
@@ -205,7 +242,7 @@ class TestCreateDocumentMetadata:
 
         assert metadata.topic == "limits.introduction"
         assert metadata.difficulty == 3
-        assert metadata.prerequisites == ["algebra.factoring"]
+        assert metadata.prerequisites == ("algebra.factoring",)
 
     def test_create_metadata_with_defaults(self) -> None:
         """Should use defaults for missing fields."""
@@ -219,7 +256,7 @@ class TestCreateDocumentMetadata:
 
         assert metadata.topic == "test.topic"
         assert metadata.difficulty == 2
-        assert metadata.prerequisites == []
+        assert metadata.prerequisites == ()
 
     def test_create_metadata_validates_difficulty(self) -> None:
         """Should validate difficulty is in range."""
@@ -243,3 +280,105 @@ class TestCreateDocumentMetadata:
 
         with pytest.raises(ValueError):
             create_document_metadata(frontmatter)
+
+
+class TestFastFrontmatter:
+    """Test the YAML-free parser for the common frontmatter shape."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "topic: limits.introduction\ndifficulty: 3\nprerequisites:\n"
+            "  - algebra.factoring\n  - functions.notation",
+            "topic: test\ndifficulty: 1\nprerequisites: []\nsource_file: calculus/limits/intro.md",
+            "topic: derivatives.power_rule\ntags:\n- foundational\n- important",
+            "topic: test\ndifficulty: invalid_number",
+            "topic: Introduction to Limits\nprerequisites:",
+            'title: "Binomial Theorem (part 2) | Khan Academy"\nnote: \'it is: fine\'',
+            "source_url: https://www.youtube.com/watch?v=-fFWWt1m9k0\nvideo_id: -fFWWt1m9k0",
+            "video_id: 4xfOq00BzJA\ntags:\n  - \"x: y\"\n  - 1e3",
+            "topic: test  \ndifficulty: 2 ",
+            "",
+        ],
+    )
+    def test_matches_yaml_for_supported_syntax(self, text: str) -> None:
+        """Should produce exactly what YAML produces for the shapes it accepts."""
+        import yaml
+
+        from calculus_rag.knowledge_base.metadata import _fast_frontmatter
+
+        assert _fast_frontmatter(text) == (yaml.safe_load(text) or {})
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            'topic: "esc\\"aped"',
+            "prerequisites: [a, b]",
+            "difficulty: 03",
+            "video_id: 0x1F",
+            "published: 2024-01-01",
+            "title: tab\there",
+            "title: next\x85line",
+            "draft: yes",
+            "topic: test  # comment",
+            "summary: |\n  block text",
+            "nested:\n  key: value",
+            "topic: test\n  - stray item",
+            # YAML keeps trailing non-ASCII whitespace as part of the value
+            "topic: \xa0",
+            "title: Limits\u3000",
+            "tags:\n  - x\u2003",
+        ],
+    )
+    def test_defers_to_yaml_for_other_syntax(self, text: str) -> None:
+        """Should return None for anything outside the restricted grammar."""
+        from calculus_rag.knowledge_base.metadata import _fast_frontmatter
+
+        assert _fast_frontmatter(text) is None
+
+
+class TestRymlFrontmatter:
+    """Test the optional RapidYAML frontmatter backend."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            'topic: precalculus.khan_academy\ntitle: "Permutations | Khan Academy"\n'
+            "source_url: https://www.youtube.com/watch?v=XqQTXW7XfYA\ndifficulty: 2",
+            "topic: test\nprerequisites: [a, 'b c', 3]\ntags:\n  - x\n  - y",
+            "title: 'it''s'\nnote: \"caf\\u00e9\"\nempty:\nnothing: ~",
+        ],
+    )
+    def test_matches_yaml_for_supported_syntax(self, text: str, monkeypatch) -> None:
+        """Should produce exactly what YAML produces for the shapes it accepts."""
+        ryml = pytest.importorskip("ryml")
+        import yaml
+
+        from calculus_rag.knowledge_base import metadata as metadata_module
+
+        monkeypatch.setattr(metadata_module, "_ryml", ryml)
+
+        assert metadata_module._ryml_frontmatter(text) == yaml.safe_load(text)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "draft: yes",
+            "ratio: 1.5",
+            "date: 2024-01-01",
+            "anchor: &a 1\nref: *a",
+            "summary: |\n  block text",
+            "nested:\n  key: value",
+            "handle: @user",
+            "topic: [unclosed",
+        ],
+    )
+    def test_defers_to_yaml_for_other_syntax(self, text: str, monkeypatch) -> None:
+        """Should return None for anything it cannot map exactly onto YAML."""
+        ryml = pytest.importorskip("ryml")
+
+        from calculus_rag.knowledge_base import metadata as metadata_module
+
+        monkeypatch.setattr(metadata_module, "_ryml", ryml)
+
+        assert metadata_module._ryml_frontmatter(text) is None
@@ -4,10 +4,10 @@ Tests for knowledge base data models.
 TDD: These tests define the expected data models before implementation.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
+import numpy as np
 import pytest
-from pydantic import ValidationError
 
 
 class TestDocumentMetadata:
@@ -25,7 +25,7 @@ class TestDocumentMetadata:
 
         assert metadata.topic == "limits.introduction"
         assert metadata.difficulty == 3
-        assert metadata.prerequisites == ["algebra.factoring", "functions.notation"]
+        assert metadata.prerequisites == ("algebra.factoring", "functions.notation")
 
     def test_metadata_difficulty_range_validation(self) -> None:
         """Difficulty should be between 1 and 5."""
@@ -36,20 +36,20 @@ class TestDocumentMetadata:
         DocumentMetadata(topic="test", difficulty=5, prerequisites=[])
 
         # Invalid - too low
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             DocumentMetadata(topic="test", difficulty=0, prerequisites=[])
 
         # Invalid - too high
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             DocumentMetadata(topic="test", difficulty=6, prerequisites=[])
 
     def test_metadata_prerequisites_defaults_to_empty_list(self) -> None:
-        """Prerequisites should default to an empty list."""
+        """Prerequisites should default to an empty tuple."""
         from calculus_rag.knowledge_base.models import DocumentMetadata
 
         metadata = DocumentMetadata(topic="test", difficulty=1)
 
-        assert metadata.prerequisites == []
+        assert metadata.prerequisites == ()
 
     def test_metadata_has_optional_source_file(self) -> None:
         """DocumentMetadata should support optional source_file field."""
@@ -75,7 +75,50 @@ class TestDocumentMetadata:
             tags=["foundational", "important"],
         )
 
-        assert metadata.tags == ["foundational", "important"]
+        assert metadata.tags == ("foundational", "important")
+
+    def test_metadata_is_immutable(self) -> None:
+        """DocumentMetadata should be frozen once created."""
+        from dataclasses import FrozenInstanceError
+
+        from calculus_rag.knowledge_base.models import DocumentMetadata
+
+        metadata = DocumentMetadata(topic="test", difficulty=1)
+
+        with pytest.raises(FrozenInstanceError):
+            metadata.difficulty = 2  # type: ignore[misc]
+
+    def test_metadata_sequences_are_tuples(self) -> None:
+        """List inputs should be stored as tuples, making metadata hashable."""
+        from calculus_rag.knowledge_base.models import DocumentMetadata
+
+        metadata = DocumentMetadata(topic="test", difficulty=1, prerequisites=["a"], tags=["b"])
+        same = DocumentMetadata(topic="test", difficulty=1, prerequisites=("a",), tags=("b",))
+
+        assert metadata.prerequisites == ("a",)
+        assert metadata.tags == ("b",)
+        assert {metadata: "value"}[same] == "value"
+
+    def test_metadata_rejects_bare_string_tags(self) -> None:
+        """A single string should not be split into one tag per character."""
+        from calculus_rag.knowledge_base.models import DocumentMetadata
+
+        with pytest.raises(ValueError):
+            DocumentMetadata(topic="test", difficulty=1, tags="algebra")
+
+    def test_metadata_strings_are_interned(self) -> None:
+        """Equal topics and tags built at runtime should share one string object."""
+        from calculus_rag.knowledge_base.models import DocumentMetadata
+
+        # Joined at runtime so the compiler cannot fold them into one constant
+        topic = ".".join(["limits", "introduction"])
+        first = DocumentMetadata(topic=topic, difficulty=1, tags=["core"])
+        second = DocumentMetadata(
+            topic="".join(topic), difficulty=1, tags=["".join(["co", "re"])]
+        )
+
+        assert first.topic is second.topic
+        assert first.tags[0] is second.tags[0]
 
 
 class TestDocument:
@@ -111,6 +154,16 @@ class TestDocument:
         assert doc.id is not None
         assert len(doc.id) > 0
 
+    def test_generated_document_ids_are_unique_hex(self) -> None:
+        """Auto-generated IDs should be distinct 128-bit hex strings."""
+        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
+
+        metadata = DocumentMetadata(topic="test", difficulty=1)
+        ids = {Document(content="Test", metadata=metadata).id for _ in range(100)}
+
+        assert len(ids) == 100
+        assert all(len(doc_id) == 32 and int(doc_id, 16) >= 0 for doc_id in ids)
+
     def test_document_has_created_at_timestamp(self) -> None:
         """Document should have a created_at timestamp."""
         from calculus_rag.knowledge_base.models import Document, DocumentMetadata
@@ -123,11 +176,26 @@ class TestDocument:
         assert doc.created_at is not None
         assert isinstance(doc.created_at, datetime)
 
+    def test_document_created_at_matches_stored_nanoseconds(self) -> None:
+        """created_at should be the UTC datetime of created_at_ns, also in model_dump."""
+        from calculus_rag.knowledge_base.models import Document, DocumentMetadata
+
+        doc = Document(
+            content="Test",
+            metadata=DocumentMetadata(topic="test", difficulty=1),
+            created_at_ns=1_700_000_000_123_456_789,
+        )
+
+        expected = datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc)
+        assert doc.created_at == expected
+        assert doc.model_dump()["created_at"] == expected
+        assert "created_at_ns" not in doc.model_dump()
+
     def test_document_content_cannot_be_empty(self) -> None:
         """Document content must not be empty."""
         from calculus_rag.knowledge_base.models import Document, DocumentMetadata
 
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             Document(
                 content="",
                 metadata=DocumentMetadata(topic="test", difficulty=1, prerequisites=[]),
@@ -181,7 +249,23 @@ class TestChunk:
         )
 
         assert chunk.embedding is not None
-        assert len(chunk.embedding) == 768
+        assert chunk.embedding.shape == (768,)
+        assert chunk.embedding.dtype == np.float32
+
+    def test_chunk_stores_embedding_without_copying(self) -> None:
+        """Chunk should keep a float32 embedding array as given, without copying it."""
+        from calculus_rag.knowledge_base.models import Chunk, DocumentMetadata
+
+        embedding = np.full(768, 0.1, dtype=np.float32)
+        chunk = Chunk(
+            content="Test",
+            document_id="doc_001",
+            chunk_index=0,
+            metadata=DocumentMetadata(topic="test", difficulty=1, prerequisites=[]),
+            embedding=embedding,
+        )
+
+        assert chunk.embedding is embedding
 
     def test_chunk_embedding_defaults_to_none(self) -> None:
         """Chunk embedding should default to None."""
@@ -196,6 +280,28 @@ class TestChunk:
 
         assert chunk.embedding is None
 
+    def test_chunk_equality_compares_embeddings(self) -> None:
+        """Chunks should only be equal if their embeddings are equal too."""
+        from calculus_rag.knowledge_base.models import Chunk, DocumentMetadata
+
+        metadata = DocumentMetadata(topic="test", difficulty=1, prerequisites=[])
+
+        def make(embedding):
+            return Chunk(
+                id="chunk_1",
+                content="Test",
+                document_id="doc_001",
+                chunk_index=0,
+                metadata=metadata,
+                embedding=embedding,
+            )
+
+        assert make([0.1, 0.2]) == make(np.array([0.1, 0.2], dtype=np.float32))
+        assert hash(make([0.1, 0.2])) == hash(make([0.1, 0.2]))
+        assert make([0.1, 0.2]) != make([0.1, 0.3])
+        assert make([0.1, 0.2]) != make(None)
+        assert make(None) == make(None)
+
     def test_chunk_index_must_be_non_negative(self) -> None:
         """Chunk index must be >= 0."""
         from calculus_rag.knowledge_base.models import Chunk, DocumentMetadata
@@ -209,7 +315,7 @@ class TestChunk:
         )
 
         # Invalid
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             Chunk(
                 content="Test",
                 document_id="doc_001",
@@ -237,6 +343,23 @@ class TestChunk:
         assert data["chunk_index"] == 0
         assert data["metadata"]["topic"] == "test"
 
+    def test_chunk_to_dict_shares_embedding(self) -> None:
+        """model_dump() should pass the embedding array through without copying it."""
+        from calculus_rag.knowledge_base.models import Chunk, DocumentMetadata
+
+        chunk = Chunk(
+            content="Test content",
+            document_id="doc_001",
+            chunk_index=0,
+            metadata=DocumentMetadata(topic="test", difficulty=1),
+            embedding=np.arange(768, dtype=np.float32),
+        )
+
+        data = chunk.model_dump()
+
+        assert data["embedding"] is chunk.embedding
+        assert set(data) == {"id", "content", "document_id", "chunk_index", "metadata", "embedding"}
+
 
 class TestDocumentFromMarkdown:
     """Test creating documents from markdown files."""
@@ -72,6 +72,17 @@ class TestLLMMessage:
         with pytest.raises(ValueError):
             LLMMessage(role="invalid", content="test")
 
+    def test_message_is_immutable(self) -> None:
+        """LLMMessage fields should not be reassignable after creation."""
+        from dataclasses import FrozenInstanceError
+
+        from calculus_rag.llm.base import LLMMessage
+
+        msg = LLMMessage(role="user", content="Help me.")
+
+        with pytest.raises(FrozenInstanceError):
+            msg.role = "system"  # type: ignore[misc]
+
 
 class TestLLMResponse:
     """Test the LLMResponse data model."""
@@ -196,3 +207,36 @@ class TestConcreteLLMImplementation:
 
         assert chunks == ["The ", "answer ", "is..."]
         assert "".join(chunks) == "The answer is..."
+
+    def test_generate_stream_bytes_encodes_chunks(self) -> None:
+        """generate_stream_bytes() should yield the stream as UTF-8 bytes by default."""
+        from calculus_rag.llm.base import BaseLLM, LLMMessage, LLMResponse
+
+        class MockLLM(BaseLLM):
+            @property
+            def model_name(self) -> str:
+                return "mock-model"
+
+            def generate(
+                self,
+                messages: list[LLMMessage],
+                temperature: float = 0.7,
+                max_tokens: int | None = None,
+            ) -> LLMResponse:
+                return LLMResponse(content="Test")
+
+            def generate_stream(
+                self,
+                messages: list[LLMMessage],
+                temperature: float = 0.7,
+                max_tokens: int | None = None,
+            ) -> Iterator[str]:
+                yield "f'(x) "
+                yield "→ 2x"
+
+        llm = MockLLM()
+        messages = [LLMMessage(role="user", content="Test")]
+        chunks = list(llm.generate_stream_bytes(messages))
+
+        assert chunks == ["f'(x) ".encode(), "→ 2x".encode()]
+        assert b"".join(chunks).decode() == "f'(x) → 2x"
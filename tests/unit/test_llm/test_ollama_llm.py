@@ -4,18 +4,68 @@ Tests for Ollama LLM integration.
 TDD: These tests define the expected behavior before full integration.
 """
 
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
+from calculus_rag.llm.base import LLMMessage
+from calculus_rag.llm.ollama_llm import OllamaLLM
+
+# LLMMessage is frozen and OllamaLLM only reads the list, so tests can share these
+TEST_MESSAGES = [LLMMessage(role="user", content="Test")]
+DERIVATIVE_MESSAGES = [LLMMessage(role="user", content="What is a derivative?")]
+
+
+class FakeOllamaClient:
+    """
+    Minimal stand-in for ollama.Client that records chat() calls.
+
+    Set ``response`` to the value chat() should return, or to an exception
+    instance for chat() to raise.
+    """
+
+    def __init__(self, host: str | None = None, timeout: int | None = None) -> None:
+        self.response: Any = None
+        self.calls: list[dict[str, Any]] = []
+
+    @property
+    def last_call(self) -> dict[str, Any]:
+        """Return the keyword arguments of the most recent chat() call."""
+        return self.calls[-1]
+
+    def chat(self, **kwargs: Any) -> Any:
+        self.calls.append(kwargs)
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+@pytest.fixture(scope="module")
+def shared_ollama_llm() -> tuple[OllamaLLM, FakeOllamaClient]:
+    """Build one OllamaLLM around a fake ollama client for the whole module."""
+    # The client is created in __init__, so the patch is only needed while constructing
+    with patch("calculus_rag.llm.ollama_llm.ollama.Client", FakeOllamaClient):
+        llm = OllamaLLM()
+    return llm, llm._client
+
+
+@pytest.fixture
+def ollama_llm(
+    shared_ollama_llm: tuple[OllamaLLM, FakeOllamaClient],
+) -> tuple[OllamaLLM, FakeOllamaClient]:
+    """Return the shared (llm, fake_client) pair with the recorded calls cleared."""
+    llm, fake_client = shared_ollama_llm
+    fake_client.response = None
+    fake_client.calls.clear()
+    return llm, fake_client
+
 
 class TestOllamaLLMInitialization:
     """Test OllamaLLM initialization."""
 
     def test_create_ollama_llm(self) -> None:
         """Should create an OllamaLLM instance."""
-        from calculus_rag.llm.ollama_llm import OllamaLLM
-
         llm = OllamaLLM(
             model="qwen2.5-math:7b",
             base_url="http://localhost:11434",
@@ -26,15 +76,11 @@ class TestOllamaLLMInitialization:
 
     def test_ollama_llm_default_model(self) -> None:
         """Should use default model if not specified."""
-        from calculus_rag.llm.ollama_llm import OllamaLLM
-
         llm = OllamaLLM()
         assert llm.model_name == "qwen2.5-math:7b"
 
     def test_ollama_llm_custom_timeout(self) -> None:
         """Should accept custom timeout."""
-        from calculus_rag.llm.ollama_llm import OllamaLLM
-
         llm = OllamaLLM(timeout=60)
         assert llm._timeout == 60
 
@@ -42,44 +88,33 @@ class TestOllamaLLMInitialization:
 class TestOllamaLLMGenerate:
     """Test OllamaLLM text generation."""
 
-    @patch("calculus_rag.llm.ollama_llm.ollama.Client")
-    def test_generate_basic(self, mock_client_class: MagicMock) -> None:
+    def test_generate_basic(self, ollama_llm: tuple[OllamaLLM, FakeOllamaClient]) -> None:
         """Should generate a response for user message."""
-        from calculus_rag.llm.base import LLMMessage
-        from calculus_rag.llm.ollama_llm import OllamaLLM
-
-        # Mock the Ollama client
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_client.chat.return_value = {
+        llm, fake_client = ollama_llm
+        fake_client.response = {
             "message": {"content": "A derivative measures the rate of change."},
             "model": "qwen2.5-math:7b",
             "total_duration": 1000000,
             "eval_count": 10,
         }
 
-        llm = OllamaLLM()
-        messages = [LLMMessage(role="user", content="What is a derivative?")]
+        messages = DERIVATIVE_MESSAGES
         response = llm.generate(messages)
 
         assert response.content == "A derivative measures the rate of change."
         assert "model" in response.metadata
         assert response.metadata["model"] == "qwen2.5-math:7b"
 
-    @patch("calculus_rag.llm.ollama_llm.ollama.Client")
-    def test_generate_with_system_message(self, mock_client_class: MagicMock) -> None:
+    def test_generate_with_system_message(
+        self, ollama_llm: tuple[OllamaLLM, FakeOllamaClient]
+    ) -> None:
         """Should handle system messages."""
-        from calculus_rag.llm.base import LLMMessage
-        from calculus_rag.llm.ollama_llm import OllamaLLM
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_client.chat.return_value = {
+        llm, fake_client = ollama_llm
+        fake_client.response = {
             "message": {"content": "Test response"},
             "model": "qwen2.5-math:7b",
         }
 
-        llm = OllamaLLM()
         messages = [
             LLMMessage(role="system", content="You are a calculus tutor."),
             LLMMessage(role="user", content="Explain limits."),
@@ -87,83 +122,89 @@ class TestOllamaLLMGenerate:
         response = llm.generate(messages)
 
         # Verify client was called with correct messages
-        mock_client.chat.assert_called_once()
-        call_args = mock_client.chat.call_args
-        assert len(call_args.kwargs["messages"]) == 2
-        assert call_args.kwargs["messages"][0]["role"] == "system"
-        assert call_args.kwargs["messages"][1]["role"] == "user"
-
-    @patch("calculus_rag.llm.ollama_llm.ollama.Client")
-    def test_generate_with_temperature(self, mock_client_class: MagicMock) -> None:
+        assert len(fake_client.calls) == 1
+        assert len(fake_client.last_call["messages"]) == 2
+        assert fake_client.last_call["messages"][0]["role"] == "system"
+        assert fake_client.last_call["messages"][1]["role"] == "user"
+
+    def test_generate_with_temperature(
+        self, ollama_llm: tuple[OllamaLLM, FakeOllamaClient]
+    ) -> None:
         """Should respect temperature parameter."""
-        from calculus_rag.llm.base import LLMMessage
-        from calculus_rag.llm.ollama_llm import OllamaLLM
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_client.chat.return_value = {
+        llm, fake_client = ollama_llm
+        fake_client.response = {
             "message": {"content": "Test"},
             "model": "qwen2.5-math:7b",
         }
 
-        llm = OllamaLLM()
-        messages = [LLMMessage(role="user", content="Test")]
+        messages = TEST_MESSAGES
         llm.generate(messages, temperature=0.2)
 
-        call_args = mock_client.chat.call_args
-        assert call_args.kwargs["options"]["temperature"] == 0.2
+        assert fake_client.last_call["options"]["temperature"] == 0.2
 
-    @patch("calculus_rag.llm.ollama_llm.ollama.Client")
-    def test_generate_with_max_tokens(self, mock_client_class: MagicMock) -> None:
+    def test_generate_with_max_tokens(self, ollama_llm: tuple[OllamaLLM, FakeOllamaClient]) -> None:
         """Should respect max_tokens parameter."""
-        from calculus_rag.llm.base import LLMMessage
-        from calculus_rag.llm.ollama_llm import OllamaLLM
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_client.chat.return_value = {
+        llm, fake_client = ollama_llm
+        fake_client.response = {
             "message": {"content": "Test"},
             "model": "qwen2.5-math:7b",
         }
 
-        llm = OllamaLLM()
-        messages = [LLMMessage(role="user", content="Test")]
+        messages = TEST_MESSAGES
         llm.generate(messages, max_tokens=100)
 
-        call_args = mock_client.chat.call_args
-        assert call_args.kwargs["options"]["num_predict"] == 100
+        assert fake_client.last_call["options"]["num_predict"] == 100
 
-    @patch("calculus_rag.llm.ollama_llm.ollama.Client")
-    def test_generate_handles_errors(self, mock_client_class: MagicMock) -> None:
+    def test_generate_handles_errors(self, ollama_llm: tuple[OllamaLLM, FakeOllamaClient]) -> None:
         """Should handle API errors gracefully."""
-        from calculus_rag.llm.base import LLMMessage
-        from calculus_rag.llm.ollama_llm import OllamaLLM
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_client.chat.side_effect = Exception("Connection failed")
+        llm, fake_client = ollama_llm
+        fake_client.response = Exception("Connection failed")
 
-        llm = OllamaLLM()
-        messages = [LLMMessage(role="user", content="Test")]
+        messages = TEST_MESSAGES
 
         with pytest.raises(RuntimeError, match="Ollama API call failed"):
             llm.generate(messages)
 
+    def test_generate_reuses_client(self) -> None:
+        """Should construct the ollama client once and reuse it for every request."""
+        with patch(
+            "calculus_rag.llm.ollama_llm.ollama.Client", side_effect=FakeOllamaClient
+        ) as client_class:
+            llm = OllamaLLM()
+            llm._client.response = {"message": {"content": "x"}, "model": "m"}
+
+            for _ in range(5):
+                llm.generate(TEST_MESSAGES)
+
+        assert client_class.call_count == 1
+        assert len(llm._client.calls) == 5
+
+    def test_generate_reuses_http_client_with_api_key(self) -> None:
+        """Should keep one pooled httpx client for authenticated requests."""
+        with patch("calculus_rag.llm.ollama_llm.httpx.Client") as http_client_class:
+            llm = OllamaLLM(api_key="test-key")
+            http_client = http_client_class.return_value
+            http_client.post.return_value.json.return_value = {
+                "message": {"content": "x"},
+                "model": "m",
+            }
+
+            for _ in range(5):
+                llm.generate(TEST_MESSAGES)
+
+        assert http_client_class.call_count == 1
+        assert http_client.post.call_count == 5
+
 
 class TestOllamaLLMStream:
     """Test OllamaLLM streaming generation."""
 
-    @patch("calculus_rag.llm.ollama_llm.ollama.Client")
-    def test_generate_stream_basic(self, mock_client_class: MagicMock) -> None:
+    def test_generate_stream_basic(self, ollama_llm: tuple[OllamaLLM, FakeOllamaClient]) -> None:
         """Should stream response chunks."""
-        from calculus_rag.llm.base import LLMMessage
-        from calculus_rag.llm.ollama_llm import OllamaLLM
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+        llm, fake_client = ollama_llm
 
-        # Mock streaming response
-        mock_client.chat.return_value = iter(
+        # Fake streaming response
+        fake_client.response = iter(
             [
                 {"message": {"content": "A "}},
                 {"message": {"content": "derivative "}},
@@ -171,43 +212,45 @@ class TestOllamaLLMStream:
             ]
         )
 
-        llm = OllamaLLM()
-        messages = [LLMMessage(role="user", content="What is a derivative?")]
+        messages = DERIVATIVE_MESSAGES
         chunks = list(llm.generate_stream(messages))
 
         assert chunks == ["A ", "derivative ", "is..."]
 
-    @patch("calculus_rag.llm.ollama_llm.ollama.Client")
-    def test_generate_stream_with_options(self, mock_client_class: MagicMock) -> None:
-        """Should pass options to streaming call."""
-        from calculus_rag.llm.base import LLMMessage
-        from calculus_rag.llm.ollama_llm import OllamaLLM
+    def test_generate_stream_passes_micro_chunks_through(
+        self, ollama_llm: tuple[OllamaLLM, FakeOllamaClient]
+    ) -> None:
+        """Should yield each streamed token as it arrives, without buffering."""
+        llm, fake_client = ollama_llm
+        fake_client.response = iter([{"message": {"content": "x"}}] * 10_000)
 
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_client.chat.return_value = iter([{"message": {"content": "Test"}}])
+        stream = llm.generate_stream(TEST_MESSAGES)
 
-        llm = OllamaLLM()
-        messages = [LLMMessage(role="user", content="Test")]
+        assert next(stream) == "x"
+        assert sum(1 for _ in stream) == 9_999
+
+    def test_generate_stream_with_options(
+        self, ollama_llm: tuple[OllamaLLM, FakeOllamaClient]
+    ) -> None:
+        """Should pass options to streaming call."""
+        llm, fake_client = ollama_llm
+        fake_client.response = iter([{"message": {"content": "Test"}}])
+
+        messages = TEST_MESSAGES
         list(llm.generate_stream(messages, temperature=0.1, max_tokens=50))
 
-        call_args = mock_client.chat.call_args
-        assert call_args.kwargs["options"]["temperature"] == 0.1
-        assert call_args.kwargs["options"]["num_predict"] == 50
-        assert call_args.kwargs["stream"] is True
+        assert fake_client.last_call["options"]["temperature"] == 0.1
+        assert fake_client.last_call["options"]["num_predict"] == 50
+        assert fake_client.last_call["stream"] is True
 
-    @patch("calculus_rag.llm.ollama_llm.ollama.Client")
-    def test_generate_stream_handles_errors(self, mock_client_class: MagicMock) -> None:
+    def test_generate_stream_handles_errors(
+        self, ollama_llm: tuple[OllamaLLM, FakeOllamaClient]
+    ) -> None:
         """Should handle streaming errors gracefully."""
-        from calculus_rag.llm.base import LLMMessage
-        from calculus_rag.llm.ollama_llm import OllamaLLM
+        llm, fake_client = ollama_llm
+        fake_client.response = Exception("Streaming failed")
 
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_client.chat.side_effect = Exception("Streaming failed")
-
-        llm = OllamaLLM()
-        messages = [LLMMessage(role="user", content="Test")]
+        messages = TEST_MESSAGES
 
         with pytest.raises(RuntimeError, match="Ollama API streaming failed"):
             list(llm.generate_stream(messages))
@@ -218,27 +261,21 @@ class TestOllamaLLMIntegration:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_real_ollama_connection(self) -> None:
+    def test_real_ollama_connection(self, ollama_available: bool) -> None:
         """
         Test connection to real Ollama instance.
 
         Note: This test requires Ollama to be running locally.
         Skip if Ollama is not available.
         """
-        from calculus_rag.llm.base import LLMMessage
-        from calculus_rag.llm.ollama_llm import OllamaLLM
+        if not ollama_available:
+            pytest.skip("Ollama not running on localhost:11434")
 
-        try:
-            llm = OllamaLLM(model="qwen2.5-math:7b")
-            messages = [
-                LLMMessage(role="user", content="What is 2+2? Answer briefly.")
-            ]
-            response = llm.generate(messages, temperature=0.1, max_tokens=50)
+        llm = OllamaLLM(model="qwen2.5-math:7b")
+        messages = [LLMMessage(role="user", content="What is 2+2? Answer briefly.")]
+        response = llm.generate(messages, temperature=0.1, max_tokens=50)
 
-            # Should get a response
-            assert response.content is not None
-            assert len(response.content) > 0
-            assert "model" in response.metadata
-
-        except Exception as e:
-            pytest.skip(f"Ollama not available: {e}")
+        # Should get a response
+        assert response.content is not None
+        assert len(response.content) > 0
+        assert "model" in response.metadata
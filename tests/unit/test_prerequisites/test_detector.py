@@ -6,40 +6,62 @@ TDD: These tests define the expected behavior before implementation.
 
 import pytest
 
+from calculus_rag.prerequisites.detector import GapAnalysis, GapDetector
+from calculus_rag.prerequisites.graph import PrerequisiteGraph
+
+
+@pytest.fixture(scope="module")
+def sample_graph() -> PrerequisiteGraph:
+    """
+    Create a sample prerequisite graph for testing.
+
+    Built once per module; GapDetector only reads the graph.
+    """
+    return PrerequisiteGraph.from_dict(
+        {
+            "algebra.basics": [],
+            "algebra.factoring": ["algebra.basics"],
+            "functions.notation": ["algebra.basics"],
+            "functions.composition": ["functions.notation"],
+            "limits.introduction": ["algebra.factoring", "functions.notation"],
+            "derivatives.basic": ["limits.introduction"],
+            "derivatives.chain_rule": ["derivatives.basic", "functions.composition"],
+        }
+    )
 
-class TestGapDetector:
-    """Test the GapDetector class."""
 
-    @pytest.fixture
-    def sample_graph(self):
-        """Create a sample prerequisite graph for testing."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
+@pytest.fixture(scope="module")
+def chain_rule_graph() -> PrerequisiteGraph:
+    """Create a read-only graph leading up to the chain rule, once per module."""
+    graph = PrerequisiteGraph()
+    graph.add_topic("functions.composition", prerequisites=[])
+    graph.add_topic("derivatives.basic", prerequisites=[])
+    graph.add_topic(
+        "derivatives.chain_rule", prerequisites=["derivatives.basic", "functions.composition"]
+    )
+
+    return graph
 
-        graph = PrerequisiteGraph()
-        graph.add_topic("algebra.basics", prerequisites=[])
-        graph.add_topic("algebra.factoring", prerequisites=["algebra.basics"])
-        graph.add_topic("functions.notation", prerequisites=["algebra.basics"])
-        graph.add_topic("functions.composition", prerequisites=["functions.notation"])
-        graph.add_topic("limits.introduction", prerequisites=["algebra.factoring", "functions.notation"])
-        graph.add_topic("derivatives.basic", prerequisites=["limits.introduction"])
-        graph.add_topic("derivatives.chain_rule", prerequisites=["derivatives.basic", "functions.composition"])
 
-        return graph
+@pytest.fixture(scope="module")
+def empty_detector() -> GapDetector:
+    """Create a gap detector over an empty graph, once per module."""
+    return GapDetector(PrerequisiteGraph())
+
+
+class TestGapDetector:
+    """Test the GapDetector class."""
 
     def test_create_gap_detector(self, sample_graph) -> None:
         """Should create a gap detector with a prerequisite graph."""
-        from calculus_rag.prerequisites.detector import GapDetector
-
         detector = GapDetector(sample_graph)
 
         assert detector is not None
 
     def test_detect_gaps_no_completion(self, sample_graph) -> None:
         """Should detect all prerequisites as gaps when nothing is completed."""
-        from calculus_rag.prerequisites.detector import GapDetector
-
         detector = GapDetector(sample_graph)
-        completed_topics = set()
+        completed_topics = frozenset()
 
         gaps = detector.detect_gaps("derivatives.chain_rule", completed_topics)
 
@@ -50,14 +72,14 @@ class TestGapDetector:
 
     def test_detect_gaps_partial_completion(self, sample_graph) -> None:
         """Should only detect missing prerequisites."""
-        from calculus_rag.prerequisites.detector import GapDetector
-
         detector = GapDetector(sample_graph)
-        completed_topics = {
-            "algebra.basics",
-            "algebra.factoring",
-            "functions.notation",
-        }
+        completed_topics = frozenset(
+            {
+                "algebra.basics",
+                "algebra.factoring",
+                "functions.notation",
+            }
+        )
 
         gaps = detector.detect_gaps("derivatives.chain_rule", completed_topics)
 
@@ -72,17 +94,17 @@ class TestGapDetector:
 
     def test_detect_gaps_all_completed(self, sample_graph) -> None:
         """Should detect no gaps when all prerequisites are met."""
-        from calculus_rag.prerequisites.detector import GapDetector
-
         detector = GapDetector(sample_graph)
-        completed_topics = {
-            "algebra.basics",
-            "algebra.factoring",
-            "functions.notation",
-            "functions.composition",
-            "limits.introduction",
-            "derivatives.basic",
-        }
+        completed_topics = frozenset(
+            {
+                "algebra.basics",
+                "algebra.factoring",
+                "functions.notation",
+                "functions.composition",
+                "limits.introduction",
+                "derivatives.basic",
+            }
+        )
 
         gaps = detector.detect_gaps("derivatives.chain_rule", completed_topics)
 
@@ -90,10 +112,8 @@ class TestGapDetector:
 
     def test_detect_critical_gaps(self, sample_graph) -> None:
         """Should identify the most critical gaps to address first."""
-        from calculus_rag.prerequisites.detector import GapDetector
-
         detector = GapDetector(sample_graph)
-        completed_topics = set()
+        completed_topics = frozenset()
 
         critical_gaps = detector.detect_critical_gaps("derivatives.chain_rule", completed_topics)
 
@@ -104,9 +124,6 @@ class TestGapDetector:
 
     def test_analyze_query_detects_topic(self) -> None:
         """Should analyze a query and detect the topic being asked about."""
-        from calculus_rag.prerequisites.detector import GapDetector
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("derivatives.chain_rule", prerequisites=[])
 
@@ -120,9 +137,6 @@ class TestGapDetector:
 
     def test_analyze_query_with_keywords(self) -> None:
         """Should detect topic from keywords in query."""
-        from calculus_rag.prerequisites.detector import GapDetector
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("limits.introduction", prerequisites=[])
 
@@ -133,38 +147,40 @@ class TestGapDetector:
 
         assert detected_topic == "limits.introduction"
 
-    def test_detect_confusion_signals(self) -> None:
-        """Should detect signals of confusion in queries."""
-        from calculus_rag.prerequisites.detector import GapDetector
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
-        graph = PrerequisiteGraph()
-        detector = GapDetector(graph)
-
-        confused_queries = [
-            "I don't understand how to do this",
-            "What is a derivative?",  # Very basic question
-            "I'm confused about limits",
-            "Can you explain this again?",
-        ]
+    def test_analyze_query_uses_subclass_keywords(self) -> None:
+        """Should match keywords from an overridden TOPIC_KEYWORDS case-insensitively."""
 
-        for query in confused_queries:
-            assert detector.has_confusion_signals(query)
+        class TheoremDetector(GapDetector):
+            TOPIC_KEYWORDS = {"derivatives.mean_value_theorem": ["Mean Value", "MVT"]}
 
-        clear_queries = [
-            "Find the derivative of x^2",
-            "Solve this integral",
-        ]
+        detector = TheoremDetector(PrerequisiteGraph())
 
-        for query in clear_queries:
-            assert not detector.has_confusion_signals(query)
+        assert detector.analyze_query("When does the mean value theorem apply?") == (
+            "derivatives.mean_value_theorem"
+        )
+        assert detector.analyze_query("Solve this integral") == "integration.basic"
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("I don't understand how to do this", True),
+            ("What is a derivative?", True),  # Very basic question
+            ("I'm confused about limits", True),
+            ("Can you explain this again?", True),
+            ("Find the derivative of x^2", False),
+            ("Solve this integral", False),
+        ],
+    )
+    def test_detect_confusion_signals(
+        self, empty_detector: GapDetector, query: str, expected: bool
+    ) -> None:
+        """Should detect signals of confusion in queries."""
+        assert empty_detector.has_confusion_signals(query) is expected
 
     def test_suggest_prerequisite_review(self, sample_graph) -> None:
         """Should suggest which prerequisites to review."""
-        from calculus_rag.prerequisites.detector import GapDetector
-
         detector = GapDetector(sample_graph)
-        completed_topics = {"algebra.basics"}
+        completed_topics = frozenset({"algebra.basics"})
 
         suggestions = detector.suggest_review(
             target_topic="derivatives.chain_rule",
@@ -177,10 +193,8 @@ class TestGapDetector:
 
     def test_get_next_topic_to_learn(self, sample_graph) -> None:
         """Should recommend the next topic to learn."""
-        from calculus_rag.prerequisites.detector import GapDetector
-
         detector = GapDetector(sample_graph)
-        completed_topics = {"algebra.basics", "algebra.factoring"}
+        completed_topics = frozenset({"algebra.basics", "algebra.factoring"})
 
         next_topic = detector.get_next_topic(
             target_topic="derivatives.chain_rule",
@@ -194,21 +208,12 @@ class TestGapDetector:
 class TestGapDetectorIntegration:
     """Integration tests for gap detection."""
 
-    def test_full_gap_analysis(self) -> None:
+    def test_full_gap_analysis(self, chain_rule_graph: PrerequisiteGraph) -> None:
         """Should perform complete gap analysis for a student query."""
-        from calculus_rag.prerequisites.detector import GapDetector, GapAnalysis
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
-        # Set up graph
-        graph = PrerequisiteGraph()
-        graph.add_topic("functions.composition", prerequisites=[])
-        graph.add_topic("derivatives.basic", prerequisites=[])
-        graph.add_topic("derivatives.chain_rule", prerequisites=["derivatives.basic", "functions.composition"])
-
-        detector = GapDetector(graph)
+        detector = GapDetector(chain_rule_graph)
 
         # Student has only done basic derivatives
-        completed_topics = {"derivatives.basic"}
+        completed_topics = frozenset({"derivatives.basic"})
         query = "How do I find the derivative of sin(x^2)?"
 
         analysis = detector.analyze(query, completed_topics)
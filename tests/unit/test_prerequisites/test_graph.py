@@ -6,14 +6,23 @@ TDD: These tests define the expected behavior before implementation.
 
 import pytest
 
+from calculus_rag.prerequisites.graph import CircularDependencyError, PrerequisiteGraph
+
+
+@pytest.fixture(scope="module")
+def small_graph() -> PrerequisiteGraph:
+    """Create a two-topic graph shared by the read-only serialization tests."""
+    graph = PrerequisiteGraph()
+    graph.add_topic("algebra.factoring", prerequisites=[])
+    graph.add_topic("limits.introduction", prerequisites=["algebra.factoring"])
+    return graph
+
 
 class TestPrerequisiteGraph:
     """Test the PrerequisiteGraph class."""
 
     def test_create_empty_graph(self) -> None:
         """Should create an empty prerequisite graph."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
 
         assert graph is not None
@@ -21,8 +30,6 @@ class TestPrerequisiteGraph:
 
     def test_add_topic_without_prerequisites(self) -> None:
         """Should add a topic with no prerequisites."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("algebra.factoring", prerequisites=[])
 
@@ -31,8 +38,6 @@ class TestPrerequisiteGraph:
 
     def test_add_topic_with_prerequisites(self) -> None:
         """Should add a topic with prerequisites."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("algebra.factoring", prerequisites=[])
         graph.add_topic("limits.introduction", prerequisites=["algebra.factoring"])
@@ -40,10 +45,28 @@ class TestPrerequisiteGraph:
         prereqs = graph.get_prerequisites("limits.introduction")
         assert "algebra.factoring" in prereqs
 
+    def test_add_topics_in_bulk(self) -> None:
+        """Should add many topics with one cycle check and extend an existing graph."""
+        graph = PrerequisiteGraph()
+        graph.add_topic("topic_0", prerequisites=[])
+
+        graph.add_topics({f"topic_{i}": [f"topic_{i - 1}"] for i in range(1, 1_000)})
+
+        assert len(graph.get_all_topics()) == 1_000
+        assert len(graph.get_all_prerequisites("topic_999")) == 999
+
+    def test_add_topics_rejects_cycles_atomically(self) -> None:
+        """Should add none of the topics when the batch would create a cycle."""
+        graph = PrerequisiteGraph()
+        graph.add_topic("topic_a", prerequisites=["topic_b"])
+
+        with pytest.raises(CircularDependencyError):
+            graph.add_topics({"topic_c": [], "topic_b": ["topic_a"]})
+
+        assert graph.get_all_topics() == ["topic_a"]
+
     def test_get_all_prerequisites_recursive(self) -> None:
         """Should get all prerequisites recursively."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("algebra.basics", prerequisites=[])
         graph.add_topic("algebra.factoring", prerequisites=["algebra.basics"])
@@ -55,10 +78,75 @@ class TestPrerequisiteGraph:
         assert "algebra.factoring" in all_prereqs
         assert "algebra.basics" in all_prereqs
 
+    def test_get_all_prerequisites_reuses_closure(self) -> None:
+        """Should walk the graph once per topic and hand out independent lists."""
+        from unittest.mock import patch
+
+        graph = PrerequisiteGraph()
+        graph.add_topic("algebra.basics", prerequisites=[])
+        graph.add_topic("algebra.factoring", prerequisites=["algebra.basics"])
+        graph.add_topic("limits.introduction", prerequisites=["algebra.factoring"])
+
+        first = graph.get_all_prerequisites("limits.introduction")
+        first.append("mutated")
+
+        with patch.object(graph, "_merge_closure", side_effect=AssertionError):
+            second = graph.get_all_prerequisites("limits.introduction")
+
+        assert sorted(second) == ["algebra.basics", "algebra.factoring"]
+
+    def test_get_all_prerequisites_resolves_diamonds_once(self) -> None:
+        """Should resolve a prerequisite shared by several paths only once."""
+        from unittest.mock import patch
+
+        # a needs b and c, which both need d
+        graph = PrerequisiteGraph.from_dict(
+            {"d": [], "b": ["d"], "c": ["d"], "a": ["b", "c"]}
+        )
+
+        with patch.object(graph, "_merge_closure", wraps=graph._merge_closure) as merge:
+            assert sorted(graph.get_all_prerequisites("a")) == ["b", "c", "d"]
+            assert sorted(graph.get_all_prerequisites("b")) == ["d"]
+
+        assert merge.call_count == 4
+
+    def test_add_topic_refreshes_all_prerequisites(self) -> None:
+        """Should reflect topics added after a closure was first computed."""
+        graph = PrerequisiteGraph()
+        graph.add_topic("algebra.factoring", prerequisites=[])
+        graph.add_topic("limits.introduction", prerequisites=["algebra.factoring"])
+        assert graph.get_all_prerequisites("limits.introduction") == ["algebra.factoring"]
+
+        graph.add_topic("algebra.basics", prerequisites=[])
+        graph.add_topic("algebra.factoring", prerequisites=["algebra.basics"])
+
+        all_prereqs = graph.get_all_prerequisites("limits.introduction")
+        assert sorted(all_prereqs) == ["algebra.basics", "algebra.factoring"]
+
+    def test_graph_keeps_its_own_prerequisite_lists(self) -> None:
+        """Should not see later changes to the lists passed in or handed out."""
+        single = ["algebra.basics"]
+        bulk = {"limits.introduction": ["algebra.factoring"]}
+        data = {"algebra.basics": [], "algebra.factoring": []}
+
+        graph = PrerequisiteGraph.from_dict(data)
+        graph.add_topic("derivatives.basic", prerequisites=single)
+        graph.add_topics(bulk)
+        assert graph.get_all_prerequisites("derivatives.basic") == ["algebra.basics"]
+
+        single.append("limits.introduction")
+        bulk["limits.introduction"].append("algebra.basics")
+        data["algebra.factoring"].append("algebra.basics")
+        graph.get_prerequisites("algebra.basics").append("algebra.factoring")
+        graph.to_dict()["algebra.basics"].append("algebra.factoring")
+
+        assert graph.get_all_prerequisites("derivatives.basic") == ["algebra.basics"]
+        assert graph.get_prerequisites("limits.introduction") == ["algebra.factoring"]
+        assert graph.get_prerequisites("algebra.factoring") == []
+        assert graph.get_prerequisites("algebra.basics") == []
+
     def test_detect_circular_dependency(self) -> None:
         """Should detect circular dependencies."""
-        from calculus_rag.prerequisites.graph import CircularDependencyError, PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("topic_a", prerequisites=["topic_b"])
 
@@ -68,8 +156,6 @@ class TestPrerequisiteGraph:
 
     def test_get_dependents(self) -> None:
         """Should get topics that depend on a given topic."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("algebra.factoring", prerequisites=[])
         graph.add_topic("limits.introduction", prerequisites=["algebra.factoring"])
@@ -83,8 +169,6 @@ class TestPrerequisiteGraph:
 
     def test_topological_sort(self) -> None:
         """Should return topics in dependency order."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("algebra.basics", prerequisites=[])
         graph.add_topic("algebra.factoring", prerequisites=["algebra.basics"])
@@ -99,10 +183,18 @@ class TestPrerequisiteGraph:
 
         assert basics_idx < factoring_idx < limits_idx
 
+    def test_topological_sort_long_chain(self) -> None:
+        """Should order a 10,000-topic chain given in reverse without recursing per topic."""
+        topics = [f"topic_{i}" for i in range(10_000)]
+        data = {topics[i]: [topics[i - 1]] for i in range(len(topics) - 1, 0, -1)}
+        data[topics[0]] = []
+
+        graph = PrerequisiteGraph.from_dict(data)
+
+        assert graph.topological_sort() == topics
+
     def test_check_prerequisites_met(self) -> None:
         """Should check if prerequisites are met for a topic."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("algebra.factoring", prerequisites=[])
         graph.add_topic("limits.introduction", prerequisites=["algebra.factoring"])
@@ -117,8 +209,6 @@ class TestPrerequisiteGraph:
 
     def test_get_missing_prerequisites(self) -> None:
         """Should return missing prerequisites for a topic."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("algebra.basics", prerequisites=[])
         graph.add_topic("algebra.factoring", prerequisites=["algebra.basics"])
@@ -136,56 +226,38 @@ class TestPrerequisiteGraph:
 class TestPrerequisiteGraphPersistence:
     """Test saving and loading prerequisite graphs."""
 
-    def test_to_dict(self) -> None:
-        """Should serialize graph to dictionary."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
-        graph = PrerequisiteGraph()
-        graph.add_topic("algebra.factoring", prerequisites=[])
-        graph.add_topic("limits.introduction", prerequisites=["algebra.factoring"])
-
-        data = graph.to_dict()
-
-        assert "algebra.factoring" in data
-        assert "limits.introduction" in data
-        assert data["limits.introduction"] == ["algebra.factoring"]
-
-    def test_from_dict(self) -> None:
-        """Should load graph from dictionary."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
+    @pytest.mark.parametrize(
+        ("serialize", "load", "serialized_type"),
+        [
+            pytest.param("to_dict", "from_dict", dict, id="dict"),
+            pytest.param("to_json", "from_json", str, id="json"),
+        ],
+    )
+    def test_round_trip(
+        self,
+        small_graph: PrerequisiteGraph,
+        serialize: str,
+        load: str,
+        serialized_type: type,
+    ) -> None:
+        """Should serialize a graph and load it back unchanged."""
+        data = getattr(small_graph, serialize)()
+        loaded = getattr(PrerequisiteGraph, load)(data)
+
+        assert isinstance(data, serialized_type)
+        assert loaded.get_all_topics() == ["algebra.factoring", "limits.introduction"]
+        assert loaded.get_prerequisites("limits.introduction") == ["algebra.factoring"]
+
+    def test_from_dict_rejects_cycles(self) -> None:
+        """Should refuse to load prerequisites that form a cycle."""
         data = {
-            "algebra.factoring": [],
-            "limits.introduction": ["algebra.factoring"],
+            "topic_a": ["topic_b"],
+            "topic_b": ["topic_c"],
+            "topic_c": ["topic_a"],
         }
 
-        graph = PrerequisiteGraph.from_dict(data)
-
-        assert "algebra.factoring" in graph.get_all_topics()
-        assert graph.get_prerequisites("limits.introduction") == ["algebra.factoring"]
-
-    def test_to_json(self) -> None:
-        """Should serialize graph to JSON string."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
-        graph = PrerequisiteGraph()
-        graph.add_topic("algebra.factoring", prerequisites=[])
-
-        json_str = graph.to_json()
-
-        assert "algebra.factoring" in json_str
-        assert isinstance(json_str, str)
-
-    def test_from_json(self) -> None:
-        """Should load graph from JSON string."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
-        json_str = '{"algebra.factoring": [], "limits.introduction": ["algebra.factoring"]}'
-
-        graph = PrerequisiteGraph.from_json(json_str)
-
-        assert "algebra.factoring" in graph.get_all_topics()
-        assert "limits.introduction" in graph.get_all_topics()
+        with pytest.raises(CircularDependencyError):
+            PrerequisiteGraph.from_dict(data)
 
 
 class TestPrerequisiteGraphAdvanced:
@@ -193,8 +265,6 @@ class TestPrerequisiteGraphAdvanced:
 
     def test_get_learning_path(self) -> None:
         """Should suggest a learning path to reach a topic."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("algebra.basics", prerequisites=[])
         graph.add_topic("algebra.factoring", prerequisites=["algebra.basics"])
@@ -213,8 +283,6 @@ class TestPrerequisiteGraphAdvanced:
 
     def test_get_learning_path_with_partial_completion(self) -> None:
         """Should suggest path considering what's already completed."""
-        from calculus_rag.prerequisites.graph import PrerequisiteGraph
-
         graph = PrerequisiteGraph()
         graph.add_topic("algebra.basics", prerequisites=[])
         graph.add_topic("algebra.factoring", prerequisites=["algebra.basics"])
@@ -226,3 +294,24 @@ class TestPrerequisiteGraphAdvanced:
 
         # Should only suggest limits (others already done)
         assert path == ["limits.introduction"]
+
+    def test_get_learning_path_binary_tree(self) -> None:
+        """Should order every topic of a 1,000-node tree after its prerequisites."""
+        # Topic i requires topics 2i + 1 and 2i + 2, so topic_0 needs all the others
+        size = 1_000
+        data = {
+            f"topic_{i}": [f"topic_{c}" for c in (2 * i + 1, 2 * i + 2) if c < size]
+            for i in range(size)
+        }
+        graph = PrerequisiteGraph.from_dict(data)
+
+        path = graph.get_learning_path("topic_0", set())
+
+        assert len(path) == size
+        assert path[-1] == "topic_0"
+        position = {topic: index for index, topic in enumerate(path)}
+        assert all(
+            position[prereq] < position[topic]
+            for topic, prereqs in data.items()
+            for prereq in prereqs
+        )
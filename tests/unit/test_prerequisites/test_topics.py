@@ -6,27 +6,26 @@ TDD: These tests define the expected behavior before implementation.
 
 import pytest
 
+from calculus_rag.prerequisites.topics import (
+    build_prerequisite_graph,
+    get_topic_info,
+    get_topics_by_difficulty,
+    search_topics,
+)
+
 
 class TestTopicCatalog:
     """Test the topic catalog."""
 
-    def test_load_calculus_topics(self) -> None:
+    def test_load_calculus_topics(self, calc_topics: dict[str, dict]) -> None:
         """Should load predefined calculus topics."""
-        from calculus_rag.prerequisites.topics import get_calculus_topics
-
-        topics = get_calculus_topics()
-
-        assert len(topics) > 0
-        assert "limits.introduction" in topics
-        assert "derivatives.power_rule" in topics
+        assert len(calc_topics) > 0
+        assert "limits.introduction" in calc_topics
+        assert "derivatives.power_rule" in calc_topics
 
-    def test_topic_has_metadata(self) -> None:
+    def test_topic_has_metadata(self, calc_topics: dict[str, dict]) -> None:
         """Each topic should have metadata."""
-        from calculus_rag.prerequisites.topics import get_calculus_topics
-
-        topics = get_calculus_topics()
-
-        for topic_id, topic_data in topics.items():
+        for topic_id, topic_data in calc_topics.items():
             assert "display_name" in topic_data
             assert "description" in topic_data
             assert "difficulty" in topic_data
@@ -34,8 +33,6 @@ class TestTopicCatalog:
 
     def test_build_prerequisite_graph_from_catalog(self) -> None:
         """Should build a prerequisite graph from the topic catalog."""
-        from calculus_rag.prerequisites.topics import build_prerequisite_graph
-
         graph = build_prerequisite_graph()
 
         # Check that common topics are in the graph
@@ -45,8 +42,6 @@ class TestTopicCatalog:
 
     def test_get_topic_info(self) -> None:
         """Should retrieve information about a specific topic."""
-        from calculus_rag.prerequisites.topics import get_topic_info
-
         topic = get_topic_info("limits.introduction")
 
         assert topic is not None
@@ -56,16 +51,12 @@ class TestTopicCatalog:
 
     def test_get_nonexistent_topic(self) -> None:
         """Should return None for non-existent topics."""
-        from calculus_rag.prerequisites.topics import get_topic_info
-
         topic = get_topic_info("nonexistent.topic")
 
         assert topic is None
 
     def test_list_topics_by_difficulty(self) -> None:
         """Should list topics filtered by difficulty."""
-        from calculus_rag.prerequisites.topics import get_topics_by_difficulty
-
         easy_topics = get_topics_by_difficulty(difficulty=1)
         hard_topics = get_topics_by_difficulty(difficulty=5)
 
@@ -74,8 +65,6 @@ class TestTopicCatalog:
 
     def test_search_topics(self) -> None:
         """Should search topics by keyword."""
-        from calculus_rag.prerequisites.topics import search_topics
-
         results = search_topics("derivative")
 
         assert len(results) > 0
@@ -0,0 +1,40 @@
+"""
+Shared fixtures for retrieval tests.
+"""
+
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from calculus_rag.retrieval.retriever import Retriever
+from calculus_rag.vectorstore.base import QueryResult
+
+
+@pytest.fixture
+def retriever_factory() -> Callable[..., Retriever]:
+    """
+    Build Retrievers around a mock embedder and a mock async vector store.
+
+    The factory takes ``embed_return`` (what embed() returns, 768 x 0.1 by
+    default), ``query_return`` (what the store's query() returns, empty by
+    default) and any further Retriever keyword arguments. Each call gets
+    fresh mocks, reachable as ``retriever.embedder`` and
+    ``retriever.vector_store``.
+    """
+
+    def factory(
+        embed_return: list[float] | None = None,
+        query_return: list[QueryResult] | None = None,
+        **kwargs: Any,
+    ) -> Retriever:
+        embedder = MagicMock()
+        embedder.embed.return_value = [0.1] * 768 if embed_return is None else embed_return
+
+        vector_store = AsyncMock()
+        vector_store.query.return_value = [] if query_return is None else query_return
+
+        return Retriever(embedder=embedder, vector_store=vector_store, **kwargs)
+
+    return factory
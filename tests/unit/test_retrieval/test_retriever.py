@@ -4,18 +4,25 @@ Tests for the Retriever class.
 TDD: These tests define the expected behavior for semantic retrieval.
 """
 
+import asyncio
+import time
+from collections.abc import Callable
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from calculus_rag.retrieval.retriever import Retriever
+from calculus_rag.retrieval.semantic_cache import SemanticCache
+from calculus_rag.vectorstore.base import QueryResult
+
+RetrieverFactory = Callable[..., Retriever]
+
 
 class TestRetrieverInitialization:
     """Test Retriever initialization."""
 
     def test_create_retriever(self) -> None:
         """Should create a Retriever instance."""
-        from calculus_rag.retrieval.retriever import Retriever
-
         mock_embedder = MagicMock()
         mock_vector_store = MagicMock()
 
@@ -26,37 +33,57 @@ class TestRetrieverInitialization:
         assert retriever.vector_store == mock_vector_store
 
 
+class TestRetrieverEmbedQuery:
+    """Test embedding queries for callers that search the store themselves."""
+
+    def test_embed_query_strips_and_shares_cache(self, retriever_factory: RetrieverFactory) -> None:
+        """Should embed the stripped query through the same cache as retrieve()."""
+        retriever = retriever_factory()
+
+        first = retriever.embed_query("  Test query ")
+        second = retriever.embed_query("Test query")
+
+        assert first == second
+        retriever.embedder.embed.assert_called_once_with("Test query")
+        with pytest.raises(ValueError, match="Query cannot be empty"):
+            retriever.embed_query(" \n")
+
+    def test_embed_query_returns_a_copy(self, retriever_factory: RetrieverFactory) -> None:
+        """Should not let a caller corrupt the cache by mutating a returned embedding."""
+        retriever = retriever_factory(embed_return=[0.1, 0.2, 0.3])
+
+        first = retriever.embed_query("Test query")
+        first[0] = 99.0
+        second = retriever.embed_query("Test query")
+        second.append(1.0)
+        third = retriever.embed_query("Test query")
+
+        assert third == [0.1, 0.2, 0.3]
+        retriever.embedder.embed.assert_called_once()
+
+
 @pytest.mark.asyncio
 class TestRetrieverRetrieve:
     """Test basic retrieval functionality."""
 
-    async def test_retrieve_basic(self) -> None:
+    async def test_retrieve_basic(self, retriever_factory: RetrieverFactory) -> None:
         """Should retrieve relevant chunks for a query."""
-        from calculus_rag.retrieval.retriever import Retriever
-        from calculus_rag.vectorstore.base import QueryResult
-
-        # Mock embedder
-        mock_embedder = MagicMock()
-        mock_embedder.embed.return_value = [0.1] * 768
-
-        # Mock vector store
-        mock_vector_store = AsyncMock()
-        mock_vector_store.query.return_value = [
-            QueryResult(
-                id="chunk_1",
-                content="A limit describes the value a function approaches.",
-                metadata={"topic": "limits.introduction", "difficulty": 3},
-                score=0.95,
-            ),
-            QueryResult(
-                id="chunk_2",
-                content="The derivative measures the rate of change.",
-                metadata={"topic": "derivatives.definition", "difficulty": 3},
-                score=0.82,
-            ),
-        ]
-
-        retriever = Retriever(embedder=mock_embedder, vector_store=mock_vector_store)
+        retriever = retriever_factory(
+            query_return=[
+                QueryResult(
+                    id="chunk_1",
+                    content="A limit describes the value a function approaches.",
+                    metadata={"topic": "limits.introduction", "difficulty": 3},
+                    score=0.95,
+                ),
+                QueryResult(
+                    id="chunk_2",
+                    content="The derivative measures the rate of change.",
+                    metadata={"topic": "derivatives.definition", "difficulty": 3},
+                    score=0.82,
+                ),
+            ]
+        )
         results = await retriever.retrieve("What is a limit?", n_results=2)
 
         assert len(results) == 2
@@ -65,98 +92,267 @@ class TestRetrieverRetrieve:
         assert results[0].metadata["topic"] == "limits.introduction"
         assert "limit" in results[0].content
 
-    async def test_retrieve_embeds_query(self) -> None:
+    async def test_retrieve_embeds_query(self, retriever_factory: RetrieverFactory) -> None:
         """Should embed the query before searching."""
-        from calculus_rag.retrieval.retriever import Retriever
-
-        mock_embedder = MagicMock()
-        mock_embedder.embed.return_value = [0.5] * 768
-
-        mock_vector_store = AsyncMock()
-        mock_vector_store.query.return_value = []
-
-        retriever = Retriever(embedder=mock_embedder, vector_store=mock_vector_store)
+        retriever = retriever_factory(embed_return=[0.5] * 768)
+        await retriever.retrieve("Test query", n_results=5)
         await retriever.retrieve("Test query", n_results=5)
 
-        # Verify embedder was called
-        mock_embedder.embed.assert_called_once_with("Test query")
-
-    async def test_retrieve_passes_embedding_to_store(self) -> None:
+        # Verify embedder was called once; the repeat reuses the cached embedding
+        retriever.embedder.embed.assert_called_once_with("Test query")
+
+    async def test_retrieve_embed_cache_evicts_least_recent(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should re-embed queries evicted from the cache, and always when it is disabled."""
+        retriever = retriever_factory(embed_cache_size=1)
+        for query in ["first", "second", "first"]:
+            await retriever.retrieve(query)
+        assert retriever.embedder.embed.call_count == 3
+
+        retriever = retriever_factory(embed_cache_size=0)
+        for _ in range(2):
+            await retriever.retrieve("Test query")
+        assert retriever.embedder.embed.call_count == 2
+
+    async def test_retrieve_passes_embedding_to_store(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
         """Should pass the query embedding to the vector store."""
-        from calculus_rag.retrieval.retriever import Retriever
-
         query_embedding = [0.3] * 768
-        mock_embedder = MagicMock()
-        mock_embedder.embed.return_value = query_embedding
-
-        mock_vector_store = AsyncMock()
-        mock_vector_store.query.return_value = []
-
-        retriever = Retriever(embedder=mock_embedder, vector_store=mock_vector_store)
+        retriever = retriever_factory(embed_return=query_embedding)
         await retriever.retrieve("Test", n_results=10)
 
         # Verify vector store was called with correct embedding
-        mock_vector_store.query.assert_called_once()
-        call_args = mock_vector_store.query.call_args
+        retriever.vector_store.query.assert_called_once()
+        call_args = retriever.vector_store.query.call_args
         assert call_args.kwargs["query_embedding"] == query_embedding
-        assert call_args.kwargs["n_results"] == 10
+        # retrieve() over-fetches so the min_score cutoff still leaves n_results
+        assert call_args.kwargs["n_results"] == 2 * 10
 
-    async def test_retrieve_empty_query_raises_error(self) -> None:
+    async def test_retrieve_empty_query_raises_error(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
         """Should raise error for empty query."""
-        from calculus_rag.retrieval.retriever import Retriever
-
-        mock_embedder = MagicMock()
-        mock_vector_store = AsyncMock()
-
-        retriever = Retriever(embedder=mock_embedder, vector_store=mock_vector_store)
+        retriever = retriever_factory()
 
         with pytest.raises(ValueError, match="Query cannot be empty"):
             await retriever.retrieve("", n_results=5)
 
-    async def test_retrieve_with_filters(self) -> None:
-        """Should pass filters to vector store."""
-        from calculus_rag.retrieval.retriever import Retriever
-
-        mock_embedder = MagicMock()
-        mock_embedder.embed.return_value = [0.1] * 768
-
-        mock_vector_store = AsyncMock()
-        mock_vector_store.query.return_value = []
+    @pytest.mark.parametrize("query", ["   ", "\n", "\t \n"])
+    async def test_retrieve_whitespace_query_raises_error(
+        self, retriever_factory: RetrieverFactory, query: str
+    ) -> None:
+        """Should reject whitespace-only queries without embedding them."""
+        retriever = retriever_factory()
 
-        retriever = Retriever(embedder=mock_embedder, vector_store=mock_vector_store)
+        with pytest.raises(ValueError, match="Query cannot be empty"):
+            await retriever.retrieve(query)
+
+        retriever.embedder.embed.assert_not_called()
+
+    async def test_retrieve_strips_before_embedding(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should embed the stripped query, so padded repeats share one cache entry."""
+        retriever = retriever_factory()
+        await retriever.retrieve("  Test query  ")
+        await retriever.retrieve("Test query\n")
+
+        retriever.embedder.embed.assert_called_once_with("Test query")
+
+    async def test_retrieve_zero_n_results_skips_embedding(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should return nothing without embedding or searching when no results are wanted."""
+        retriever = retriever_factory()
+
+        assert await retriever.retrieve("Test", n_results=0) == []
+        assert await retriever.retrieve_by_topic("Test", topic="limits", n_results=0) == []
+        assert await retriever.retrieve_batch(["a", "b"], n_results=0) == [[], []]
+        retriever.embedder.embed.assert_not_called()
+        retriever.embedder.embed_batch.assert_not_called()
+        retriever.vector_store.query.assert_not_called()
+
+    async def test_retrieve_with_filters(self, retriever_factory: RetrieverFactory) -> None:
+        """Should pass filters to vector store."""
+        retriever = retriever_factory()
         await retriever.retrieve(
             "Test",
             n_results=5,
             filters={"topic": "limits.introduction"},
         )
 
-        call_args = mock_vector_store.query.call_args
+        call_args = retriever.vector_store.query.call_args
         assert call_args.kwargs["where"] == {"topic": "limits.introduction"}
 
 
 @pytest.mark.asyncio
-class TestRetrieverTopicFiltering:
-    """Test topic-based retrieval."""
+class TestRetrieverBatch:
+    """Test retrieving for several queries at once."""
 
-    async def test_retrieve_by_topic(self) -> None:
-        """Should filter results by topic."""
-        from calculus_rag.retrieval.retriever import Retriever
-        from calculus_rag.vectorstore.base import QueryResult
+    async def test_retrieve_batch_fires_concurrently(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should run the vector store searches concurrently, not one after another."""
 
-        mock_embedder = MagicMock()
-        mock_embedder.embed.return_value = [0.1] * 768
-
-        mock_vector_store = AsyncMock()
-        mock_vector_store.query.return_value = [
-            QueryResult(
-                id="chunk_1",
-                content="Limits content",
-                metadata={"topic": "limits.introduction"},
-                score=0.9,
-            ),
+        async def slow_query(**kwargs):
+            await asyncio.sleep(0.1)
+            return []
+
+        retriever = retriever_factory()
+        retriever.embedder.embed_batch.side_effect = lambda texts: [[0.1] * 768 for _ in texts]
+        retriever.vector_store.query.side_effect = slow_query
+
+        start = time.perf_counter()
+        results = await retriever.retrieve_batch([f"Query {i}" for i in range(10)])
+        elapsed = time.perf_counter() - start
+
+        assert results == [[]] * 10
+        assert retriever.vector_store.query.await_count == 10
+        assert elapsed < 0.5
+
+    async def test_retrieve_batch_embeds_uncached_queries_once(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should embed new, distinct queries in one batch and keep results in query order."""
+
+        async def query(query_embedding, **kwargs):
+            return [QueryResult(id=str(query_embedding[0]), content="c", metadata={}, score=0.9)]
+
+        retriever = retriever_factory(embed_return=[0.0, 0.0])
+        retriever.embedder.embed_batch.side_effect = lambda texts: [
+            [float(len(text)), 0.0] for text in texts
         ]
+        retriever.vector_store.query.side_effect = query
 
-        retriever = Retriever(embedder=mock_embedder, vector_store=mock_vector_store)
+        await retriever.retrieve("cached")
+        results = await retriever.retrieve_batch(["ab", "cached", "abc", "ab"])
+
+        retriever.embedder.embed_batch.assert_called_once_with(["ab", "abc"])
+        assert [r[0].chunk_id for r in results] == ["2.0", "0.0", "3.0", "2.0"]
+
+    async def test_retrieve_batch_rejects_empty_query(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should raise error if any query is empty."""
+        retriever = retriever_factory()
+
+        with pytest.raises(ValueError, match="Query cannot be empty"):
+            await retriever.retrieve_batch(["What is a limit?", " "])
+
+
+@pytest.mark.asyncio
+class TestRetrieverSemanticCache:
+    """Test reusing vector store results for near-identical queries."""
+
+    @staticmethod
+    def _make_retriever(
+        retriever_factory: RetrieverFactory, embeddings: dict[str, list[float]]
+    ) -> tuple[Retriever, AsyncMock]:
+        retriever = retriever_factory(
+            query_return=[QueryResult(id="chunk_1", content="Derivatives", metadata={}, score=0.9)],
+            semantic_cache=SemanticCache(max_size=4, threshold=0.95),
+        )
+        retriever.embedder.embed.side_effect = embeddings.__getitem__
+        return retriever, retriever.vector_store
+
+    async def test_semantic_cache_hit_returns_cached(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should answer a near-identical query without querying the store."""
+        retriever, mock_vector_store = self._make_retriever(
+            retriever_factory,
+            {
+                "What is a derivative?": [1.0, 0.0, 0.0],
+                "what is a derivative": [0.99, 0.05, 0.0],
+            },
+        )
+
+        first = await retriever.retrieve("What is a derivative?")
+        second = await retriever.retrieve("what is a derivative")
+
+        mock_vector_store.query.assert_called_once()
+        assert second == first
+
+    async def test_semantic_cache_miss_calls_store(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should query the store for dissimilar queries or different filters."""
+        retriever, mock_vector_store = self._make_retriever(
+            retriever_factory,
+            {
+                "What is a derivative?": [1.0, 0.0, 0.0],
+                "What is an integral?": [0.0, 1.0, 0.0],
+            },
+        )
+
+        await retriever.retrieve("What is a derivative?")
+        await retriever.retrieve("What is an integral?")
+        await retriever.retrieve("What is a derivative?", filters={"topic": "limits"})
+
+        assert mock_vector_store.query.call_count == 3
+
+    async def test_semantic_cache_expires_entries(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should not reuse entries older than the TTL."""
+        retriever, mock_vector_store = self._make_retriever(
+            retriever_factory, {"Test": [1.0, 0.0, 0.0]}
+        )
+        retriever.semantic_cache.ttl = 0.0
+
+        await retriever.retrieve("Test")
+        await retriever.retrieve("Test")
+
+        assert mock_vector_store.query.call_count == 2
+
+    async def test_semantic_cache_results_are_not_shared(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should not let callers change cached results by mutating their metadata."""
+        retriever, mock_vector_store = self._make_retriever(
+            retriever_factory, {"Test": [1.0, 0.0, 0.0]}
+        )
+
+        first = await retriever.retrieve("Test")
+        first[0].metadata["topic"] = "changed"
+        mock_vector_store.query.return_value[0].metadata["tags"] = ["store"]
+        second = await retriever.retrieve("Test")
+
+        mock_vector_store.query.assert_called_once()
+        assert second[0].metadata == {}
+
+    async def test_semantic_cache_accepts_set_filters(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should cache queries whose $in filter is a set, whatever its iteration order."""
+        retriever, mock_vector_store = self._make_retriever(
+            retriever_factory, {"Test": [1.0, 0.0, 0.0]}
+        )
+
+        await retriever.retrieve("Test", filters={"topic": {"$in": {"limits", "series"}}})
+        await retriever.retrieve("Test", filters={"topic": {"$in": {"series", "limits"}}})
+
+        mock_vector_store.query.assert_called_once()
+
+
+@pytest.mark.asyncio
+class TestRetrieverTopicFiltering:
+    """Test topic-based retrieval."""
+
+    async def test_retrieve_by_topic(self, retriever_factory: RetrieverFactory) -> None:
+        """Should filter results by topic."""
+        retriever = retriever_factory(
+            query_return=[
+                QueryResult(
+                    id="chunk_1",
+                    content="Limits content",
+                    metadata={"topic": "limits.introduction"},
+                    score=0.9,
+                ),
+            ]
+        )
         results = await retriever.retrieve_by_topic(
             "Test",
             topic="limits.introduction",
@@ -164,7 +360,7 @@ class TestRetrieverTopicFiltering:
         )
 
         # Verify filter was passed to vector store
-        call_args = mock_vector_store.query.call_args
+        call_args = retriever.vector_store.query.call_args
         assert call_args.kwargs["where"] == {"topic": "limits.introduction"}
         assert len(results) == 1
 
@@ -173,68 +369,53 @@ class TestRetrieverTopicFiltering:
 class TestRetrieverDifficultyFiltering:
     """Test difficulty-based retrieval."""
 
-    async def test_retrieve_by_difficulty(self) -> None:
+    async def test_retrieve_by_difficulty(self, retriever_factory: RetrieverFactory) -> None:
         """Should filter results by max difficulty."""
-        from calculus_rag.retrieval.retriever import Retriever
-        from calculus_rag.vectorstore.base import QueryResult
-
-        mock_embedder = MagicMock()
-        mock_embedder.embed.return_value = [0.1] * 768
-
-        mock_vector_store = AsyncMock()
-        mock_vector_store.query.return_value = [
-            QueryResult(
-                id="chunk_1",
-                content="Easy content",
-                metadata={"difficulty": 1},
-                score=0.9,
-            ),
-            QueryResult(
-                id="chunk_2",
-                content="Medium content",
-                metadata={"difficulty": 3},
-                score=0.85,
-            ),
-            QueryResult(
-                id="chunk_3",
-                content="Hard content",
-                metadata={"difficulty": 5},
-                score=0.8,
-            ),
-        ]
-
-        retriever = Retriever(embedder=mock_embedder, vector_store=mock_vector_store)
+        # The store applies the filter, so it only returns matching chunks
+        retriever = retriever_factory(
+            query_return=[
+                QueryResult(
+                    id="chunk_1",
+                    content="Easy content",
+                    metadata={"difficulty": 1},
+                    score=0.9,
+                ),
+                QueryResult(
+                    id="chunk_2",
+                    content="Medium content",
+                    metadata={"difficulty": 3},
+                    score=0.85,
+                ),
+            ]
+        )
         results = await retriever.retrieve_by_difficulty(
             "Test",
             max_difficulty=3,
             n_results=5,
         )
 
-        # Should only return chunks with difficulty <= 3
+        # The difficulty filter is pushed down to the vector store
+        call_args = retriever.vector_store.query.call_args
+        assert call_args.kwargs["where"] == {"difficulty": {"$lte": 3}}
+        assert call_args.kwargs["n_results"] == 10  # retrieve()'s min_score headroom only
         assert len(results) == 2
-        assert all(r.metadata.get("difficulty", 5) <= 3 for r in results)
 
-    async def test_retrieve_by_difficulty_respects_n_results(self) -> None:
+    async def test_retrieve_by_difficulty_respects_n_results(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
         """Should return at most n_results after filtering."""
-        from calculus_rag.retrieval.retriever import Retriever
-        from calculus_rag.vectorstore.base import QueryResult
-
-        mock_embedder = MagicMock()
-        mock_embedder.embed.return_value = [0.1] * 768
-
-        mock_vector_store = AsyncMock()
         # Return 5 results all with difficulty 2
-        mock_vector_store.query.return_value = [
-            QueryResult(
-                id=f"chunk_{i}",
-                content=f"Content {i}",
-                metadata={"difficulty": 2},
-                score=0.9 - i * 0.1,
-            )
-            for i in range(5)
-        ]
-
-        retriever = Retriever(embedder=mock_embedder, vector_store=mock_vector_store)
+        retriever = retriever_factory(
+            query_return=[
+                QueryResult(
+                    id=f"chunk_{i}",
+                    content=f"Content {i}",
+                    metadata={"difficulty": 2},
+                    score=0.9 - i * 0.1,
+                )
+                for i in range(5)
+            ]
+        )
         results = await retriever.retrieve_by_difficulty(
             "Test",
             max_difficulty=3,
@@ -243,3 +424,21 @@ class TestRetrieverDifficultyFiltering:
 
         # Should return only 2 results
         assert len(results) == 2
+
+    async def test_retrieve_by_difficulty_keeps_chunks_without_difficulty_at_top_level(
+        self, retriever_factory: RetrieverFactory
+    ) -> None:
+        """Should count a missing or non-integer difficulty as 5."""
+        retriever = retriever_factory(
+            query_return=[
+                QueryResult(id="no_difficulty", content="A", metadata={}, score=0.9),
+                QueryResult(id="fractional", content="B", metadata={"difficulty": 2.5}, score=0.8),
+                QueryResult(id="too_hard", content="C", metadata={"difficulty": 6}, score=0.7),
+                QueryResult(id="easy", content="D", metadata={"difficulty": 1}, score=0.6),
+            ]
+        )
+        results = await retriever.retrieve_by_difficulty("Test", max_difficulty=5, n_results=5)
+
+        # No store filter: SQL comparisons would drop the chunks without a difficulty
+        assert retriever.vector_store.query.call_args.kwargs["where"] is None
+        assert [r.chunk_id for r in results] == ["no_difficulty", "fractional", "easy"]
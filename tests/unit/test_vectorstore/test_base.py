@@ -80,6 +80,18 @@ class TestQueryResult:
         result = QueryResult(id="1", content="test", metadata={}, score=0.5)
         assert 0 <= result.score <= 1
 
+    def test_query_result_is_immutable(self) -> None:
+        """QueryResult should be frozen and slotted (no per-instance __dict__)."""
+        from dataclasses import FrozenInstanceError
+
+        from calculus_rag.vectorstore.base import QueryResult
+
+        result = QueryResult(id="1", content="test", metadata={}, score=0.5)
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            result.score = 0.9  # type: ignore[misc]
+
 
 class TestConcreteVectorStoreImplementation:
     """Test that concrete implementations work correctly."""